@@ -9,6 +9,7 @@ import pandas as pd
 import re
 import sys
 import json
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
@@ -17,6 +18,50 @@ sys.path.append(str(Path(__file__).parent.parent.parent.parent))
 
 from src.pipeline.core.district_mapping import get_district_for_town
 from src.pipeline.core.unit_identifier import UnitIdentifierNormalizer
+from src.pipeline.core.town_matcher import get_town_matcher
+from src.pipeline.core.workbook_reader import read_workbook
+
+# Org strings parsed per process; Key Three has ~3 members (rows) per unit and ~170 units
+UNIT_INFO_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=UNIT_INFO_CACHE_SIZE)
+def _parse_unitcommorgname(orgname: str) -> dict:
+    return KeyThreeParser("").parse_unit_info(orgname)
+
+
+def parse_unitcommorgname(unitcommorgname) -> dict:
+    """
+    Unit type, 4-digit number, town and chartered org from a unitcommorgname
+    Memoized per org string (stateless parse); returns a copy callers may modify, {} if unparseable
+    """
+    if not unitcommorgname or (not isinstance(unitcommorgname, str) and pd.isna(unitcommorgname)):
+        return {}
+    return dict(_parse_unitcommorgname(str(unitcommorgname)))
+
+
+def get_unitcommorgname_parse_stats() -> dict:
+    """Parse calls, unique org strings and their ratio since the last reset"""
+    info = _parse_unitcommorgname.cache_info()
+    calls = info.hits + info.misses
+    return {
+        'calls': calls,
+        'unique_orgs': info.misses,
+        'unique_ratio': info.misses / calls if calls else 0.0,
+        'cache_hits': info.hits,
+    }
+
+
+def reset_unitcommorgname_parse_stats():
+    """Start a new run's stats (clears the cache)"""
+    _parse_unitcommorgname.cache_clear()
+
+
+def format_unitcommorgname_parse_stats(stats: dict = None) -> str:
+    stats = stats or get_unitcommorgname_parse_stats()
+    return (f"{stats['unique_orgs']} unique orgs in {stats['calls']} parses "
+            f"({stats['unique_ratio']:.1%} unique, {stats['cache_hits']} cache hits)")
+
 
 class KeyThreeParser:
     """
@@ -33,7 +78,7 @@ class KeyThreeParser:
         """Load Key Three Excel data with proper structure"""
         try:
             # Load with header row at index 3 (after report headers)
-            df = pd.read_excel(self.excel_file_path, header=None, skiprows=3)
+            df = read_workbook(self.excel_file_path, header=None, skiprows=3)
             
             # Set proper column names based on Key Three structure
             df.columns = [
@@ -103,18 +148,19 @@ class KeyThreeParser:
             if self._is_valid_town(potential_town):
                 return UnitIdentifierNormalizer._normalize_town_name(potential_town)
         
+        # Whole words (whitespace-delimited) that are HNE town names, in order, from one matcher pass
+        matcher = get_town_matcher()
+        word_towns = [clean_orgname[m.start:m.end] for m in matcher.find_all(clean_orgname, boundary='token')
+                      if ' ' not in m.name]
+        
         # Pattern 4: "Acton-Group Of Citizens, Inc"
         # Town matches chartered org name
-        for word in words:
-            if self._is_valid_town(word):
-                return UnitIdentifierNormalizer._normalize_town_name(word)
+        if word_towns:
+            return UnitIdentifierNormalizer._normalize_town_name(word_towns[0])
         
         # Pattern 5: "Acton-Boxborough Rotary Club"
         # Multiple towns in org name - need fallback logic
-        town_candidates = []
-        for word in words:
-            if self._is_valid_town(word):
-                town_candidates.append(UnitIdentifierNormalizer._normalize_town_name(word))
+        town_candidates = [UnitIdentifierNormalizer._normalize_town_name(word) for word in word_towns]
         
         if len(town_candidates) == 1:
             return town_candidates[0]
@@ -143,9 +189,8 @@ class KeyThreeParser:
         
         # Pattern 8: "Veterans Of Foreign Wars Westminster Post"
         # Town embedded near end
-        for i, word in enumerate(words):
-            if self._is_valid_town(word):
-                return UnitIdentifierNormalizer._normalize_town_name(word)
+        if word_towns:
+            return UnitIdentifierNormalizer._normalize_town_name(word_towns[0])
         
         # Pattern 9: Village name handling
         # Villages are now treated as separate towns for unit correlation
@@ -168,8 +213,12 @@ class KeyThreeParser:
     def extract_unit_info_from_unitcommorgname(self, unitcommorgname: str) -> dict:
         """
         Extract unit type, number, and town from unitcommorgname
-        Returns structured unit information
+        Returns structured unit information (memoized, see parse_unitcommorgname)
         """
+        return parse_unitcommorgname(unitcommorgname)
+    
+    def parse_unit_info(self, unitcommorgname: str) -> dict:
+        """Uncached unitcommorgname parse behind parse_unitcommorgname"""
         if not unitcommorgname or pd.isna(unitcommorgname):
             return {}
         
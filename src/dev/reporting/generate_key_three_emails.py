@@ -25,6 +25,8 @@ from typing import List, Dict, Any
 import pandas as pd
 from datetime import datetime
 
+from src.pipeline.core.workbook_reader import read_workbook
+
 
 class KeyThreeEmailGenerator:
     def __init__(self, key_three_file: str = "data/input/Key 3 08-22-2025.xlsx"):
@@ -36,7 +38,7 @@ class KeyThreeEmailGenerator:
         """Load Key Three member data from Excel file"""
         try:
             # Read Excel file with proper headers (row 8 contains headers)
-            df = pd.read_excel(file_path, header=8)
+            df = read_workbook(file_path, header=8)
             print(f"Loaded {len(df)} Key Three member records")
             return df
         except Exception as e:
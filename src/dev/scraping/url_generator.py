@@ -31,9 +31,23 @@ class DualSourceURLGenerator:
     BEASCOUT_RADIUS = 10  # miles
     JOINEXPLORING_RADIUS = 20  # miles
     
-    def __init__(self):
-        self.beascout_base = "https://beascout.scouting.org/list/"
-        self.joinexploring_base = "https://joinexploring.org/list/"
+    BEASCOUT_BASE = "https://beascout.scouting.org/list/"
+    JOINEXPLORING_BASE = "https://joinexploring.org/list/"
+
+    def __init__(self, beascout_base: str = None, joinexploring_base: str = None):
+        """
+        Args:
+            beascout_base: Override BeAScout list URL (e.g. a local stub server)
+            joinexploring_base: Override JoinExploring list URL
+        """
+        self.beascout_base = beascout_base or self.BEASCOUT_BASE
+        self.joinexploring_base = joinexploring_base or self.JOINEXPLORING_BASE
+
+    @classmethod
+    def for_base_url(cls, base_url: str) -> 'DualSourceURLGenerator':
+        """Point both sources at one server: <base_url>/beascout/list/ and <base_url>/joinexploring/list/"""
+        base_url = base_url.rstrip('/')
+        return cls(f"{base_url}/beascout/list/", f"{base_url}/joinexploring/list/")
     
     def generate_beascout_url(self, zip_code: str, programs: List[str] = None, 
                              radius: int = None) -> str:
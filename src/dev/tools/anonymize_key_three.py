@@ -14,6 +14,11 @@ from typing import Dict, List, Any
 import pandas as pd
 from datetime import datetime
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from src.pipeline.core.workbook_reader import read_workbook
+
 # Import from same directory
 from name_generators import generate_contact_batch
 
@@ -33,7 +38,7 @@ def load_key_three_data(file_path: str) -> Dict[str, Any]:
     
     elif file_path.suffix.lower() in ['.xlsx', '.xls']:
         # Convert Excel to JSON structure (header in row 8)
-        df = pd.read_excel(file_path, header=8)
+        df = read_workbook(file_path, header=8)
         
         # Create structure matching the JSON format
         key_three_data = {
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+HTML Extraction Micro-Benchmark
+Times the per-unit text parsing helpers in html_extractor (meeting info, location
+components, town-from-org, meeting time), per-unit vs batch quality scoring and
+full card extraction over the reference scraped pages. Run before and after a change to compare per-unit cost.
+
+Usage:
+    python src/dev/tools/benchmark_html_extraction.py [--repeat N] [--files N]
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.pipeline.processing.html_extractor import (
+    extract_location_components,
+    extract_meeting_info,
+    extract_town_from_org,
+    format_meeting_time,
+    iter_units_from_html,
+    score_units,
+)
+from src.pipeline.core.quality_scorer import get_quality_scorer
+
+SCRAPED_DIR = project_root / "tests" / "reference" / "units" / "scraped"
+
+
+def load_pages(max_files: int = None):
+    """Read reference scraped pages"""
+    html_files = sorted(SCRAPED_DIR.glob("*.html"))
+    if max_files:
+        html_files = html_files[:max_files]
+    return [f.read_text() for f in html_files]
+
+
+def collect_unit_inputs(pages):
+    """Extract units once to gather the raw text inputs the helpers see per unit"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        units = [unit for content in pages for unit in iter_units_from_html(content, "Benchmark")]
+
+    return {
+        'descriptions': [u['description'] for u in units],
+        'addresses': [u['unit_address'] for u in units],
+        'orgs': [u['chartered_organization'] for u in units],
+        'times': [u['meeting_time'] for u in units if u['meeting_time']] or ['7pm'],
+        'units': units,
+        'unit_count': len(units),
+    }
+
+
+def time_per_call(func, inputs, repeat):
+    """Best-of-repeat time per call in microseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for value in inputs:
+            func(value)
+        best = min(best, time.perf_counter() - start)
+    return best / len(inputs) * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark html_extractor per-unit parsing")
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions (best is reported)')
+    parser.add_argument('--files', type=int, default=None, help='Limit number of reference HTML files')
+    args = parser.parse_args()
+
+    pages = load_pages(args.files)
+    inputs = collect_unit_inputs(pages)
+    print(f"📊 {len(pages)} pages, {inputs['unit_count']} units")
+
+    results = [
+        ("extract_meeting_info", time_per_call(extract_meeting_info, inputs['descriptions'], args.repeat)),
+        ("extract_location_components (address)",
+         time_per_call(lambda t: extract_location_components(t, 'address'), inputs['addresses'], args.repeat)),
+        ("extract_location_components (org_name)",
+         time_per_call(lambda t: extract_location_components(t, 'org_name'), inputs['orgs'], args.repeat)),
+        ("extract_town_from_org", time_per_call(extract_town_from_org, inputs['orgs'], args.repeat)),
+        ("format_meeting_time", time_per_call(format_meeting_time, inputs['times'], args.repeat)),
+        ("score_unit (per unit)", time_per_call(get_quality_scorer().score_unit, inputs['units'], args.repeat)),
+        ("score_units (one batch, per unit)",
+         time_per_call(get_quality_scorer().score_units, [inputs['units']], args.repeat) / inputs['unit_count']),
+    ]
+
+    # Full card extraction (fragment parse + all field helpers + quality scoring)
+    best = float('inf')
+    for _ in range(max(1, args.repeat // 2)):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for content in pages:
+                score_units(list(iter_units_from_html(content, "Benchmark")))
+        best = min(best, time.perf_counter() - start)
+    results.append(("full unit extraction", best / inputs['unit_count'] * 1_000_000))
+
+    print(f"{'Function':42} {'µs/unit':>10}")
+    for name, micros in results:
+        print(f"{name:42} {micros:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
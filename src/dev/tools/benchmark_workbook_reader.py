@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Workbook Reader Benchmark
+Times read_workbook / read_workbook_values on the anonymized Key Three spreadsheet
+and the reference quality report with each available engine (calamine when
+python-calamine is installed, openpyxl always), plus the full openpyxl workbook
+load the weekly analytics used before.
+
+Usage:
+    python src/dev/tools/benchmark_workbook_reader.py [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from openpyxl import load_workbook
+
+from src.pipeline.core.key_three_loader import KEY_THREE_HEADER_ROW
+from src.pipeline.core.workbook_reader import (
+    CALAMINE_AVAILABLE, ENGINE_CALAMINE, ENGINE_OPENPYXL, read_workbook, read_workbook_values,
+)
+
+KEY_THREE_FILE = project_root / "tests" / "reference" / "key_three" / "anonymized_key_three.xlsx"
+REPORT_FILE = project_root / "tests" / "reference" / "reports" / "BeAScout_Quality_Report_anonymized.xlsx"
+
+
+def time_best(func, repeat):
+    """Best-of-repeat wall time in milliseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark xlsx reading engines")
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions (best is reported)')
+    args = parser.parse_args()
+
+    engines = [ENGINE_CALAMINE, ENGINE_OPENPYXL] if CALAMINE_AVAILABLE else [ENGINE_OPENPYXL]
+    if not CALAMINE_AVAILABLE:
+        print("⚠️  python-calamine not installed - timing openpyxl only (pip install python-calamine)")
+
+    results = [("load_workbook (report, previous analytics)",
+                time_best(lambda: load_workbook(REPORT_FILE, data_only=True), args.repeat))]
+    for engine in engines:
+        results.extend([
+            (f"read_workbook (Key Three) [{engine}]",
+             time_best(lambda: read_workbook(KEY_THREE_FILE, header=KEY_THREE_HEADER_ROW, engine=engine), args.repeat)),
+            (f"read_workbook (report, all sheets) [{engine}]",
+             time_best(lambda: read_workbook(REPORT_FILE, sheet_name=None, engine=engine), args.repeat)),
+            (f"read_workbook_values (report) [{engine}]",
+             time_best(lambda: read_workbook_values(REPORT_FILE, engine=engine), args.repeat)),
+        ])
+
+    print(f"{'Read':52} {'ms':>10}")
+    for name, millis in results:
+        print(f"{name:52} {millis:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """
 Convert HNE Key Three Excel spreadsheet to JSON format for faster processing
+Unchanged input (same sha256 as the existing JSON's source) is a no-op; members come
+from the Key Three snapshot store when the spreadsheet was parsed before
 
 Usage:
     python scripts/convert_key_three_to_json.py "data/input/Key 3 08-22-2025.xlsx"  # Use real data for production
@@ -12,6 +14,20 @@ import json
 import sys
 from pathlib import Path
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from src.pipeline.analysis.key_three_snapshot import hash_file, load_key_three_snapshot
+
+
+def get_converted_source_hash(output_file: str) -> str:
+    """sha256 of the Excel file an existing JSON conversion was made from ('' if unknown)"""
+    try:
+        with open(output_file, 'r') as f:
+            return json.load(f).get('metadata', {}).get('source_sha256', '')
+    except (OSError, json.JSONDecodeError):
+        return ''
+
 
 def convert_key_three_to_json(excel_file: str, output_file: str = None) -> str:
     """Convert Key Three Excel file to JSON format"""
@@ -20,39 +36,20 @@ def convert_key_three_to_json(excel_file: str, output_file: str = None) -> str:
         output_file = str(Path(excel_file).with_suffix('.json'))
     
     try:
-        # Read Excel file (header in row 8)
-        df = pd.read_excel(excel_file, header=8)
-        print(f"Loaded {len(df)} Key Three member records from Excel")
-        
-        # Convert to list of dictionaries
-        key_three_data = []
+        source_sha256 = hash_file(excel_file)
+        if get_converted_source_hash(output_file) == source_sha256:
+            print(f"Key Three unchanged since last conversion, keeping: {output_file}")
+            return output_file
         
-        for _, row in df.iterrows():
-            member_data = {
-                'district': str(row.get('districtname', '')).strip(),
-                'unit_display': str(row.get('displayname', '')).strip(),
-                'member_name': str(row.get('fullname', '')).strip(),
-                'address': str(row.get('address', '')).strip(),
-                'citystate': str(row.get('citystate', '')).strip(),
-                'zip': str(row.get('zip', '')).strip(),
-                'email': str(row.get('email', '')).strip(),
-                'phone': str(row.get('phone', '')).strip(),
-                'position': str(row.get('position', '')).strip(),
-                'unit_org_name': str(row.get('unitcommorgname', '')).strip(),
-                'ypt_status': str(row.get('yptstatus', '')).strip()
-            }
-            
-            # Clean up missing data
-            for key, value in member_data.items():
-                if value in ['nan', 'None', '', 'NaT']:
-                    member_data[key] = ''
-            
-            key_three_data.append(member_data)
+        # Read Excel file (header in row 8) into cleaned member records
+        key_three_data = load_key_three_snapshot(excel_file)['members']
+        print(f"Loaded {len(key_three_data)} Key Three member records from Excel")
         
         # Save to JSON
         output_data = {
             'metadata': {
                 'source_file': excel_file,
+                'source_sha256': source_sha256,
                 'conversion_date': pd.Timestamp.now().isoformat(),
                 'total_records': len(key_three_data)
             },
@@ -3,56 +3,149 @@
 Browser Automation for BeAScout and JoinExploring
 
 Uses Playwright to load pages with JavaScript execution, 
-wait for AJAX content to load, then capture complete HTML.
+wait for AJAX content to load, then capture complete HTML
+(optionally also the raw search API JSON, see capture_api).
 """
 
 import time
 import sys
+import json
 import asyncio
 import random
+from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlparse
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
 # Import our URL generator
 sys.path.append(str(Path(__file__).parent))
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from src.dev.scraping.url_generator import DualSourceURLGenerator
+from src.pipeline.processing.html_extractor import extract_units_from_api_capture, get_api_capture_path
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Hide automation indicators
+HIDE_WEBDRIVER_SCRIPT = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+
+# Unit card selectors per site (JoinExploring markup varies, so any card-like element counts)
+UNIT_CARD_SELECTORS = {
+    'beascout': 'div.card-body',
+    'joinexploring': 'div.card-body, div.unit-card, div[class*="card"], div[class*="unit"]',
+}
+
+NETWORK_IDLE_TIMEOUT_MS = 30000    # Results XHR should finish well within this
+DOM_QUIET_MS = 750                 # Result set is final after this long without DOM mutations
+DOM_STABILITY_TIMEOUT_MS = 15000   # Give up waiting for quiet (e.g. animated content)
+
+# Resolves with the unit card count once #results has had no mutations for quietMs
+WAIT_FOR_DOM_QUIET_JS = """
+([selector, quietMs, maxMs]) => new Promise(resolve => {
+    const target = document.querySelector('#results') || document.body;
+    let quietTimer = null;
+    let limitTimer = null;
+    const observer = new MutationObserver(() => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(done, quietMs);
+    });
+    function done() {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(limitTimer);
+        resolve(document.querySelectorAll(selector).length);
+    }
+    observer.observe(target, {childList: true, subtree: true});
+    quietTimer = setTimeout(done, quietMs);
+    limitTimer = setTimeout(done, maxMs);
+})
+"""
+
+# Search API (results XHR) responses recorded in capture_api mode: any JSON XHR/fetch
+# response for the zip; processing keeps only the rendered result HTML it carries
+SEARCH_API_RESOURCE_TYPES = frozenset({'xhr', 'fetch'})
+API_RESPONSE_TIMEOUT_MS = 30000
+
+# Lightweight page profile (opt-in): only what populates #results is loaded, everything
+# else (images/map tiles, media, fonts, stylesheets, third-party trackers) is aborted
+LIGHTWEIGHT_RESOURCE_TYPES = frozenset({'document', 'script', 'xhr', 'fetch'})
+TRACKER_HOSTS = ('googletagmanager.com', 'google-analytics.com', 'doubleclick.net', 'facebook.net',
+                 'facebook.com', 'hotjar.com', 'tiktok.com', 'ubembed.com', 'clarity.ms', 'bing.com')
+
+
+def is_tracker_url(url):
+    """Request to a known analytics/advertising host (or a subdomain of one)"""
+    host = urlparse(url).hostname or ''
+    return any(host == tracker or host.endswith('.' + tracker) for tracker in TRACKER_HOSTS)
+
+
+def should_block_request(resource_type, url):
+    """Lightweight profile: keep document, script and XHR/fetch requests that are not trackers"""
+    return resource_type not in LIGHTWEIGHT_RESOURCE_TYPES or is_tracker_url(url)
+
+
+def is_search_api_response(response, zip_code=''):
+    """JSON XHR/fetch response for this zip code (any, when no zip code is given)"""
+    if response.request.resource_type not in SEARCH_API_RESOURCE_TYPES:
+        return False
+    if 'json' not in response.headers.get('content-type', ''):
+        return False
+    return not zip_code or zip_code in response.url or zip_code in (response.request.post_data or '')
 
 
 class BrowserScraper:
     """Browser automation for scraping BeAScout and JoinExploring sites"""
     
-    def __init__(self, headless=True, wait_timeout=45000, max_retries=3):  # Increased timeout, added retries
+    def __init__(self, headless=True, wait_timeout=45000, max_retries=3,  # Increased timeout, added retries
+                 url_generator=None, rate_limiter=None, capture_api=False, lightweight=False):
+        """
+        Args:
+            url_generator: DualSourceURLGenerator (override base URLs, e.g. local stub server)
+            rate_limiter: Optional HostRateLimiter awaited before every page load
+            capture_api: Record the search API JSON; results waits are skipped when it parses into units
+            lightweight: Abort images, media, fonts, stylesheets and trackers (see should_block_request)
+        """
         self.headless = headless
         self.wait_timeout = wait_timeout
         self.max_retries = max_retries
         self.playwright = None
         self.browser = None
+        self.context = None
         self.page = None
-        self.url_generator = DualSourceURLGenerator()
+        self.url_generator = url_generator or DualSourceURLGenerator()
+        self.rate_limiter = rate_limiter
+        self.owns_context = True
+        self.wait_timings = []  # One entry per results wait (see record_wait)
+        self.capture_api = capture_api
+        self.api_captures = {}  # (site_type, zip_code) -> captured search API responses
+        self.lightweight = lightweight
+        self.page_metrics = []  # One entry per results page load (see record_page_metrics)
+        self.traffic = {'requests': 0, 'bytes': 0, 'blocked': 0}  # Current page load
+        self.last_status = None  # HTTP status of the last results page document
+        self.last_attempts = 0   # Attempts the last retry_with_backoff operation took
+        self.rate_wait = 0.0     # Seconds the current page load waited for the rate limiter
+    
+    async def launch_browser(self):
+        """Start Playwright and launch the browser (no page; see setup_browser / setup_context)"""
+        self.playwright = await async_playwright().start()
+        
+        # Launch browser with appropriate options
+        self.browser = await self.playwright.chromium.launch(
+            headless=self.headless,
+            args=[
+                '--no-sandbox',
+                '--disable-dev-shm-usage',
+                '--disable-blink-features=AutomationControlled'
+            ]
+        )
+        return self.browser
     
     async def setup_browser(self):
         """Initialize Playwright browser"""
         try:
-            self.playwright = await async_playwright().start()
-            
-            # Launch browser with appropriate options
-            self.browser = await self.playwright.chromium.launch(
-                headless=self.headless,
-                args=[
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-blink-features=AutomationControlled'
-                ]
-            )
+            await self.launch_browser()
             
             # Create new page with custom user agent
-            self.page = await self.browser.new_page(
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            
-            # Hide automation indicators
-            await self.page.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            self.page = await self.new_page()
             
             return True
             
@@ -60,6 +153,160 @@ class BrowserScraper:
             print(f"Error setting up browser: {e}")
             return False
     
+    async def setup_context(self, browser):
+        """Use an isolated context in a shared browser (concurrent scraping, one context per worker)"""
+        try:
+            self.browser = browser
+            self.context = await browser.new_context(user_agent=USER_AGENT)
+            self.page = await self.new_page()
+            return True
+            
+        except Exception as e:
+            print(f"Error setting up browser context: {e}")
+            return False
+    
+    async def open_sibling(self):
+        """
+        Second scraper on its own page in this scraper's browser/context, sharing the rate limiter
+        Lets BeAScout and JoinExploring load at the same time; closing it only closes its page
+        """
+        sibling = BrowserScraper(self.headless, self.wait_timeout, self.max_retries,
+                                 self.url_generator, self.rate_limiter, self.capture_api, self.lightweight)
+        sibling.browser = self.browser
+        sibling.context = self.context
+        sibling.owns_context = False
+        sibling.page = await sibling.new_page()
+        return sibling
+    
+    async def new_page(self):
+        """Open a page with custom user agent in this scraper's context (or its own browser)"""
+        if self.context:
+            page = await self.context.new_page()
+        else:
+            page = await self.browser.new_page(user_agent=USER_AGENT)
+        await page.add_init_script(HIDE_WEBDRIVER_SCRIPT)
+        if self.lightweight:
+            await page.route('**/*', self.route_request)
+        page.on('requestfinished', self.on_request_finished)
+        return page
+    
+    async def route_request(self, route):
+        """Lightweight profile request filter"""
+        request = route.request
+        if should_block_request(request.resource_type, request.url):
+            self.traffic['blocked'] += 1
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def on_request_finished(self, request):
+        """Count the bytes transferred (headers + body) for the current page load"""
+        try:
+            sizes = await request.sizes()
+        except Exception:
+            return  # Page closed before sizes were available
+        self.traffic['requests'] += 1
+        self.traffic['bytes'] += sizes['responseHeadersSize'] + sizes['responseBodySize']
+    
+    def record_page_metrics(self, site_type, zip_code, start):
+        """Record one results page load: seconds (rate limit wait excluded), requests, bytes, blocked and status"""
+        metrics = {
+            'site': site_type,
+            'zip_code': zip_code,
+            'profile': 'lightweight' if self.lightweight else 'full',
+            'load_seconds': round(time.monotonic() - start - self.rate_wait, 2),
+            'rate_wait_seconds': round(self.rate_wait, 2),
+            **self.traffic,
+            'status': self.last_status,
+        }
+        self.page_metrics.append(metrics)
+        print(f"📦 {site_type} {zip_code}: {metrics['requests']} requests, {metrics['bytes'] / 1024:.0f} KB, "
+              f"{metrics['blocked']} blocked, {metrics['load_seconds']:.1f}s ({metrics['profile']} profile)")
+    
+    async def goto(self, url):
+        """Navigate the current page, waiting for the host's rate limit budget first"""
+        if self.rate_limiter:
+            self.rate_wait += await self.rate_limiter.acquire(url)
+        response = await self.page.goto(url, timeout=60000, wait_until='domcontentloaded')
+        self.last_status = response.status if response else None
+    
+    async def goto_capturing_api(self, url, zip_code):
+        """Navigate and return the search API JSON responses for this zip ([] if none arrived)"""
+        responses = []
+        
+        def on_response(response):
+            if is_search_api_response(response, zip_code):
+                responses.append(response)
+        
+        self.page.on('response', on_response)
+        try:
+            await self.goto(url)
+            if not responses:
+                try:
+                    await self.page.wait_for_event(
+                        'response', predicate=lambda response: is_search_api_response(response, zip_code),
+                        timeout=API_RESPONSE_TIMEOUT_MS)
+                except PlaywrightTimeoutError:
+                    print(f"No search API response after {API_RESPONSE_TIMEOUT_MS / 1000:.0f}s, waiting for rendered results")
+            
+            payloads = []
+            for response in responses:
+                try:
+                    payloads.append({'url': response.url, 'status': response.status, 'body': await response.json()})
+                except Exception as e:
+                    print(f"Skipping unreadable search API response {response.url}: {e}")
+            return payloads
+        finally:
+            self.page.remove_listener('response', on_response)
+    
+    async def load_results(self, site_type, zip_code, url):
+        """Navigate to the results page; wait for rendered units unless the captured search API JSON parsed into units"""
+        start = time.monotonic()
+        self.traffic = {'requests': 0, 'bytes': 0, 'blocked': 0}
+        self.last_status = None
+        self.rate_wait = 0.0
+        captured_units = None
+        if self.capture_api:
+            payloads = await self.goto_capturing_api(url, zip_code)
+            capture = {
+                'source': site_type,
+                'zip_code': zip_code,
+                'page_url': url,
+                'captured_at': datetime.now().isoformat(),
+                'responses': payloads,
+            }
+            self.api_captures[(site_type, zip_code)] = capture
+            if payloads:
+                # Only a capture that parses into valid units can stand in for the rendered results
+                captured_units = extract_units_from_api_capture(capture, site_type)
+                if captured_units:
+                    print(f"{site_type}: Captured {len(captured_units)} units from the search API, skipping results wait")
+                else:
+                    print(f"{site_type}: Search API capture has no usable units, waiting for rendered results")
+        else:
+            await self.goto(url)
+        
+        # Wait until the result set is final (network idle + DOM quiet period)
+        min_units = 1 if site_type == 'beascout' else 0  # JoinExploring may have 0 units in some areas
+        if not captured_units and not await self.wait_for_units_to_load(site_type, min_units=min_units):
+            print("No units found immediately, waiting for late results...")
+            
+            # Check again
+            if not await self.wait_for_units_to_load(site_type, min_units=0):
+                print("Still no units, but continuing with page content...")
+        
+        self.record_page_metrics(site_type, zip_code, start)
+    
+    def save_api_capture(self, site_type, zip_code, html_file):
+        """Write the captured search API JSON next to the page HTML; returns its path (None if not captured)"""
+        capture = self.api_captures.pop((site_type, zip_code), None)
+        if not capture or not capture['responses']:
+            return None
+        api_path = get_api_capture_path(html_file)
+        with open(api_path, 'w', encoding='utf-8') as f:
+            json.dump(capture, f, indent=2)
+        return api_path
+    
     async def retry_with_backoff(self, operation, operation_name, max_retries=None):
         """Retry an operation with exponential backoff and jitter
         
@@ -75,6 +322,7 @@ class BrowserScraper:
             max_retries = self.max_retries
             
         for attempt in range(max_retries + 1):
+            self.last_attempts = attempt + 1
             try:
                 print(f"{operation_name} - Attempt {attempt + 1}/{max_retries + 1}")
                 result = await operation()
@@ -98,7 +346,12 @@ class BrowserScraper:
         return None
     
     async def wait_for_units_to_load(self, site_type='beascout', min_units=1):
-        """Wait for unit cards to appear on the page
+        """Wait until the unit result set is final, then record how long the wait took
+        
+        Waits for the #results container, then for network idle (results XHR
+        finished), then for a short DOM quiet period with no mutations under
+        #results. Returns as soon as the result set stops changing instead of
+        sleeping/polling for fixed intervals.
         
         Args:
             site_type: 'beascout' or 'joinexploring'
@@ -107,54 +360,58 @@ class BrowserScraper:
         Returns:
             bool: True if units loaded successfully
         """
+        label = 'BeAScout' if site_type == 'beascout' else 'JoinExploring'
+        start = time.monotonic()
         try:
+            # Wait for results container
+            await self.page.wait_for_selector('#results', timeout=self.wait_timeout)
+            
+            # Results XHR done: no network activity for 500ms
+            try:
+                await self.page.wait_for_load_state('networkidle', timeout=NETWORK_IDLE_TIMEOUT_MS)
+            except PlaywrightTimeoutError:
+                print(f"{label}: Network not idle after {NETWORK_IDLE_TIMEOUT_MS / 1000:.0f}s, checking DOM stability")
+            network_idle = time.monotonic() - start
+            
+            # DOM stable: no mutations under #results for DOM_QUIET_MS
+            unit_count = await self.page.evaluate(
+                WAIT_FOR_DOM_QUIET_JS, [UNIT_CARD_SELECTORS[site_type], DOM_QUIET_MS, DOM_STABILITY_TIMEOUT_MS])
+            self.record_wait(site_type, start, network_idle, unit_count)
+            
             if site_type == 'beascout':
-                # Wait for BeAScout results container
-                await self.page.wait_for_selector('#results', timeout=self.wait_timeout)
-                
-                # Wait for unit cards to load
-                unit_cards = []
-                for attempt in range(30):  # Try for 30 seconds
-                    unit_cards = await self.page.query_selector_all('div.card-body')
-                    if len(unit_cards) >= min_units:
-                        print(f"BeAScout: Found {len(unit_cards)} units")
-                        return True
-                    await asyncio.sleep(1)
-                
-                print(f"BeAScout: Only found {len(unit_cards)} units, expected at least {min_units}")
-                return len(unit_cards) > 0  # Accept any units found
-                    
-            elif site_type == 'joinexploring':
-                # Wait for JoinExploring results container
-                await self.page.wait_for_selector('#results', timeout=self.wait_timeout)
-                
-                # Try multiple selectors that might contain unit data
-                selectors_to_try = [
-                    'div.card-body',
-                    'div.unit-card', 
-                    'div[class*="card"]',
-                    'div[class*="unit"]'
-                ]
-                
-                for selector in selectors_to_try:
-                    for attempt in range(30):  # Try for 30 seconds
-                        unit_cards = await self.page.query_selector_all(selector)
-                        if len(unit_cards) >= min_units:
-                            print(f"JoinExploring: Found {len(unit_cards)} units using selector '{selector}'")
-                            return True
-                        await asyncio.sleep(1)
-                
+                if unit_count >= min_units:
+                    print(f"BeAScout: Found {unit_count} units")
+                    return True
+                print(f"BeAScout: Only found {unit_count} units, expected at least {min_units}")
+                return unit_count > 0  # Accept any units found
+            
+            if unit_count:
+                print(f"JoinExploring: Found {unit_count} units")
+            else:
                 # If no units found, that might be normal for some areas
                 print(f"JoinExploring: No units found (may be normal for this area)")
-                return True  # Don't fail if no Explorer units exist
+            return True  # Don't fail if no Explorer units exist
                 
         except PlaywrightTimeoutError:
+            self.record_wait(site_type, start, None, None)
             print(f"Timeout waiting for {site_type} units to load")
             return False
         except Exception as e:
             print(f"Error waiting for {site_type} units: {e}")
             return False
     
+    def record_wait(self, site_type, start, network_idle, unit_count):
+        """Record one results wait (seconds to network idle and to a stable result set)"""
+        total = time.monotonic() - start
+        self.wait_timings.append({
+            'site': site_type,
+            'network_idle_seconds': round(network_idle, 2) if network_idle is not None else None,
+            'total_seconds': round(total, 2),
+            'units': unit_count,
+            'timed_out': unit_count is None,
+        })
+        print(f"⏱  {site_type} results wait: {total:.1f}s")
+    
     async def scrape_beascout(self, zip_code, output_file=None):
         """Scrape BeAScout for traditional units with retry logic
         
@@ -177,30 +434,12 @@ class BrowserScraper:
                     # Create new page for retry attempts
                     if self.page:
                         await self.page.close()
-                    self.page = await self.browser.new_page(
-                        user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                    )
-                    await self.page.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+                    self.page = await self.new_page()
             else:
                 self._attempt_count = 1
             
-            # Navigate to page with longer timeout and different wait strategy
-            await self.page.goto(url, timeout=60000, wait_until='domcontentloaded')
-            
-            # Wait for page to stabilize
-            await asyncio.sleep(5)
-            
-            # Wait for units to load with extended patience
-            if not await self.wait_for_units_to_load('beascout', min_units=1):
-                print("No units found immediately, waiting longer...")
-                await asyncio.sleep(10)  # Extra wait for slow AJAX
-                
-                # Check again
-                if not await self.wait_for_units_to_load('beascout', min_units=0):
-                    print("Still no units, but continuing with page content...")
-            
-            # Additional wait to ensure all content is loaded
-            await asyncio.sleep(3)
+            # Navigate and wait for the results (or capture the search API JSON)
+            await self.load_results('beascout', zip_code, url)
             
             # Get complete page HTML
             html_content = await self.page.content()
@@ -227,6 +466,9 @@ class BrowserScraper:
             with open(output_path, 'w', encoding='utf-8') as f:
                 f.write(html_content)
             print(f"BeAScout HTML saved to: {output_path}")
+            api_path = self.save_api_capture('beascout', zip_code, output_path)
+            if api_path:
+                print(f"BeAScout search API JSON saved to: {api_path}")
         
         return html_content
     
@@ -252,30 +494,12 @@ class BrowserScraper:
                     # Create new page for retry attempts
                     if self.page:
                         await self.page.close()
-                    self.page = await self.browser.new_page(
-                        user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                    )
-                    await self.page.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+                    self.page = await self.new_page()
             else:
                 self._attempt_count_je = 1
             
-            # Navigate to page with longer timeout and different wait strategy
-            await self.page.goto(url, timeout=60000, wait_until='domcontentloaded')
-            
-            # Wait for page to stabilize
-            await asyncio.sleep(5)
-            
-            # Wait for units to load with extended patience (may be 0 units in some areas)
-            if not await self.wait_for_units_to_load('joinexploring', min_units=0):
-                print("No units found immediately, waiting longer...")
-                await asyncio.sleep(10)  # Extra wait for slow AJAX
-                
-                # Check again
-                if not await self.wait_for_units_to_load('joinexploring', min_units=0):
-                    print("Still no units, but continuing with page content...")
-            
-            # Additional wait to ensure all content is loaded
-            await asyncio.sleep(5)  # Longer wait for JoinExploring
+            # Navigate and wait for the results (or capture the search API JSON)
+            await self.load_results('joinexploring', zip_code, url)
             
             # Get complete page HTML
             html_content = await self.page.content()
@@ -302,6 +526,9 @@ class BrowserScraper:
             with open(output_path, 'w', encoding='utf-8') as f:
                 f.write(html_content)
             print(f"JoinExploring HTML saved to: {output_path}")
+            api_path = self.save_api_capture('joinexploring', zip_code, output_path)
+            if api_path:
+                print(f"JoinExploring search API JSON saved to: {api_path}")
         
         return html_content
     
@@ -333,10 +560,17 @@ class BrowserScraper:
         return results
     
     async def close(self):
-        """Close the browser and playwright"""
-        if self.browser:
-            await self.browser.close()
+        """Close the browser and playwright (only the context/page when sharing another scraper's browser)"""
+        if not self.owns_context:
+            if self.page:
+                await self.page.close()
+            return
+        if self.context:
+            await self.context.close()
+            self.context = None
         if self.playwright:
+            if self.browser:
+                await self.browser.close()
             await self.playwright.stop()
     
     async def __aenter__(self):
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Scrape Checkpoint Journal
+Append-only record (scrape_journal.jsonl in the session directory) of every zip/site
+page attempt: status, attempt number, bytes and unit card fingerprint. Restarting a
+session with --session-id replays the journal and scrapes only missing or failed
+pages; failed pages can fall back to the last good copy from an earlier session.
+"""
+
+import json
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from src.pipeline.processing.html_extractor import get_api_capture_path
+from src.pipeline.processing.scrape_manifest import PAGE_SOURCES, fingerprint_page
+
+JOURNAL_FILENAME = 'scrape_journal.jsonl'
+
+# Entry statuses: page scraped, scrape failed, failed but replaced by an earlier session's page
+STATUS_OK = 'ok'
+STATUS_FAILED = 'failed'
+STATUS_CACHED = 'cached'
+
+
+def get_page_path(session_path, site: str, zip_code: str) -> Path:
+    return Path(session_path) / f"{site}_{zip_code}.html"
+
+
+class CheckpointJournal:
+    """Per-session page journal; the latest entry for each (zip, site) wins on replay"""
+
+    def __init__(self, session_path):
+        self.session_path = Path(session_path)
+        self.path = self.session_path / JOURNAL_FILENAME
+        self.entries: Dict[tuple, dict] = {}
+        self.load()
+
+    def load(self):
+        """Replay the journal (a line cut short by a crash is ignored)"""
+        self.entries = {}
+        if not self.path.exists():
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self.entries[(entry['zip_code'], entry['site'])] = entry
+
+    def record(self, zip_code: str, site: str, status: str, content: Optional[str] = None,
+               error: Optional[str] = None, source: Optional[str] = None) -> dict:
+        """Append one page attempt (flushed to disk before returning)"""
+        previous = self.entries.get((zip_code, site))
+        entry = {
+            'zip_code': zip_code,
+            'site': site,
+            'status': status,
+            'attempt': previous['attempt'] + 1 if previous else 1,
+            'bytes': len(content.encode('utf-8')) if content is not None else 0,
+            'fingerprint': fingerprint_page(content) if content is not None else None,
+            'time': datetime.now().isoformat(),
+        }
+        if error:
+            entry['error'] = error
+        if source:
+            entry['source'] = source
+        self.session_path.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self.entries[(zip_code, site)] = entry
+        return entry
+
+    def get_status(self, zip_code: str, site: str) -> Optional[str]:
+        entry = self.entries.get((zip_code, site))
+        return entry['status'] if entry else None
+
+    def has_page(self, zip_code: str, site: str) -> bool:
+        """Scraped successfully and the page is still on disk"""
+        return (self.get_status(zip_code, site) == STATUS_OK
+                and get_page_path(self.session_path, site, zip_code).exists())
+
+    def pending_sites(self, zip_code: str, skip_failed: bool = False) -> List[str]:
+        """Sites still to scrape for a zip: missing pages, and failed ones unless skip_failed"""
+        return [site for site in PAGE_SOURCES
+                if not self.has_page(zip_code, site)
+                and not (skip_failed and self.get_status(zip_code, site) in (STATUS_FAILED, STATUS_CACHED))]
+
+    def pending_zips(self, zip_codes: Iterable[str], skip_failed: bool = False) -> List[str]:
+        return [zip_code for zip_code in zip_codes if self.pending_sites(zip_code, skip_failed)]
+
+    def summary(self) -> Dict[str, int]:
+        """Latest entry count per status"""
+        counts = {}
+        for entry in self.entries.values():
+            counts[entry['status']] = counts.get(entry['status'], 0) + 1
+        return counts
+
+    def fall_back(self, zip_code: str, site: str, error: Optional[str] = None) -> Optional[Path]:
+        """
+        Copy the last good page for a failed zip/site from an earlier session
+        Returns the source page (None if no earlier session has one)
+        """
+        source = find_cached_page(self.session_path, site, zip_code)
+        if source is None:
+            return None
+        target = get_page_path(self.session_path, site, zip_code)
+        shutil.copyfile(source, target)
+        source_api = get_api_capture_path(source)
+        if source_api.exists():
+            shutil.copyfile(source_api, get_api_capture_path(target))
+        with open(target, 'r', encoding='utf-8') as f:
+            self.record(zip_code, site, STATUS_CACHED, f.read(), error=error, source=str(source))
+        return source
+
+
+def find_cached_page(session_path, site: str, zip_code: str) -> Optional[Path]:
+    """
+    Page from the most recent earlier sibling session that scraped it successfully
+    (sessions from before the journal count when the page file exists)
+    """
+    session_path = Path(session_path)
+    if not session_path.parent.exists():
+        return None
+    earlier = sorted((path for path in session_path.parent.iterdir()
+                      if path.is_dir() and path.name < session_path.name), reverse=True)
+    for previous in earlier:
+        page = get_page_path(previous, site, zip_code)
+        if not page.exists():
+            continue
+        if (previous / JOURNAL_FILENAME).exists() and not CheckpointJournal(previous).has_page(zip_code, site):
+            continue
+        return page
+    return None
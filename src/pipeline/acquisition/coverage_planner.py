@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Zip Coverage Planner
+BeAScout and JoinExploring return every unit within a fixed radius of the query zip,
+so scraping all HNE zips on both sites fetches the same units many times over.
+Plans, per site, a minimum set of query zips whose search circles still reach every
+HNE town (set cover over bundled town centroids), reports the request reduction and
+flags towns no query reaches.
+"""
+
+import argparse
+import json
+import math
+import sys
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.dev.scraping.url_generator import DualSourceURLGenerator
+
+ZIPCODES_FILE = project_root / 'data' / 'zipcodes' / 'hne_council_zipcodes.json'
+CENTROIDS_FILE = project_root / 'data' / 'zipcodes' / 'hne_town_centroids.json'
+
+EARTH_RADIUS_MILES = 3958.8
+
+# Units meet anywhere in town, not at its centroid: a query must reach this far past a town's center
+DEFAULT_TOWN_MARGIN_MILES = 2.0
+
+# Branch-and-bound search nodes before settling for the best cover found so far
+DEFAULT_NODE_LIMIT = 200000
+
+SITE_RADII = {
+    'beascout': DualSourceURLGenerator.BEASCOUT_RADIUS,
+    'joinexploring': DualSourceURLGenerator.JOINEXPLORING_RADIUS,
+}
+
+Point = Tuple[float, float]
+
+
+def haversine_miles(a: Point, b: Point) -> float:
+    """Great-circle distance in miles between two (lat, lon) points"""
+    lat1, lon1, lat2, lon2 = map(math.radians, (*a, *b))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * math.asin(math.sqrt(h))
+
+
+def load_town_centroids(path=CENTROIDS_FILE) -> Dict[str, Point]:
+    """Town name -> (lat, lon) from the bundled centroid table"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return {town: tuple(point) for town, point in json.load(f)['towns'].items()}
+
+
+def load_town_zipcodes(path=ZIPCODES_FILE) -> Tuple[List[str], Dict[str, List[str]]]:
+    """(HNE towns, town -> zip codes) from the council zip code table"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data['towns'], data['town_zipcodes']
+
+
+def candidate_queries(town_zipcodes: Dict[str, List[str]], centroids: Dict[str, Point]) -> Dict[str, Point]:
+    """
+    Query zip -> location: each zip is placed at its town's centroid
+    A zip shared by several towns keeps its first town's location
+    """
+    candidates = {}
+    for town, zip_codes in town_zipcodes.items():
+        if town not in centroids:
+            continue
+        for zip_code in zip_codes:
+            candidates.setdefault(zip_code, centroids[town])
+    return candidates
+
+
+def build_coverage_sets(candidates: Dict[str, Point], centroids: Dict[str, Point],
+                        reach_miles: float) -> Dict[str, FrozenSet[str]]:
+    """Query zip -> towns whose centroid lies within reach_miles of it"""
+    return {
+        zip_code: frozenset(town for town, centroid in centroids.items()
+                            if haversine_miles(point, centroid) <= reach_miles)
+        for zip_code, point in candidates.items()
+    }
+
+
+def prune_candidates(sets: Dict[str, FrozenSet[str]]) -> Dict[str, FrozenSet[str]]:
+    """Drop duplicate and dominated candidates (keeping the lowest zip among equals)"""
+    ordered = sorted(sets.items(), key=lambda item: (-len(item[1]), item[0]))
+    kept = {}
+    for zip_code, towns in ordered:
+        if towns and not any(towns <= other for other in kept.values()):
+            kept[zip_code] = towns
+    return kept
+
+
+def greedy_set_cover(universe: FrozenSet[str], sets: Dict[str, FrozenSet[str]]) -> List[str]:
+    """Repeatedly pick the query reaching the most uncovered towns (lowest zip on ties)"""
+    uncovered = set(universe)
+    chosen = []
+    while uncovered:
+        best = min(sets, key=lambda zip_code: (-len(sets[zip_code] & uncovered), zip_code))
+        if not sets[best] & uncovered:
+            break
+        chosen.append(best)
+        uncovered -= sets[best]
+    return chosen
+
+
+def minimum_set_cover(universe: FrozenSet[str], sets: Dict[str, FrozenSet[str]],
+                      node_limit: int = DEFAULT_NODE_LIMIT) -> Tuple[List[str], bool]:
+    """
+    Smallest set of queries covering the universe (branch and bound seeded with greedy)
+
+    Args:
+        universe: Towns to cover (all must be reachable by some query)
+        sets: Query zip -> towns it reaches
+        node_limit: Search nodes before giving up on proving optimality
+
+    Returns:
+        (sorted query zips, True if the cover is proven minimal)
+    """
+    sets = prune_candidates(sets)
+    best = greedy_set_cover(universe, sets)
+    if not sets:
+        return sorted(best), True
+    covering = {town: sorted((z for z in sets if town in sets[z]), key=lambda z: (-len(sets[z]), z))
+                for town in universe}
+    largest = max(len(towns) for towns in sets.values())
+    nodes = 0
+
+    def search(uncovered: FrozenSet[str], chosen: List[str]):
+        nonlocal best, nodes
+        if not uncovered:
+            if len(chosen) < len(best):
+                best = list(chosen)
+            return
+        nodes += 1
+        if nodes > node_limit or len(chosen) + math.ceil(len(uncovered) / largest) >= len(best):
+            return
+        # Branch on the town with the fewest queries reaching it
+        town = min(uncovered, key=lambda t: (len(covering[t]), t))
+        for zip_code in covering[town]:
+            chosen.append(zip_code)
+            search(uncovered - sets[zip_code], chosen)
+            chosen.pop()
+
+    search(frozenset(universe), [])
+    return sorted(best), nodes <= node_limit
+
+
+def plan_site(site: str, radius_miles: float, towns: List[str], town_zipcodes: Dict[str, List[str]],
+              centroids: Dict[str, Point], margin_miles: float = DEFAULT_TOWN_MARGIN_MILES,
+              node_limit: int = DEFAULT_NODE_LIMIT) -> Dict:
+    """Minimum query zips for one site; towns without a centroid or reachable query are flagged"""
+    reach_miles = max(radius_miles - margin_miles, 0.0)
+    located = {town: centroids[town] for town in towns if town in centroids}
+    candidates = candidate_queries({town: town_zipcodes.get(town, []) for town in located}, centroids)
+    sets = build_coverage_sets(candidates, located, reach_miles)
+    reachable = frozenset().union(*sets.values()) if sets else frozenset()
+    query_zips, optimal = minimum_set_cover(reachable, sets, node_limit)
+    return {
+        'site': site,
+        'radius_miles': radius_miles,
+        'reach_miles': reach_miles,
+        'query_zips': query_zips,
+        'optimal': optimal,
+        'towns_covered': len(reachable),
+        'uncovered_towns': sorted(town for town in towns if town not in reachable),
+    }
+
+
+def plan_coverage(radii: Optional[Dict[str, float]] = None, margin_miles: float = DEFAULT_TOWN_MARGIN_MILES,
+                  zipcodes_path=ZIPCODES_FILE, centroids_path=CENTROIDS_FILE,
+                  node_limit: int = DEFAULT_NODE_LIMIT) -> Dict:
+    """
+    Coverage plan for both sites against the current all-zips scrape
+
+    Returns:
+        Plan with per-site query zips, request counts and towns no query reaches
+    """
+    radii = radii or SITE_RADII
+    towns, town_zipcodes = load_town_zipcodes(zipcodes_path)
+    centroids = load_town_centroids(centroids_path)
+    all_zips = sorted({zip_code for town in towns for zip_code in town_zipcodes.get(town, [])})
+
+    sites = {site: plan_site(site, radius, towns, town_zipcodes, centroids, margin_miles, node_limit)
+             for site, radius in radii.items()}
+    current_requests = len(all_zips) * len(sites)
+    planned_requests = sum(len(plan['query_zips']) for plan in sites.values())
+    # Zips still scraped on both sites (processing expects both pages per zip)
+    paired_zips = sorted(set().union(*(plan['query_zips'] for plan in sites.values())))
+
+    return {
+        'margin_miles': margin_miles,
+        'total_towns': len(towns),
+        'total_zipcodes': len(all_zips),
+        'sites': sites,
+        'current_requests': current_requests,
+        'planned_requests': planned_requests,
+        'request_reduction': 1 - planned_requests / current_requests if current_requests else 0.0,
+        'paired_zips': paired_zips,
+        'paired_requests': len(paired_zips) * len(sites),
+        'missing_centroids': sorted(town for town in towns if town not in centroids),
+        'uncovered_towns': sorted(set().union(*(plan['uncovered_towns'] for plan in sites.values()))),
+    }
+
+
+def print_coverage_report(plan: Dict):
+    print(f"🗺️  Coverage plan: {plan['total_towns']} towns, {plan['total_zipcodes']} zip codes "
+          f"(town margin {plan['margin_miles']} mi)")
+    for site, site_plan in plan['sites'].items():
+        status = "minimal" if site_plan['optimal'] else "best found"
+        print(f"   📍 {site}: {len(site_plan['query_zips'])} queries ({status}) at {site_plan['radius_miles']} mi "
+              f"reach {site_plan['towns_covered']} towns: {', '.join(site_plan['query_zips'])}")
+    print(f"   📉 Requests: {plan['planned_requests']} planned vs {plan['current_requests']} current "
+          f"({plan['request_reduction']:.1%} fewer)")
+    print(f"   🔗 Scraping both sites per zip: {len(plan['paired_zips'])} zips, {plan['paired_requests']} requests")
+    if plan['missing_centroids']:
+        print(f"   ⚠️  Towns missing from the centroid table: {', '.join(plan['missing_centroids'])}")
+    if plan['uncovered_towns']:
+        print(f"   ❌ Towns not covered: {', '.join(plan['uncovered_towns'])}")
+    else:
+        print(f"   ✅ Every town covered")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plan a minimal set of query zips covering every HNE town")
+    parser.add_argument('--margin', type=float, default=DEFAULT_TOWN_MARGIN_MILES,
+                        help='Miles subtracted from each site radius for town extent '
+                             f'(default: {DEFAULT_TOWN_MARGIN_MILES})')
+    parser.add_argument('--output', help='Also write the plan as JSON to this file')
+    args = parser.parse_args()
+
+    plan = plan_coverage(margin_miles=args.margin)
+    print_coverage_report(plan)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(plan, f, indent=2)
+        print(f"   📋 Plan saved: {args.output}")
+    return 1 if plan['uncovered_towns'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -20,6 +20,24 @@ current_dir = Path.cwd()
 sys.path.insert(0, str(current_dir))
 
 from src.pipeline.acquisition.browser_scraper import BrowserScraper
+from src.pipeline.acquisition.rate_limiter import (
+    HostRateLimiter, AdaptiveRateController, DEFAULT_REQUESTS_PER_MINUTE, ADAPTIVE_MAX_REQUESTS_PER_MINUTE
+)
+from src.dev.scraping.url_generator import DualSourceURLGenerator
+from src.pipeline.processing.scrape_manifest import (
+    PAGE_SOURCES, load_manifest, save_manifest, new_manifest, record_zip, find_previous_session
+)
+from src.pipeline.acquisition.overlap_planner import SCHEDULE_FILE, load_fast_zips
+from src.pipeline.acquisition.checkpoint_journal import (
+    CheckpointJournal, STATUS_CACHED, STATUS_FAILED, STATUS_OK
+)
+from src.pipeline.processing.html_extractor import iter_unit_card_fragments
+
+# Adaptive rate controller decisions, one JSON line each (for tuning the policy offline)
+RATE_DECISIONS_FILENAME = 'rate_decisions.jsonl'
+
+# Sites where a results page without unit cards is an anomaly (JoinExploring may have none)
+EXPECT_UNITS_SITES = ('beascout',)
 
 
 class MultiZipScraper:
@@ -41,6 +59,41 @@ class MultiZipScraper:
             'batch_cooldown': (120, 180),      # 2-3 minute cooldown between batches
             'session_limit': 20,               # Max requests per browser session
             
+            # Concurrent mode (concurrency > 1): browser contexts share one token bucket per host
+            'concurrency': 1,                  # Browser contexts scraping at once (1 = serial with fixed delays)
+            'host_requests_per_minute': {      # Politeness budget per host (concurrent mode)
+                'beascout.scouting.org': DEFAULT_REQUESTS_PER_MINUTE,
+                'joinexploring.org': DEFAULT_REQUESTS_PER_MINUTE,
+            },
+            'default_requests_per_minute': DEFAULT_REQUESTS_PER_MINUTE,
+            
+            # Fetch BeAScout and JoinExploring for a zip at the same time (separate pages, different
+            # hosts); per-host rate limiting replaces the fixed delay between the two sites
+            'parallel_sites': False,
+            
+            # Save the search API JSON next to each page (html_extractor builds units from it,
+            # skipping the rendering waits and HTML parse; the HTML stays as fallback)
+            'capture_api': False,
+            
+            # Abort images, media, fonts, stylesheets and trackers (page bytes/load time are
+            # recorded either way, so runs with and without it can be compared)
+            'lightweight_pages': False,
+            
+            # Fast mode: scrape only the zips that historically captured every unit
+            # (schedule file written by overlap_planner.py; None = all zips)
+            'fast_schedule': None,
+            
+            # Resuming a session (--session-id): zips whose pages failed before are not retried
+            'skip_failed': False,
+            # Copy the last good page from an earlier session when a site fails
+            'fallback_cache': False,
+            
+            # Adaptive pacing (AIMD): per-host budgets and browser contexts follow page health
+            # (latency, HTTP status, empty results, retries) instead of the fixed delays and
+            # cooldowns; 'concurrency' becomes the upper bound for contexts
+            'adaptive_rate': False,
+            'adaptive_max_requests_per_minute': ADAPTIVE_MAX_REQUESTS_PER_MINUTE,
+            
             # Failure detection (essential)
             'max_consecutive_failures': 3,    # Stop if 3 failures in a row
             'success_rate_threshold': 0.7,    # Stop if success rate drops below 70%
@@ -62,6 +115,21 @@ class MultiZipScraper:
         # Session directory attributes (can be overridden via --session-id)
         self.session_timestamp = None
         self.session_dir = None
+
+        # Target site URLs (override with --base-url to scrape a local stub server)
+        self.url_generator = DualSourceURLGenerator()
+        self.rate_limiter = None
+        self.rate_controller = None
+
+        # Unit card fingerprints per zip (scrape_manifest.json; unchanged zips reuse extracted units)
+        self.manifest = None
+        
+        # Per-page scrape attempts (scrape_journal.jsonl; a restarted session resumes from it)
+        self.journal = None
+        
+        # Results wait timings and page load metrics collected from every BrowserScraper
+        self.wait_timings = []
+        self.page_metrics = []
     
     def is_processing_allowed(self) -> bool:
         """Check if processing is allowed (always True now - removed time restrictions)"""
@@ -117,40 +185,173 @@ class MultiZipScraper:
         
         return True, "OK"
     
-    async def process_single_zip(self, zip_code: str, scraper: BrowserScraper) -> bool:
-        """Process a single zip code with error handling"""
+    def collect_scraper_metrics(self, *scrapers):
+        """Keep scrapers' results wait timings and page load metrics before they are closed"""
+        for scraper in scrapers:
+            if scraper:
+                self.wait_timings.extend(scraper.wait_timings)
+                scraper.wait_timings = []
+                self.page_metrics.extend(scraper.page_metrics)
+                scraper.page_metrics = []
+    
+    def summarize_wait_timings(self) -> dict:
+        """Results wait seconds per site: count, mean, max and timeouts"""
+        summary = {}
+        for site in sorted({t['site'] for t in self.wait_timings}):
+            waits = [t['total_seconds'] for t in self.wait_timings if t['site'] == site]
+            summary[site] = {
+                'waits': len(waits),
+                'mean_seconds': round(sum(waits) / len(waits), 2),
+                'max_seconds': max(waits),
+                'timeouts': sum(1 for t in self.wait_timings if t['site'] == site and t['timed_out']),
+            }
+        return summary
+    
+    def summarize_page_metrics(self) -> dict:
+        """Page loads per site: count, mean KB transferred, mean load seconds and requests blocked"""
+        summary = {}
+        for site in sorted({m['site'] for m in self.page_metrics}):
+            pages = [m for m in self.page_metrics if m['site'] == site]
+            summary[site] = {
+                'pages': len(pages),
+                'profile': pages[-1]['profile'],
+                'mean_kb': round(sum(m['bytes'] for m in pages) / len(pages) / 1024, 1),
+                'mean_load_seconds': round(sum(m['load_seconds'] for m in pages) / len(pages), 2),
+                'blocked_requests': sum(m['blocked'] for m in pages),
+            }
+        return summary
+    
+    def record_zip_manifest(self, zip_code: str) -> dict:
+        """Fingerprint a zip's saved pages into the session's scrape manifest"""
+        if self.manifest is None or self.manifest['session'] != Path(self.session_dir).name:
+            self.manifest = (load_manifest(self.session_dir)
+                             or new_manifest(self.session_dir, find_previous_session(self.session_dir)))
+        entry = record_zip(self.manifest, self.session_dir, zip_code)
+        save_manifest(self.session_dir, self.manifest)
+        return entry
+    
+    def get_journal(self) -> CheckpointJournal:
+        """Checkpoint journal of the current session directory (replayed on first use)"""
+        if self.journal is None or self.journal.session_path != Path(self.session_dir):
+            self.journal = CheckpointJournal(self.session_dir)
+        return self.journal
+    
+    def get_rate_limiter(self) -> HostRateLimiter:
+        """Shared per-host rate limiter for the whole run (created on first use)"""
+        if self.rate_limiter is None:
+            self.rate_limiter = HostRateLimiter(self.config['host_requests_per_minute'],
+                                                self.config['default_requests_per_minute'])
+        return self.rate_limiter
+    
+    def get_rate_controller(self) -> AdaptiveRateController:
+        """Adaptive controller over the shared rate limiter (created on first use, logs to the session)"""
+        if self.rate_controller is None:
+            self.rate_controller = AdaptiveRateController(
+                self.get_rate_limiter(), max_concurrency=self.config['concurrency'],
+                max_per_minute=self.config['adaptive_max_requests_per_minute'],
+                log_path=Path(self.session_dir) / RATE_DECISIONS_FILENAME if self.session_dir else None)
+        return self.rate_controller
+    
+    def observe_page(self, site: str, zip_code: str, scraper: BrowserScraper, html: str,
+                     metrics_before: int, elapsed: float):
+        """Feed one fetched page's health signals to the adaptive rate controller"""
+        metrics = getattr(scraper, 'page_metrics', [])[metrics_before:]
+        last = metrics[-1] if metrics else {}
+        capture = getattr(scraper, 'api_captures', {}).get((site, zip_code))
+        empty = (bool(html) and site in EXPECT_UNITS_SITES and not (capture and capture['responses'])
+                 and next(iter_unit_card_fragments(html), None) is None)
+        url = getattr(self.url_generator, f"generate_{site}_url")(zip_code)
+        decision = self.get_rate_controller().observe(
+            url, latency_seconds=last.get('load_seconds', round(elapsed, 2)), status=last.get('status'),
+            empty=empty, retries=max(getattr(scraper, 'last_attempts', 1) - 1, 0), failed=not html,
+            site=site, zip_code=zip_code)
+        if decision['reasons']:
+            print(f"   🐢 {site}: backing off to {decision['requests_per_minute'][1]} requests/min, "
+                  f"{decision['concurrency'][1]} context(s) ({', '.join(decision['reasons'])})")
+    
+    async def process_single_zip(self, zip_code: str, scraper: BrowserScraper, site_delay: bool = True,
+                                 joinexploring_scraper: BrowserScraper = None) -> bool:
+        """
+        Process a single zip code with error handling
+        site_delay=False when a rate limiter paces requests; with joinexploring_scraper (a sibling
+        page) both sites are fetched concurrently. Sites the checkpoint journal already has a
+        good page for are not scraped again (and do not count toward the session request limit).
+        """
+        journal = self.get_journal()
+        sites = journal.pending_sites(zip_code)
+        # Counted before scraping so concurrent workers respect the session limit
+        self.session_stats['requests_in_session'] += len(sites)
+        failed_sites = []
         try:
             print(f"📍 Processing ZIP {zip_code}...")
+            if len(sites) < len(PAGE_SOURCES):
+                print(f"   🔁 Already scraped: {', '.join(s for s in PAGE_SOURCES if s not in sites)}")
             
-            # Scrape both sources
-            beascout_html = await scraper.scrape_beascout(zip_code)
-            await asyncio.sleep(self.calculate_delay((3, 7)))  # Delay between sites
-            
-            joinexploring_html = await scraper.scrape_joinexploring(zip_code) 
-            
-            # Save results to session directory
-            beascout_file = f"{self.session_dir}/beascout_{zip_code}.html"
-            joinexploring_file = f"{self.session_dir}/joinexploring_{zip_code}.html"
-            
-            with open(beascout_file, 'w', encoding='utf-8') as f:
-                f.write(beascout_html)
-            
-            with open(joinexploring_file, 'w', encoding='utf-8') as f:
-                f.write(joinexploring_html)
+            site_scrapers = {'beascout': scraper, 'joinexploring': joinexploring_scraper or scraper}
+            fetchers = {'beascout': scraper.scrape_beascout,
+                        'joinexploring': site_scrapers['joinexploring'].scrape_joinexploring}
             
-            print(f"✅ ZIP {zip_code} completed successfully")
-            print(f"   📁 Saved: {beascout_file}")
-            print(f"   📁 Saved: {joinexploring_file}")
+            async def fetch(site):
+                metrics_before = len(getattr(site_scrapers[site], 'page_metrics', []))
+                start = time.monotonic()
+                html = await fetchers[site](zip_code)
+                if self.config['adaptive_rate']:
+                    self.observe_page(site, zip_code, site_scrapers[site], html, metrics_before,
+                                      time.monotonic() - start)
+                return html
             
-            self.session_stats['successful_zips'] += 1
-            self.session_stats['consecutive_failures'] = 0  # Reset failure counter
-            return True
+            # Scrape the pending sources
+            if joinexploring_scraper:
+                pages = await asyncio.gather(*(fetch(site) for site in sites))
+            else:
+                pages = []
+                for i, site in enumerate(sites):
+                    if i and site_delay:
+                        await asyncio.sleep(self.calculate_delay((3, 7)))  # Delay between sites
+                    pages.append(await fetch(site))
             
+            # Save results to session directory
+            for site, html in zip(sites, pages):
+                if not html:
+                    failed_sites.append(site)
+                    continue
+                html_file = f"{self.session_dir}/{site}_{zip_code}.html"
+                with open(html_file, 'w', encoding='utf-8') as f:
+                    f.write(html)
+                api_file = site_scrapers[site].save_api_capture(site, zip_code, html_file)
+                journal.record(zip_code, site, STATUS_OK, html)
+                print(f"   📁 Saved: {html_file}")
+                if api_file:
+                    print(f"   📁 Saved: {api_file}")
+            error = "no page content"
         except Exception as e:
-            print(f"❌ ZIP {zip_code} failed: {str(e)}")
+            failed_sites = [site for site in sites if not journal.has_page(zip_code, site)]
+            error = str(e)
+        
+        for site in failed_sites:
+            journal.record(zip_code, site, STATUS_FAILED, error=error)
+            if self.config['fallback_cache']:
+                source = journal.fall_back(zip_code, site, error=error)
+                if source:
+                    print(f"   ♻️  {site}: using last good page from {source.parent.name}")
+        
+        if all(journal.get_status(zip_code, site) in (STATUS_OK, STATUS_CACHED) for site in PAGE_SOURCES):
+            try:
+                if self.record_zip_manifest(zip_code)['unchanged']:
+                    print(f"   ♻️  Unit cards unchanged since previous session")
+            except Exception as e:
+                print(f"   ⚠️  Could not update scrape manifest: {e}")
+        
+        if failed_sites:
+            print(f"❌ ZIP {zip_code} failed: {', '.join(failed_sites)}: {error}")
             self.session_stats['failed_zips'] += 1
             self.session_stats['consecutive_failures'] += 1
             return False
+        
+        print(f"✅ ZIP {zip_code} completed successfully")
+        self.session_stats['successful_zips'] += 1
+        self.session_stats['consecutive_failures'] = 0  # Reset failure counter
+        return True
     
     async def process_zip_batch(self, zip_codes: list[str]) -> tuple[int, int]:
         """Process a batch of zip codes with conservative timing"""
@@ -158,11 +359,22 @@ class MultiZipScraper:
             print("❌ Outside business hours - processing stopped")
             return 0, 0
         
+        if self.config['concurrency'] > 1:
+            return await self.process_zip_batch_concurrent(zip_codes)
+        
         print(f"🚀 Starting batch of {len(zip_codes)} zip codes...")
         
-        scraper = BrowserScraper()
+        parallel_sites = self.config['parallel_sites']
+        adaptive = self.config['adaptive_rate']  # Rate limiter paces every page instead of fixed delays
+        scraper = BrowserScraper(url_generator=self.url_generator,
+                                 rate_limiter=self.get_rate_limiter() if parallel_sites or adaptive else None,
+                                 capture_api=self.config['capture_api'],
+                                 lightweight=self.config['lightweight_pages'])
+        joinexploring_scraper = None
         try:
             await scraper.setup_browser()
+            if parallel_sites:
+                joinexploring_scraper = await scraper.open_sibling()
             
             successful = 0
             failed = 0
@@ -180,8 +392,8 @@ class MultiZipScraper:
                     break
                 
                 # Process zip code
-                success = await self.process_single_zip(zip_code, scraper)
-                self.session_stats['requests_in_session'] += 2  # BeAScout + JoinExploring
+                success = await self.process_single_zip(zip_code, scraper, site_delay=not adaptive,
+                                                        joinexploring_scraper=joinexploring_scraper)
                 
                 if success:
                     successful += 1
@@ -189,7 +401,7 @@ class MultiZipScraper:
                     failed += 1
                 
                 # Delay before next zip (except for last one)
-                if i < len(zip_codes) - 1:
+                if i < len(zip_codes) - 1 and not adaptive:
                     delay = self.calculate_delay(self.config['zip_delay_range'])
                     await self.wait_with_progress(
                         delay, 
@@ -199,8 +411,75 @@ class MultiZipScraper:
             return successful, failed
             
         finally:
+            self.collect_scraper_metrics(scraper, joinexploring_scraper)
             await scraper.close()
     
+    async def process_zip_batch_concurrent(self, zip_codes: list[str]) -> tuple[int, int]:
+        """
+        Process a batch with several browser contexts at once
+        
+        Page loads and AJAX waits overlap across contexts, while every navigation
+        waits on the shared per-host token bucket, so requests per minute per host
+        stay within config['host_requests_per_minute'] instead of fixed sleeps.
+        """
+        concurrency = min(self.config['concurrency'], len(zip_codes))
+        print(f"🚀 Starting batch of {len(zip_codes)} zip codes with {concurrency} browser contexts...")
+        
+        rate_limiter = self.get_rate_limiter()
+        pending = asyncio.Queue()
+        for zip_code in zip_codes:
+            pending.put_nowait(zip_code)
+        
+        results = {'successful': 0, 'failed': 0, 'stopped': False}
+        
+        async def worker(browser, index):
+            scraper = BrowserScraper(url_generator=self.url_generator, rate_limiter=rate_limiter,
+                                     capture_api=self.config['capture_api'],
+                                     lightweight=self.config['lightweight_pages'])
+            if not await scraper.setup_context(browser):
+                return
+            joinexploring_scraper = None
+            try:
+                if self.config['parallel_sites']:
+                    joinexploring_scraper = await scraper.open_sibling()
+                while not pending.empty() and not results['stopped']:
+                    # Contexts beyond the adaptive controller's current concurrency wait their turn
+                    if self.config['adaptive_rate'] and index >= self.get_rate_controller().concurrency:
+                        await asyncio.sleep(1)
+                        continue
+                    
+                    # Check if we should continue
+                    can_continue, reason = self.should_continue_processing()
+                    if not can_continue:
+                        print(f"🛑 Stopping processing: {reason}")
+                        results['stopped'] = True
+                        break
+                    
+                    zip_code = pending.get_nowait()
+                    success = await self.process_single_zip(zip_code, scraper, site_delay=False,
+                                                            joinexploring_scraper=joinexploring_scraper)
+                    results['successful' if success else 'failed'] += 1
+                    
+                    done = results['successful'] + results['failed']
+                    print(f"📊 Progress: {done}/{len(zip_codes)} | ✅ {results['successful']} | ❌ {results['failed']}")
+            finally:
+                self.collect_scraper_metrics(scraper, joinexploring_scraper)
+                await scraper.close()
+        
+        launcher = BrowserScraper()
+        try:
+            browser = await launcher.launch_browser()
+            await asyncio.gather(*(worker(browser, index) for index in range(concurrency)))
+        except Exception as e:
+            print(f"❌ Concurrent batch failed: {e}")
+        finally:
+            await launcher.close()
+        
+        for host, stats in rate_limiter.get_stats().items():
+            print(f"   🚦 {host}: {stats['requests']} requests, {stats['wait_seconds']}s rate-limit wait")
+        
+        return results['successful'], results['failed']
+    
     async def process_all_hne_zip_codes(self):
         """Process all zip codes from the default zip code file"""
         # Load zip codes
@@ -211,6 +490,18 @@ class MultiZipScraper:
         all_zips = zip_data['all_zipcodes']
         print(f"📋 Loaded {len(all_zips)} zip codes")
 
+        if self.config['fast_schedule']:
+            try:
+                fast_zips = load_fast_zips(self.config['fast_schedule'], allowed=all_zips)
+            except (OSError, ValueError, KeyError) as e:
+                fast_zips = []
+                print(f"⚠️  Could not load zip schedule {self.config['fast_schedule']}: {e}")
+            if fast_zips:
+                print(f"⚡ Fast mode: scraping {len(fast_zips)} of {len(all_zips)} zip codes from the learned schedule")
+                all_zips = fast_zips
+            else:
+                print(f"⚠️  Fast mode: no scheduled zip codes, scraping all {len(all_zips)}")
+
         # Create timestamped directory for this scraping session
         # Only create new session timestamp if not already provided via --session-id
         start_time = datetime.now()
@@ -228,6 +519,17 @@ class MultiZipScraper:
         # Create session directory (idempotent with exist_ok=True)
         Path(self.session_dir).mkdir(parents=True, exist_ok=True)
         
+        # Resume: only zips the checkpoint journal has no good pages for
+        journal = self.get_journal()
+        if journal.entries:
+            pending_zips = journal.pending_zips(all_zips, self.config['skip_failed'])
+            print(f"🔁 Resuming session: {len(all_zips) - len(pending_zips)} of {len(all_zips)} zip codes "
+                  f"already done, {len(pending_zips)} to scrape")
+            all_zips = pending_zips
+            if not all_zips:
+                print("✅ Nothing left to scrape")
+                return
+        
         # Process in batches
         batch_size = self.config['batch_size']
         batches = [all_zips[i:i + batch_size] for i in range(0, len(all_zips), batch_size)]
@@ -247,6 +549,7 @@ class MultiZipScraper:
                 break
             
             # Process batch
+            decreases_before = self.rate_controller.count_decreases() if self.rate_controller else 0
             successful, failed = await self.process_zip_batch(batch)
             total_successful += successful
             total_failed += failed
@@ -254,7 +557,11 @@ class MultiZipScraper:
             print(f"   ✅ Batch results: {successful} successful, {failed} failed")
             
             # Cooling period between batches (except last batch)
-            if batch_num < len(batches):
+            if batch_num < len(batches) and self.config['adaptive_rate'] and \
+                    self.get_rate_controller().count_decreases() == decreases_before:
+                print(f"   🚀 No back-off during the batch, skipping cooldown")
+                self.session_stats['requests_in_session'] = 0
+            elif batch_num < len(batches):
                 cooldown = self.calculate_delay(self.config['batch_cooldown'])
                 await self.wait_with_progress(
                     cooldown, 
@@ -272,6 +579,22 @@ class MultiZipScraper:
         print(f"   ⏱  Duration: {duration}")
         print(f"   📈 Success rate: {total_successful/(total_successful+total_failed):.1%}")
         print(f"   📁 Results saved in: {self.session_dir}")
+        wait_summary = self.summarize_wait_timings()
+        page_summary = self.summarize_page_metrics()
+        manifest_zips = self.manifest['zips'] if self.manifest else {}
+        unchanged_zips = sum(1 for entry in manifest_zips.values() if entry['unchanged'])
+        print(f"   ♻️  Unchanged since previous session: {unchanged_zips} of {len(manifest_zips)} zips")
+        for site, stats in page_summary.items():
+            print(f"   📦 {site} pages ({stats['profile']} profile): mean {stats['mean_kb']} KB, "
+                  f"{stats['mean_load_seconds']}s load, {stats['blocked_requests']} requests blocked")
+        rate_summary = self.rate_controller.get_summary() if self.rate_controller else None
+        if rate_summary:
+            budgets = ', '.join(f"{host} {rate}/min" for host, rate in rate_summary['requests_per_minute'].items())
+            print(f"   🚦 Adaptive pacing: {rate_summary['decisions']} decisions, {rate_summary['decreases']} back-offs; "
+                  f"final {budgets}, {rate_summary['concurrency']} context(s)")
+        for site, stats in wait_summary.items():
+            print(f"   ⏱  {site} results wait: mean {stats['mean_seconds']}s, max {stats['max_seconds']}s "
+                  f"over {stats['waits']} waits ({stats['timeouts']} timeouts)")
         
         # Create session summary file
         summary_file = f"{self.session_dir}/session_summary.json"
@@ -284,7 +607,13 @@ class MultiZipScraper:
             "successful_zips": total_successful,
             "failed_zips": total_failed,
             "success_rate": total_successful/(total_successful+total_failed) if (total_successful+total_failed) > 0 else 0,
-            "session_directory": self.session_dir
+            "session_directory": self.session_dir,
+            "unchanged_zips": unchanged_zips,
+            "fast_schedule": self.config['fast_schedule'],
+            "journal": self.get_journal().summary(),
+            "adaptive_rate": rate_summary,
+            "results_wait_seconds": wait_summary,
+            "page_loads": page_summary
         }
         
         with open(summary_file, 'w') as f:
@@ -294,8 +623,8 @@ class MultiZipScraper:
 
 
 # Test function with a few zip codes
-async def test_conservative_approach():
-    """Test with a small number of zip codes"""
+async def test_conservative_approach(configure=None):
+    """Test with a small number of zip codes (configure: optional callback applying CLI overrides)"""
     print("🧪 Testing Conservative Multi-Zip Scraper")
     print("=" * 50)
     
@@ -303,6 +632,8 @@ async def test_conservative_approach():
     test_zips = ['01720', '01420', '01453']
     
     scraper = MultiZipScraper()
+    if configure:
+        configure(scraper)
     
     # Initialize session directory and stats for test
     start_time = datetime.now()
@@ -342,6 +673,15 @@ if __name__ == '__main__':
     session_id = None
     skip_failed = False
     fallback_cache = False
+    concurrency = None
+    requests_per_minute = None
+    base_url = None
+    parallel_sites = False
+    capture_api = False
+    lightweight = False
+    fast = False
+    schedule_path = None
+    adaptive = False
 
     for i, arg in enumerate(sys.argv[1:], 1):
         if arg in ['test', 'full']:
@@ -352,11 +692,57 @@ if __name__ == '__main__':
             skip_failed = True
         elif arg == '--fallback-cache':
             fallback_cache = True
+        elif arg == '--concurrency' and i + 1 < len(sys.argv):
+            concurrency = int(sys.argv[i + 1])
+        elif arg == '--requests-per-minute' and i + 1 < len(sys.argv):
+            requests_per_minute = float(sys.argv[i + 1])
+        elif arg == '--base-url' and i + 1 < len(sys.argv):
+            base_url = sys.argv[i + 1]
+        elif arg == '--parallel-sites':
+            parallel_sites = True
+        elif arg == '--capture-api':
+            capture_api = True
+        elif arg == '--lightweight':
+            lightweight = True
+        elif arg == '--adaptive':
+            adaptive = True
+        elif arg == '--fast':
+            fast = True
+        elif arg == '--schedule' and i + 1 < len(sys.argv):
+            schedule_path = sys.argv[i + 1]
+
+    def apply_scraping_options(scraper):
+        """Apply concurrency / politeness budget / target URL overrides"""
+        if concurrency:
+            scraper.config['concurrency'] = concurrency
+        if requests_per_minute:
+            scraper.config['default_requests_per_minute'] = requests_per_minute
+            scraper.config['host_requests_per_minute'] = {
+                host: requests_per_minute for host in scraper.config['host_requests_per_minute']}
+            scraper.config['adaptive_max_requests_per_minute'] = max(
+                requests_per_minute, scraper.config['adaptive_max_requests_per_minute'])
+        if base_url:
+            scraper.url_generator = DualSourceURLGenerator.for_base_url(base_url)
+        if parallel_sites:
+            scraper.config['parallel_sites'] = True
+        if capture_api:
+            scraper.config['capture_api'] = True
+        if lightweight:
+            scraper.config['lightweight_pages'] = True
+        if adaptive:
+            scraper.config['adaptive_rate'] = True
+        if skip_failed:
+            scraper.config['skip_failed'] = True
+        if fallback_cache:
+            scraper.config['fallback_cache'] = True
+        if fast or schedule_path:
+            scraper.config['fast_schedule'] = schedule_path or str(SCHEDULE_FILE)
 
     if mode == 'test':
-        asyncio.run(test_conservative_approach())
+        asyncio.run(test_conservative_approach(apply_scraping_options))
     elif mode == 'full':
         scraper = MultiZipScraper()
+        apply_scraping_options(scraper)
 
         # Override session timestamp if provided
         if session_id:
@@ -371,4 +757,15 @@ if __name__ == '__main__':
         print("  python src/scripts/multi_zip_scraper.py test                    # Test with 3 zip codes")
         print("  python src/scripts/multi_zip_scraper.py full                    # Process all zip codes from file")
         print("  python src/scripts/multi_zip_scraper.py full --session-id ID    # Use specific session ID")
+        print("  python src/scripts/multi_zip_scraper.py full --concurrency 4    # Overlap zips in 4 browser contexts")
+        print("      --parallel-sites          # Fetch BeAScout and JoinExploring for a zip at the same time")
+        print("      --requests-per-minute N   # Per-host politeness budget (concurrent / parallel-sites modes)")
+        print("      --base-url URL            # Scrape a local stub server (tests/tools/stub_scrape_server.py)")
+        print("      --capture-api             # Also save search API JSON (<page>.api.json) for direct extraction")
+        print("      --lightweight             # Block images, media, fonts, stylesheets and trackers")
+        print("      --adaptive                # AIMD pacing from page latency/status/empty results/retries")
+        print("      --fast                    # Only the zips in the learned schedule (overlap_planner.py)")
+        print("      --skip-failed             # With --session-id: resume without retrying failed zips")
+        print("      --fallback-cache          # Use the last good page from an earlier session when a site fails")
+        print("      --schedule PATH           # Fast mode with a specific schedule file")
         print("  python src/scripts/multi_zip_scraper.py                         # Show usage")
\ No newline at end of file
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Learned Overlap Planner
+Mines historical scrape sessions (data/scraped/*) for which unit_keys each zip's
+BeAScout and JoinExploring pages returned, then finds per site the smallest zip
+subset that historically captured every unit. Writes a ranked zip schedule that
+MultiZipScraper's fast mode uses to scrape only that subset.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.pipeline.acquisition.coverage_planner import DEFAULT_NODE_LIMIT, minimum_set_cover
+from src.pipeline.core.debug_log_sink import DebugLogSink
+from src.pipeline.core.unit_identifier import UnitIdentifierNormalizer
+from src.pipeline.processing.html_extractor import (
+    deduplicate_units, filter_hne_units, get_source_name, process_html_file
+)
+from src.pipeline.processing.scrape_manifest import PAGE_SOURCES, get_pipeline_fingerprint
+from src.pipeline.processing.scraped_data_parser import ScrapedDataParser
+
+SCRAPED_DIR = project_root / 'data' / 'scraped'
+SCHEDULE_FILE = SCRAPED_DIR / 'zip_schedule.json'
+
+# Per-session cache of mined unit_keys (sessions never change once scraped)
+INCIDENCE_FILENAME = 'unit_incidence.json'
+
+# site -> zip -> unit_keys its page returned
+Incidence = Dict[str, Dict[str, Set[str]]]
+
+
+def find_sessions(scraped_dir=SCRAPED_DIR, limit: Optional[int] = None) -> List[Path]:
+    """Session directories holding scraped pages, oldest first (latest `limit` only if given)"""
+    scraped_dir = Path(scraped_dir)
+    if not scraped_dir.exists():
+        return []
+    sessions = sorted(path for path in scraped_dir.iterdir()
+                      if path.is_dir() and any(path.glob('beascout_*.html')))
+    return sessions[-limit:] if limit else sessions
+
+
+def extract_page_unit_keys(html_file: Path, backend: Optional[str] = None) -> Set[str]:
+    """unit_keys of the HNE units on one scraped page (quietly; debug records are discarded)"""
+    parser = ScrapedDataParser()
+    previous_sinks = UnitIdentifierNormalizer.set_debug_sinks((DebugLogSink(), DebugLogSink()))
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            units = process_html_file(str(html_file), get_source_name(html_file), backend)
+            records = parser.parse_units(filter_hne_units(deduplicate_units(units)))
+    finally:
+        UnitIdentifierNormalizer.set_debug_sinks(previous_sinks)
+    return {record['unit_key'] for record in records if record.get('unit_key')}
+
+
+def mine_session(session_path, backend: Optional[str] = None, use_cache: bool = True) -> Incidence:
+    """site -> zip -> unit_keys for one session (cached in the session directory)"""
+    session_path = Path(session_path)
+    cache_file = session_path / INCIDENCE_FILENAME
+    pipeline = get_pipeline_fingerprint()
+    if use_cache and cache_file.exists():
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('pipeline') == pipeline:
+            return {site: {zip_code: set(keys) for zip_code, keys in zips.items()}
+                    for site, zips in cached['sites'].items()}
+
+    incidence = {site: {} for site in PAGE_SOURCES}
+    for site in PAGE_SOURCES:
+        for html_file in sorted(session_path.glob(f'{site}_*.html')):
+            zip_code = html_file.stem.split('_', 1)[1]
+            incidence[site][zip_code] = extract_page_unit_keys(html_file, backend)
+
+    with open(cache_file, 'w', encoding='utf-8') as f:
+        json.dump({'pipeline': pipeline,
+                   'sites': {site: {zip_code: sorted(keys) for zip_code, keys in zips.items()}
+                             for site, zips in incidence.items()}}, f)
+    return incidence
+
+
+def build_incidence(sessions: Iterable, backend: Optional[str] = None, use_cache: bool = True) -> Incidence:
+    """Union of every session's incidence: a zip covers a unit if any session saw it there"""
+    combined = {site: {} for site in PAGE_SOURCES}
+    for session_path in sessions:
+        for site, zips in mine_session(session_path, backend, use_cache).items():
+            for zip_code, keys in zips.items():
+                combined[site].setdefault(zip_code, set()).update(keys)
+    return combined
+
+
+def rank_by_marginal_gain(zip_codes: Iterable[str], sets: Dict[str, Set], covered: Optional[Set] = None) -> List[Tuple[str, int]]:
+    """Order zips by how many not-yet-covered items each adds (most first); returns (zip, gain) pairs"""
+    remaining = set(zip_codes)
+    covered = set(covered or ())
+    ranked = []
+    while remaining:
+        zip_code = min(remaining, key=lambda z: (-len(sets.get(z, set()) - covered), -len(sets.get(z, set())), z))
+        gain = len(sets.get(zip_code, set()) - covered)
+        covered |= sets.get(zip_code, set())
+        ranked.append((zip_code, gain))
+        remaining.discard(zip_code)
+    return ranked
+
+
+def plan_schedule(incidence: Incidence, node_limit: int = DEFAULT_NODE_LIMIT) -> Dict:
+    """
+    Minimum historical cover per site and a ranked schedule of every zip
+
+    Returns:
+        Schedule with per-site covers, 'fast_zips' (union of the covers, ranked) and
+        'schedule' (all zips, fast ones first, by units each adds)
+    """
+    sites = {}
+    for site, zips in incidence.items():
+        universe = frozenset().union(*zips.values()) if zips else frozenset()
+        cover, optimal = minimum_set_cover(universe, {z: frozenset(keys) for z, keys in zips.items()}, node_limit)
+        sites[site] = {'units': len(universe), 'zips_scraped': len(zips), 'cover_zips': cover, 'optimal': optimal}
+
+    # Both pages are scraped per zip, so rank by (site, unit_key) pairs across the two sites
+    pairs = {}
+    for site, zips in incidence.items():
+        for zip_code, keys in zips.items():
+            pairs.setdefault(zip_code, set()).update((site, key) for key in keys)
+    fast_set = set().union(*(plan['cover_zips'] for plan in sites.values()))
+    ranked_fast = rank_by_marginal_gain(fast_set, pairs)
+    covered = set().union(*(pairs.get(z, set()) for z in fast_set))
+    ranked_rest = rank_by_marginal_gain(set(pairs) - fast_set, pairs, covered)
+
+    schedule = [{
+        'rank': rank,
+        'zip_code': zip_code,
+        'fast': zip_code in fast_set,
+        'new_units': gain,
+        'units': {site: len(incidence[site].get(zip_code, ())) for site in incidence},
+    } for rank, (zip_code, gain) in enumerate(ranked_fast + ranked_rest, 1)]
+
+    return {
+        'sites': sites,
+        'fast_zips': [zip_code for zip_code, _ in ranked_fast],
+        'schedule': schedule,
+    }
+
+
+def save_schedule(schedule: Dict, path=SCHEDULE_FILE):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(schedule, f, indent=2)
+
+
+def load_fast_zips(path=SCHEDULE_FILE, allowed: Optional[Iterable[str]] = None) -> List[str]:
+    """Ranked fast-mode zips from a saved schedule (restricted to `allowed` zips if given)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        fast_zips = json.load(f)['fast_zips']
+    if allowed is not None:
+        allowed = set(allowed)
+        fast_zips = [zip_code for zip_code in fast_zips if zip_code in allowed]
+    return fast_zips
+
+
+def print_schedule_report(schedule: Dict):
+    print(f"🧭 Learned overlap plan from {len(schedule['sessions'])} session(s)")
+    for site, plan in schedule['sites'].items():
+        status = "minimal" if plan['optimal'] else "best found"
+        print(f"   📍 {site}: {len(plan['cover_zips'])} of {plan['zips_scraped']} zips ({status}) "
+              f"captured all {plan['units']} units: {', '.join(plan['cover_zips'])}")
+    zip_count = len(schedule['schedule'])
+    fast_count = len(schedule['fast_zips'])
+    if zip_count:
+        print(f"   ⚡ Fast mode: {fast_count} of {zip_count} zips "
+              f"({fast_count * len(schedule['sites'])} vs {zip_count * len(schedule['sites'])} requests, "
+              f"{1 - fast_count / zip_count:.1%} fewer)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Learn a minimal zip schedule from historical scrape sessions")
+    parser.add_argument('sessions', nargs='*', help='Session directories (default: every session in data/scraped)')
+    parser.add_argument('--latest', type=int, help='Only use the latest N sessions in data/scraped')
+    parser.add_argument('--output', default=str(SCHEDULE_FILE),
+                        help=f'Schedule file for multi_zip_scraper.py --fast (default: {SCHEDULE_FILE})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Re-extract every page instead of using sessions\' {INCIDENCE_FILENAME}')
+    args = parser.parse_args()
+
+    sessions = [Path(session) for session in args.sessions] or find_sessions(limit=args.latest)
+    if not sessions:
+        print(f"❌ No scraped sessions found in {SCRAPED_DIR}")
+        return 1
+
+    start = time.monotonic()
+    incidence = build_incidence(sessions, use_cache=not args.no_cache)
+    schedule = {
+        'generated': datetime.now().isoformat(),
+        'sessions': [session.name for session in sessions],
+        **plan_schedule(incidence),
+    }
+    print_schedule_report(schedule)
+    save_schedule(schedule, args.output)
+    print(f"   📋 Schedule saved: {args.output} ({time.monotonic() - start:.1f}s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
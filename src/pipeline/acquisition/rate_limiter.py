@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Per-Host Token Bucket Rate Limiter
+Global politeness budget for concurrent scraping: every page load waits for a token
+from its host's bucket, so overlapping browser contexts never exceed the configured
+requests per minute per host. AdaptiveRateController tunes those budgets (and the
+number of browser contexts) AIMD-style from observed page health.
+"""
+
+import asyncio
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+# Default budget per host (matches the serial scraper's ~20s spacing between zips)
+DEFAULT_REQUESTS_PER_MINUTE = 3.0
+
+# Adaptive (AIMD) pacing: additive increase per healthy page, multiplicative decrease otherwise
+ADAPTIVE_MIN_REQUESTS_PER_MINUTE = 1.0
+ADAPTIVE_MAX_REQUESTS_PER_MINUTE = 10.0
+ADAPTIVE_INCREASE_PER_MINUTE = 0.5
+ADAPTIVE_DECREASE_FACTOR = 0.5
+CONCURRENCY_INCREASE_PAGES = 4     # Healthy pages in a row before adding a browser context
+SLOW_RESPONSE_FACTOR = 2.0         # Unhealthy when a page takes this multiple of the host's typical latency
+LATENCY_SMOOTHING = 0.2            # Weight of the newest page in the typical latency (EWMA)
+THROTTLE_STATUSES = frozenset({403, 408, 429})  # Plus every 5xx
+
+
+class TokenBucket:
+    """
+    Async token bucket: refills at `rate` tokens per second up to `capacity`
+    Waiters are served in arrival order
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0,
+                 clock: Callable[[], float] = time.monotonic, sleep=asyncio.sleep):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (bucket starts full)
+            clock: Monotonic time source (injectable for tests)
+            sleep: Async sleep function (injectable for tests)
+        """
+        if rate <= 0:
+            raise ValueError(f"Token bucket rate must be positive: {rate}")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+        self.total_wait = 0.0
+
+    def _refill(self):
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def set_rate(self, rate: float):
+        """Change the refill rate (tokens accrued so far are kept)"""
+        if rate <= 0:
+            raise ValueError(f"Token bucket rate must be positive: {rate}")
+        self._refill()
+        self.rate = rate
+
+    async def acquire(self) -> float:
+        """Wait for one token; returns seconds waited"""
+        async with self._lock:
+            waited = 0.0
+            self._refill()
+            while self.tokens < 1:
+                delay = (1 - self.tokens) / self.rate
+                await self._sleep(delay)
+                waited += delay
+                self._refill()
+            self.tokens -= 1
+            self.total_wait += waited
+            return waited
+
+
+class HostRateLimiter:
+    """Token bucket per host, configured as requests per minute"""
+
+    def __init__(self, host_limits: Optional[Dict[str, float]] = None,
+                 default_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE, burst: float = 1.0,
+                 clock: Callable[[], float] = time.monotonic, sleep=asyncio.sleep):
+        """
+        Args:
+            host_limits: Hostname -> requests per minute (overrides the default)
+            default_per_minute: Budget for hosts not listed in host_limits
+            burst: Requests a host may receive back to back before pacing starts
+        """
+        self.host_limits = dict(host_limits or {})
+        self.default_per_minute = default_per_minute
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: Dict[str, TokenBucket] = {}
+        self.request_counts: Dict[str, int] = {}
+
+    def bucket_for(self, host: str) -> TokenBucket:
+        """Get (or create) the bucket for a host"""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            per_minute = self.host_limits.get(host, self.default_per_minute)
+            bucket = TokenBucket(per_minute / 60.0, self.burst, self._clock, self._sleep)
+            self._buckets[host] = bucket
+        return bucket
+
+    def get_rate(self, host: str) -> float:
+        """Current budget for a host in requests per minute"""
+        return self.bucket_for(host).rate * 60.0
+
+    def set_rate(self, host: str, per_minute: float):
+        self.bucket_for(host).set_rate(per_minute / 60.0)
+
+    async def acquire(self, url: str) -> float:
+        """Wait for the URL's host budget; returns seconds waited"""
+        host = urlparse(url).hostname or ''
+        self.request_counts[host] = self.request_counts.get(host, 0) + 1
+        return await self.bucket_for(host).acquire()
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Requests and total wait seconds per host"""
+        return {host: {'requests': self.request_counts.get(host, 0), 'wait_seconds': round(bucket.total_wait, 1)}
+                for host, bucket in self._buckets.items()}
+
+
+class AdaptiveRateController:
+    """
+    AIMD pacing from live page signals
+    Every page observation is classified healthy or not (throttling/5xx status, failed
+    page, retries, unexpected empty results, latency well above the host's typical).
+    Healthy pages add to the host's requests-per-minute budget and, after a streak,
+    allow one more browser context; an unhealthy page multiplies the budget down and
+    halves the contexts. Every decision is kept and appended to a JSONL log.
+    """
+
+    def __init__(self, limiter: HostRateLimiter, max_concurrency: int = 1,
+                 min_per_minute: float = ADAPTIVE_MIN_REQUESTS_PER_MINUTE,
+                 max_per_minute: float = ADAPTIVE_MAX_REQUESTS_PER_MINUTE,
+                 increase_per_minute: float = ADAPTIVE_INCREASE_PER_MINUTE,
+                 decrease_factor: float = ADAPTIVE_DECREASE_FACTOR,
+                 log_path=None):
+        """
+        Args:
+            limiter: Rate limiter whose per-host budgets are adjusted
+            max_concurrency: Upper bound for browser contexts (starts at 1)
+            min_per_minute / max_per_minute: Bounds for each host's budget
+            increase_per_minute: Added to a host's budget after a healthy page
+            decrease_factor: Budget multiplier after an unhealthy page
+            log_path: Optional JSONL file every decision is appended to
+        """
+        self.limiter = limiter
+        self.max_concurrency = max(1, max_concurrency)
+        self.concurrency = 1
+        self.min_per_minute = min_per_minute
+        self.max_per_minute = max_per_minute
+        self.increase_per_minute = increase_per_minute
+        self.decrease_factor = decrease_factor
+        self.log_path = Path(log_path) if log_path else None
+        self.latency: Dict[str, float] = {}  # Host -> typical page seconds (EWMA)
+        self.healthy_streak = 0
+        self.decisions: List[dict] = []
+
+    def classify(self, host: str, latency_seconds: Optional[float] = None, status: Optional[int] = None,
+                 empty: bool = False, retries: int = 0, failed: bool = False) -> List[str]:
+        """Reasons a page observation is unhealthy ([] = healthy)"""
+        reasons = []
+        if failed:
+            reasons.append('failed')
+        if status is not None and (status in THROTTLE_STATUSES or status >= 500):
+            reasons.append(f'http_{status}')
+        if retries:
+            reasons.append(f'retries_{retries}')
+        if empty:
+            reasons.append('empty_result')
+        typical = self.latency.get(host)
+        if latency_seconds is not None and typical and latency_seconds > typical * SLOW_RESPONSE_FACTOR:
+            reasons.append(f'slow_{latency_seconds:.1f}s')
+        return reasons
+
+    def observe(self, url: str, latency_seconds: Optional[float] = None, status: Optional[int] = None,
+                empty: bool = False, retries: int = 0, failed: bool = False, **context) -> dict:
+        """
+        Apply one page observation to its host's budget and the concurrency
+        Extra keyword context (e.g. site, zip_code) is stored with the decision
+
+        Returns:
+            The logged decision
+        """
+        host = urlparse(url).hostname or url
+        reasons = self.classify(host, latency_seconds, status, empty, retries, failed)
+        rate = self.limiter.get_rate(host)
+        concurrency = self.concurrency
+
+        if reasons:
+            new_rate = max(self.min_per_minute, rate * self.decrease_factor)
+            self.concurrency = max(1, self.concurrency // 2)
+            self.healthy_streak = 0
+        else:
+            new_rate = min(self.max_per_minute, rate + self.increase_per_minute)
+            self.healthy_streak += 1
+            if self.healthy_streak >= CONCURRENCY_INCREASE_PAGES and self.concurrency < self.max_concurrency:
+                self.concurrency += 1
+                self.healthy_streak = 0
+        if latency_seconds is not None and not failed:  # Slow pages count, so a lasting slowdown becomes typical
+            typical = self.latency.get(host, latency_seconds)
+            self.latency[host] = typical + LATENCY_SMOOTHING * (latency_seconds - typical)
+        self.limiter.set_rate(host, new_rate)
+
+        decision = {
+            'time': datetime.now().isoformat(),
+            'host': host,
+            **context,
+            'signals': {'latency_seconds': latency_seconds, 'status': status, 'empty': empty,
+                        'retries': retries, 'failed': failed},
+            'reasons': reasons,
+            'action': 'decrease' if reasons else 'increase',
+            'requests_per_minute': [round(rate, 2), round(new_rate, 2)],
+            'concurrency': [concurrency, self.concurrency],
+        }
+        self.decisions.append(decision)
+        if self.log_path:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(decision) + '\n')
+        return decision
+
+    def count_decreases(self) -> int:
+        return sum(1 for decision in self.decisions if decision['action'] == 'decrease')
+
+    def get_summary(self) -> dict:
+        """Decision counts and final budgets per host"""
+        return {
+            'decisions': len(self.decisions),
+            'decreases': self.count_decreases(),
+            'concurrency': self.concurrency,
+            'requests_per_minute': {host: round(self.limiter.get_rate(host), 2)
+                                    for host in sorted({d['host'] for d in self.decisions})},
+        }
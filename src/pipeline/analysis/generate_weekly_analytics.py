@@ -13,12 +13,13 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
-from openpyxl import load_workbook
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.pipeline.core.workbook_reader import read_workbook_values
+
 class WeeklyAnalyticsGenerator:
     """Generates weekly analytics from BeAScout Quality Reports"""
 
@@ -116,13 +117,13 @@ class WeeklyAnalyticsGenerator:
     def extract_executive_summary_stats(self, excel_path: Path) -> Dict:
         """Extract key statistics from Executive Summary sheet"""
         try:
-            # Load workbook and get Executive Summary sheet
-            workbook = load_workbook(excel_path, data_only=True)
+            # Load workbook values and get Executive Summary sheet
+            workbook = read_workbook_values(excel_path)
 
-            if "Executive Summary" not in workbook.sheetnames:
+            if "Executive Summary" not in workbook:
                 raise ValueError("Executive Summary sheet not found in workbook")
 
-            ws = workbook["Executive Summary"]
+            rows = workbook["Executive Summary"]
 
             # Initialize stats
             stats = {
@@ -134,28 +135,27 @@ class WeeklyAnalyticsGenerator:
             }
 
             # Scan through rows looking for key metrics
-            for row in ws.iter_rows():
-                for cell in row:
-                    if cell.value is None:
+            for row in rows:
+                for column, value in enumerate(row):
+                    if value is None:
                         continue
 
-                    cell_text = str(cell.value).strip()
+                    cell_text = str(value).strip()
+                    # Metric value sits in the adjacent cell
+                    next_value = row[column + 1] if column + 1 < len(row) else None
 
                     # Extract total units
                     if "Total Units Analyzed" in cell_text:
-                        # Look for number in adjacent cell
-                        next_cell = ws.cell(row=cell.row, column=cell.column + 1)
-                        if next_cell.value is not None:
+                        if next_value is not None:
                             try:
-                                stats["total_units"] = int(next_cell.value)
+                                stats["total_units"] = int(next_value)
                             except (ValueError, TypeError):
                                 pass
 
                     # Extract average quality score
                     elif "Average Quality Score" in cell_text:
-                        next_cell = ws.cell(row=cell.row, column=cell.column + 1)
-                        if next_cell.value is not None:
-                            value_str = str(next_cell.value)
+                        if next_value is not None:
+                            value_str = str(next_value)
                             # Extract number before % sign
                             if "%" in value_str:
                                 try:
@@ -165,52 +165,44 @@ class WeeklyAnalyticsGenerator:
 
                     # Extract units missing from BeAScout
                     elif "Units missing from BeAScout" in cell_text:
-                        next_cell = ws.cell(row=cell.row, column=cell.column + 1)
-                        if next_cell.value is not None:
+                        if next_value is not None:
                             try:
-                                stats["units_missing_from_beascout"] = int(next_cell.value)
+                                stats["units_missing_from_beascout"] = int(next_value)
                             except (ValueError, TypeError):
                                 pass
 
                     # Extract units with web presence NOT in Key Three
                     elif "Units with web presence NOT in Key Three" in cell_text:
-                        next_cell = ws.cell(row=cell.row, column=cell.column + 1)
-                        if next_cell.value is not None:
+                        if next_value is not None:
                             try:
-                                stats["web_only_units"] = int(next_cell.value)
+                                stats["web_only_units"] = int(next_value)
                             except (ValueError, TypeError):
                                 pass
 
                     # Extract grade distribution
                     elif "Grade A (90%+)" in cell_text:
-                        next_cell = ws.cell(row=cell.row, column=cell.column + 1)
-                        if next_cell.value is not None:
-                            stats["grade_distribution"]["A"] = self._extract_count_and_percentage(next_cell.value)
+                        if next_value is not None:
+                            stats["grade_distribution"]["A"] = self._extract_count_and_percentage(next_value)
 
                     elif "Grade B (80-89%)" in cell_text:
-                        next_cell = ws.cell(row=cell.row, column=cell.column + 1)
-                        if next_cell.value is not None:
-                            stats["grade_distribution"]["B"] = self._extract_count_and_percentage(next_cell.value)
+                        if next_value is not None:
+                            stats["grade_distribution"]["B"] = self._extract_count_and_percentage(next_value)
 
                     elif "Grade C (70-79%)" in cell_text:
-                        next_cell = ws.cell(row=cell.row, column=cell.column + 1)
-                        if next_cell.value is not None:
-                            stats["grade_distribution"]["C"] = self._extract_count_and_percentage(next_cell.value)
+                        if next_value is not None:
+                            stats["grade_distribution"]["C"] = self._extract_count_and_percentage(next_value)
 
                     elif "Grade D (60-69%)" in cell_text:
-                        next_cell = ws.cell(row=cell.row, column=cell.column + 1)
-                        if next_cell.value is not None:
-                            stats["grade_distribution"]["D"] = self._extract_count_and_percentage(next_cell.value)
+                        if next_value is not None:
+                            stats["grade_distribution"]["D"] = self._extract_count_and_percentage(next_value)
 
                     elif "Grade F (<60%)" in cell_text:
-                        next_cell = ws.cell(row=cell.row, column=cell.column + 1)
-                        if next_cell.value is not None:
-                            stats["grade_distribution"]["F"] = self._extract_count_and_percentage(next_cell.value)
+                        if next_value is not None:
+                            stats["grade_distribution"]["F"] = self._extract_count_and_percentage(next_value)
 
                     elif "Grade N/A (Missing)" in cell_text:
-                        next_cell = ws.cell(row=cell.row, column=cell.column + 1)
-                        if next_cell.value is not None:
-                            stats["grade_distribution"]["N/A"] = self._extract_count_and_percentage(next_cell.value)
+                        if next_value is not None:
+                            stats["grade_distribution"]["N/A"] = self._extract_count_and_percentage(next_value)
 
             print(f"✅ Extracted executive summary statistics")
             return stats
@@ -250,27 +242,25 @@ class WeeklyAnalyticsGenerator:
     def extract_unit_scores(self, excel_path: Path) -> Dict[str, float]:
         """Extract unit scores from district sheets for comparison"""
         try:
-            workbook = load_workbook(excel_path, data_only=True)
+            workbook = read_workbook_values(excel_path)
             unit_scores = {}
 
             # Process each district sheet (skip Executive Summary)
-            for sheet_name in workbook.sheetnames:
+            for sheet_name, rows in workbook.items():
                 if sheet_name == "Executive Summary":
                     continue
 
-                ws = workbook[sheet_name]
-
                 # Find header row (should contain "Unit Identifier" and "Quality Score")
                 header_row = None
                 unit_col = None
                 score_col = None
 
-                for row_num, row in enumerate(ws.iter_rows(min_row=1, max_row=15), 1):
-                    for col_num, cell in enumerate(row, 1):
-                        if cell.value and "Unit Identifier" in str(cell.value):
+                for row_num, row in enumerate(rows[:15], 1):
+                    for col_num, value in enumerate(row, 1):
+                        if value and "Unit Identifier" in str(value):
                             header_row = row_num
                             unit_col = col_num
-                        elif cell.value and "Quality Score" in str(cell.value):
+                        elif value and "Quality Score" in str(value):
                             score_col = col_num
 
                     if header_row and unit_col and score_col:
@@ -281,14 +271,14 @@ class WeeklyAnalyticsGenerator:
                     continue
 
                 # Extract unit data starting from row after header
-                for row in ws.iter_rows(min_row=header_row + 1):
-                    unit_cell = row[unit_col - 1]
-                    score_cell = row[score_col - 1]
+                for row in rows[header_row:]:
+                    unit_value = row[unit_col - 1]
+                    score_value = row[score_col - 1]
 
-                    if unit_cell.value and score_cell.value is not None:
-                        unit_identifier = str(unit_cell.value).strip()
+                    if unit_value and score_value is not None:
+                        unit_identifier = str(unit_value).strip()
                         try:
-                            score = float(score_cell.value)
+                            score = float(score_value)
                             unit_scores[unit_identifier] = score
                         except (ValueError, TypeError):
                             pass
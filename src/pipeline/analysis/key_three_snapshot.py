@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Key Three Snapshot Store
+Content-addressed cache of the parsed Key Three registry under
+data/cache/key_three/<sha256 of input file>/. A snapshot holds the cleaned member
+records, the validator's unit registry (members grouped per UnitKey, district
+resolved) and the email generator's unit index, pickled (protocol 5). Unchanged
+input skips the Excel read, org name parsing and unit grouping; snapshots built by
+different parsing code are rebuilt.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from src.dev.parsing.key_three_parser import (
+    format_unitcommorgname_parse_stats, get_unitcommorgname_parse_stats, parse_unitcommorgname,
+    reset_unitcommorgname_parse_stats,
+)
+from src.pipeline.core.district_mapping import get_district_for_town
+from src.pipeline.core.key_three_loader import load_key_three_members
+from src.pipeline.core.unit_identifier import UnitKey
+
+KEY_THREE_CACHE_DIR = PROJECT_ROOT / 'data' / 'cache' / 'key_three'
+SNAPSHOT_FILENAME = 'snapshot.pkl'
+SNAPSHOT_PROTOCOL = 5
+
+# Code whose output is stored in a snapshot (a change rebuilds it)
+SNAPSHOT_SOURCE_FILES = [
+    'src/dev/parsing/key_three_parser.py',
+    'src/pipeline/analysis/key_three_snapshot.py',
+    'src/pipeline/core/district_mapping.py',
+    'src/pipeline/core/hne_towns.py',
+    'src/pipeline/core/key_three_loader.py',
+    'src/pipeline/core/town_matcher.py',
+    'src/pipeline/core/unit_identifier.py',
+]
+
+
+def hash_file(file_path) -> str:
+    """sha256 of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def get_snapshot_code_fingerprint() -> str:
+    digest = hashlib.sha256()
+    for source in SNAPSHOT_SOURCE_FILES:
+        digest.update(source.encode())
+        digest.update((PROJECT_ROOT / source).read_bytes())
+    return digest.hexdigest()
+
+
+def get_snapshot_path(source_sha256: str, cache_dir=KEY_THREE_CACHE_DIR) -> Path:
+    return Path(cache_dir) / source_sha256 / SNAPSHOT_FILENAME
+
+
+def read_key_three_members(file_path) -> List[Dict[str, str]]:
+    """Member records from the Key Three Excel export or its JSON conversion"""
+    if Path(file_path).suffix.lower() == '.xlsx':
+        return load_key_three_members(file_path)
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    # Handle both data structures: key_three_units or key_three_members
+    return data.get('key_three_units', data.get('key_three_members', []))
+
+
+def build_unit_registry(members: List[Dict]) -> Dict[UnitKey, Dict]:
+    """
+    Consolidate Key Three members by typed UnitKey (type, 4-digit number, canonical town)
+    with district resolved from the town. Org names that spell one unit differently
+    ("Pack 1 ..." / "Pack 0001 ...") merge into one unit; members without a parseable
+    type, number and town are left out and reported
+    """
+    key_three_units_by_key = {}
+    dropped_org_names = []
+    merged_org_names = {}
+    for member in members:
+        unit_display = member.get('unit_display', '') or member.get('displayname', '')
+        unit_org_name = member.get('unit_org_name', '') or member.get('unitcommorgname', '')
+        district = member.get('district', '') or member.get('districtname', '')
+
+        if unit_display and unit_org_name:
+            unit_info = parse_unitcommorgname(unit_org_name)
+            unit_key = None
+            if unit_info and unit_info.get('unit_town'):
+                unit_key = UnitKey.from_parts(unit_info.get('unit_type'), unit_info.get('unit_number'),
+                                              unit_info['unit_town'])
+            if unit_key is None:
+                dropped_org_names.append(unit_org_name)
+                continue
+
+            if unit_key not in key_three_units_by_key:
+                town = unit_key.unit_town
+                # Use proper district mapping based on town, not Key Three district data
+                proper_district = get_district_for_town(town)
+                # If town not found in mapping, fall back to cleaned Key Three district
+                if not proper_district:
+                    proper_district = district.replace(' 01', '').replace(' 02', '').replace(' 03', '').replace(' 04', '').strip()
+                    # Never allow "Special" district - these should be mapped properly
+                    if proper_district == "Special":
+                        proper_district = "Unknown"
+
+                # Initialize unit record if first time seeing this unit
+                key_three_units_by_key[unit_key] = {
+                    'unit_key': str(unit_key),
+                    'unit_type': unit_key.unit_type,
+                    'unit_number': unit_key.unit_number,
+                    'unit_town': town,
+                    'chartered_organization': unit_info.get('chartered_organization', ''),
+                    'district': proper_district,
+                    'original_unitcommorgname': unit_org_name,
+                    'key_three_members': []
+                }
+            elif key_three_units_by_key[unit_key]['original_unitcommorgname'] != unit_org_name:
+                merged_org_names[unit_org_name] = unit_key
+
+            # Add this member to the unit
+            member_record = {
+                'fullname': member.get('member_name', '') or member.get('fullname', ''),
+                'email': member.get('email', ''),
+                'phone': member.get('phone', ''),
+                'position': member.get('position', ''),
+                'status': member.get('ypt_status', '') or member.get('yptstatus', '') or 'ACTIVE'
+            }
+            key_three_units_by_key[unit_key]['key_three_members'].append(member_record)
+
+    for unit_org_name, unit_key in merged_org_names.items():
+        print(f"🔗 Key Three: '{unit_org_name}' merged into {unit_key} "
+              f"('{key_three_units_by_key[unit_key]['original_unitcommorgname']}')")
+    if dropped_org_names:
+        unique_dropped = sorted(set(dropped_org_names))
+        print(f"⚠️  Key Three: {len(dropped_org_names)} member(s) without a unit type/number/town left out: "
+              f"{', '.join(repr(name) for name in unique_dropped)}")
+    return key_three_units_by_key
+
+
+def build_unit_index(members: List[Dict]) -> Dict[str, List[Dict]]:
+    """
+    Key Three members indexed by scraped-data unit_key ("Troop 0001 Acton", 4-digit number)
+    Leading zeros are kept for matching - stripped only for display
+    """
+    key_three_index = {}
+    for member in members:
+        unit_info = parse_unitcommorgname(member.get('unit_org_name', ''))
+        if unit_info and unit_info.get('unit_town'):
+            unit_key = f"{unit_info['unit_type']} {unit_info['unit_number']} {unit_info['unit_town']}"
+            key_three_index.setdefault(unit_key, []).append(member)
+    return key_three_index
+
+
+def build_snapshot(file_path, source_sha256: str) -> dict:
+    """Parse a Key Three file into a snapshot (members, unit registry, unit index)"""
+    members = read_key_three_members(file_path)
+    reset_unitcommorgname_parse_stats()
+    registry = build_unit_registry(members)
+    index = build_unit_index(members)
+    return {
+        'source_file': str(file_path),
+        'source_sha256': source_sha256,
+        'code': get_snapshot_code_fingerprint(),
+        'created': datetime.now().isoformat(),
+        'members': members,
+        'registry': registry,
+        'index': index,
+        'parse_stats': get_unitcommorgname_parse_stats(),
+    }
+
+
+def save_snapshot(snapshot: dict, cache_dir=KEY_THREE_CACHE_DIR) -> Path:
+    """Write a snapshot atomically (a concurrent reader never sees a partial file)"""
+    snapshot_path = get_snapshot_path(snapshot['source_sha256'], cache_dir)
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = snapshot_path.with_suffix(f'.{os.getpid()}.tmp')
+    with open(temp_path, 'wb') as f:
+        pickle.dump(snapshot, f, protocol=SNAPSHOT_PROTOCOL)
+    os.replace(temp_path, snapshot_path)
+    return snapshot_path
+
+
+def load_cached_snapshot(source_sha256: str, cache_dir=KEY_THREE_CACHE_DIR):
+    """Stored snapshot for an input hash if it was built by the current parsing code"""
+    try:
+        with open(get_snapshot_path(source_sha256, cache_dir), 'rb') as f:
+            snapshot = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get('code') != get_snapshot_code_fingerprint():
+        return None
+    return snapshot
+
+
+def load_key_three_snapshot(file_path, cache_dir=KEY_THREE_CACHE_DIR, use_cache: bool = True) -> dict:
+    """
+    Key Three snapshot for a file, reused when its sha256 matches a stored one
+    Returns dict with members, registry, index, source_sha256 and 'cached' (reused or built)
+    """
+    source_sha256 = hash_file(file_path)
+    snapshot = load_cached_snapshot(source_sha256, cache_dir) if use_cache else None
+    if snapshot is not None:
+        print(f"♻️  Reusing Key Three snapshot {source_sha256[:12]} ({len(snapshot['members'])} members, "
+              f"{len(snapshot['registry'])} units)")
+        print(f"🧮 unitcommorgname (when built): {format_unitcommorgname_parse_stats(snapshot['parse_stats'])}")
+        snapshot['cached'] = True
+        return snapshot
+
+    snapshot = build_snapshot(file_path, source_sha256)
+    print(f"🧮 unitcommorgname: {format_unitcommorgname_parse_stats(snapshot['parse_stats'])}")
+    if use_cache:
+        snapshot_path = save_snapshot(snapshot, cache_dir)
+        print(f"💾 Saved Key Three snapshot: {snapshot_path}")
+    snapshot['cached'] = False
+    return snapshot
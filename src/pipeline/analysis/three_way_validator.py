@@ -18,11 +18,10 @@ from enum import Enum
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.append(str(project_root))
 
-from src.pipeline.core.unit_identifier import UnitIdentifierNormalizer
+from src.pipeline.core.unit_identifier import UnitIdentifierNormalizer, UnitKey
 from src.pipeline.core.session_utils import SessionManager, session_logging
 from src.pipeline.processing.scraped_data_parser import ScrapedDataParser
-from src.dev.parsing.key_three_parser import KeyThreeParser
-from src.pipeline.core.district_mapping import get_district_for_town
+from src.pipeline.analysis.key_three_snapshot import build_unit_registry, load_key_three_snapshot
 
 class ValidationStatus(Enum):
     """Unit validation status categories"""
@@ -43,6 +42,43 @@ class ValidationResult:
         if self.issues is None:
             self.issues = []
 
+def index_scraped_units(units: List[Dict]) -> Dict[UnitKey, Dict]:
+    """
+    Scraped units by typed UnitKey built from each record's unit_type, unit_number and
+    unit_town (last unit wins); records missing a part are left out and reported
+    """
+    units_by_key = {}
+    dropped = []
+    for unit in units:
+        key = UnitKey.from_parts(unit.get('unit_type'), unit.get('unit_number'), unit.get('unit_town'))
+        if key is None:
+            dropped.append(unit.get('unit_key') or unit.get('primary_identifier') or '?')
+            continue
+        units_by_key[key] = unit
+    if dropped:
+        print(f"⚠️  {len(dropped)} scraped unit(s) without a unit type/number/town left out: "
+              f"{', '.join(repr(unit_key) for unit_key in dropped)}")
+    return units_by_key
+
+
+def join_units(key_three_by_key: Dict[UnitKey, Dict],
+               scraped_by_key: Dict[UnitKey, Dict]) -> List[Tuple[UnitKey, ValidationStatus, Any, Any]]:
+    """
+    Full outer hash join of Key Three and scraped units
+    Returns (unit key, status, Key Three record, scraped unit) per unit, sorted by unit_key string
+    """
+    joined = []
+    for key, key_three_unit in key_three_by_key.items():
+        scraped_unit = scraped_by_key.get(key)
+        status = ValidationStatus.BOTH_SOURCES if scraped_unit is not None else ValidationStatus.KEY_THREE_ONLY
+        joined.append((key, status, key_three_unit, scraped_unit))
+    for key, scraped_unit in scraped_by_key.items():
+        if key not in key_three_by_key:
+            joined.append((key, ValidationStatus.WEB_ONLY, None, scraped_unit))
+    joined.sort(key=lambda row: str(row[0]))
+    return joined
+
+
 class ThreeWayValidator:
     """
     Comprehensive unit validation engine
@@ -51,19 +87,20 @@ class ThreeWayValidator:
 
     def __init__(self, session_manager=None):
         self.key_three_units = []
+        self.key_three_registry = None
         self.scraped_units = []
+        self.scraped_by_key = None
         self.validation_results = []
         self.session_manager = session_manager
         
     def load_key_three_data(self, file_path: str) -> bool:
-        """Load Key Three foundation data (169 units)"""
+        """Load Key Three foundation data (169 units), reusing the snapshot for unchanged input"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Handle both data structures: key_three_units or key_three_members
-                self.key_three_units = data.get('key_three_units', data.get('key_three_members', []))
-                print(f"📋 Loaded {len(self.key_three_units)} Key Three units with member data")
-                return True
+            snapshot = load_key_three_snapshot(file_path)
+            self.key_three_units = snapshot['members']
+            self.key_three_registry = snapshot['registry']
+            print(f"📋 Loaded {len(self.key_three_units)} Key Three units with member data")
+            return True
         except Exception as e:
             print(f"❌ Failed to load Key Three data: {e}")
             return False
@@ -74,6 +111,7 @@ class ThreeWayValidator:
             with open(file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
                 self.scraped_units = data.get('units_with_scores', [])
+                self.scraped_by_key = index_scraped_units(self.scraped_units)
                 print(f"🌐 Loaded {len(self.scraped_units)} scraped units")
                 return True
         except Exception as e:
@@ -92,71 +130,19 @@ class ThreeWayValidator:
         print(f"   Key Three units: {len(self.key_three_units)}")
         print(f"   Scraped units: {len(self.scraped_units)}")
         
-        # Consolidate Key Three members by unit to match working format
-        key_three_units_by_key = {}
-        for member in self.key_three_units:
-            unit_display = member.get('unit_display', '') or member.get('displayname', '')
-            unit_org_name = member.get('unit_org_name', '') or member.get('unitcommorgname', '')
-            district = member.get('district', '') or member.get('districtname', '')
-            
-            if unit_display and unit_org_name:
-                parser = KeyThreeParser("")
-                unit_info = parser.extract_unit_info_from_unitcommorgname(unit_org_name)
-                
-                if unit_info and unit_info.get('unit_town'):
-                    town = unit_info['unit_town']
-                    unit_key = f"{unit_display} {town}"
-                    
-                    # Use proper district mapping based on town, not Key Three district data
-                    proper_district = get_district_for_town(town)
-                    # If town not found in mapping, fall back to cleaned Key Three district
-                    if not proper_district:
-                        proper_district = district.replace(' 01', '').replace(' 02', '').replace(' 03', '').replace(' 04', '').strip()
-                        # Never allow "Special" district - these should be mapped properly
-                        if proper_district == "Special":
-                            proper_district = "Unknown"
-                    
-                    # Initialize unit record if first time seeing this unit
-                    if unit_key not in key_three_units_by_key:
-                        key_three_units_by_key[unit_key] = {
-                            'unit_key': unit_key,
-                            'unit_type': unit_info.get('unit_type', ''),
-                            'unit_number': unit_info.get('unit_number', ''),
-                            'unit_town': town,
-                            'chartered_organization': unit_info.get('chartered_organization', ''),
-                            'district': proper_district,
-                            'original_unitcommorgname': unit_org_name,
-                            'key_three_members': []
-                        }
-                    
-                    # Add this member to the unit
-                    member_record = {
-                        'fullname': member.get('member_name', '') or member.get('fullname', ''),
-                        'email': member.get('email', ''),
-                        'phone': member.get('phone', ''),
-                        'position': member.get('position', ''),
-                        'status': member.get('ypt_status', '') or member.get('yptstatus', '') or 'ACTIVE'
-                    }
-                    key_three_units_by_key[unit_key]['key_three_members'].append(member_record)
+        # Units by typed UnitKey, built once where each source is loaded
+        key_three_by_key = self.key_three_registry
+        if key_three_by_key is None:
+            key_three_by_key = build_unit_registry(self.key_three_units)
+        scraped_by_key = self.scraped_by_key
+        if scraped_by_key is None:
+            scraped_by_key = index_scraped_units(self.scraped_units)
         
-        key_three_keys = set(key_three_units_by_key.keys())
-        key_three_dict = key_three_units_by_key
-        
-        # Normalize scraped units to ensure 4-digit unit numbers
-        scraped_keys = set()
-        scraped_dict = {}
-        for unit in self.scraped_units:
-            unit_key = unit.get('unit_key', '')
-            if unit_key:
-                # Convert "Crew 204 West Boylston" -> "Crew 0204 West Boylston"
-                parts = unit_key.split()
-                if len(parts) >= 3:
-                    unit_type = parts[0]
-                    unit_number = parts[1].zfill(4)  # Pad to 4 digits
-                    town = ' '.join(parts[2:])
-                    normalized_key = f"{unit_type} {unit_number} {town}"
-                    scraped_keys.add(normalized_key)
-                    scraped_dict[normalized_key] = unit
+        # Single hash join over both sources, in unit_key order
+        joined = join_units(key_three_by_key, scraped_by_key)
+        units_by_status = {status: [] for status in ValidationStatus}
+        for unit_key, status, _, _ in joined:
+            units_by_status[status].append(str(unit_key))
         
         # Create debug log file using session ID if available
         if self.session_manager and self.session_manager.session_id:
@@ -165,6 +151,39 @@ class ThreeWayValidator:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         debug_file = f'data/debug/cross_reference_validation_debug_{timestamp}.log'
         os.makedirs('data/debug', exist_ok=True)
+        self._write_cross_reference_log(debug_file, joined, units_by_status)
+        print(f"📋 Cross-reference debug log saved: {debug_file}")
+        
+        print(f"   Total unique units across both sources: {len(joined)}")
+        print(f"   Key Three units: {len(key_three_by_key)}")
+        print(f"   Scraped units: {len(scraped_by_key)}")
+
+        # Validate each unit (from either source)
+        validation_results = []
+        for unit_key, status, key_three_data, scraped_data in joined:
+            result = ValidationResult(
+                unit_key=str(unit_key),
+                status=status,
+                key_three_data=key_three_data,  # Already in correct format (None for web-only)
+                scraped_data=scraped_data,
+                issues=[]
+            )
+
+            # Identify specific issues
+            self._analyze_unit_issues(result)
+
+            validation_results.append(result)
+        
+        self.validation_results = validation_results
+        return validation_results
+    
+    def _write_cross_reference_log(self, debug_file: str, joined: List[Tuple], units_by_status: Dict):
+        """Write the cross-reference debug log (unit key lists per source and join outcome)"""
+        key_three_only = units_by_status[ValidationStatus.KEY_THREE_ONLY]
+        scraped_only = units_by_status[ValidationStatus.WEB_ONLY]
+        matches = units_by_status[ValidationStatus.BOTH_SOURCES]
+        key_three_keys = [str(unit_key) for unit_key, status, _, _ in joined if status != ValidationStatus.WEB_ONLY]
+        scraped_keys = [str(unit_key) for unit_key, status, _, _ in joined if status != ValidationStatus.KEY_THREE_ONLY]
         
         with open(debug_file, 'w', encoding='utf-8') as f:
             f.write("=== CROSS-REFERENCE VALIDATION DEBUG LOG ===\n\n")
@@ -173,29 +192,26 @@ class ThreeWayValidator:
             
             # Log all Key Three unit keys
             f.write("KEY THREE UNIT KEYS:\n")
-            for unit_key in sorted(key_three_keys):
+            for unit_key in key_three_keys:
                 f.write(f"  {unit_key}\n")
             
             f.write(f"\nSCRAPED UNIT KEYS:\n")
-            for unit_key in sorted(scraped_keys):
+            for unit_key in scraped_keys:
                 f.write(f"  {unit_key}\n")
             
             # Log units only in Key Three
-            key_three_only = key_three_keys - scraped_keys
             f.write(f"\nUNITS ONLY IN KEY THREE ({len(key_three_only)}):\n")
-            for unit_key in sorted(key_three_only):
+            for unit_key in key_three_only:
                 f.write(f"  {unit_key}\n")
             
             # Log units only in scraped data
-            scraped_only = scraped_keys - key_three_keys
             f.write(f"\nUNITS ONLY IN SCRAPED DATA ({len(scraped_only)}):\n")
-            for unit_key in sorted(scraped_only):
+            for unit_key in scraped_only:
                 f.write(f"  {unit_key}\n")
             
             # Log matching units
-            matches = key_three_keys & scraped_keys
             f.write(f"\nMATCHING UNITS ({len(matches)}):\n")
-            for unit_key in sorted(matches):
+            for unit_key in matches:
                 f.write(f"  {unit_key}\n")
             
             f.write(f"\nCROSS-REFERENCE SUMMARY:\n")
@@ -209,52 +225,6 @@ class ThreeWayValidator:
             f.write(f"  Actual Matches: {len(matches)} units\n")
             f.write(f"  Actual Key Three Only: {len(key_three_only)} units\n")
             f.write(f"  Actual Scraped Only: {len(scraped_only)} units\n")
-        
-        print(f"📋 Cross-reference debug log saved: {debug_file}")
-        
-        validation_results = []
-
-        # Get all unique unit keys from both sources
-        all_unit_keys = key_three_keys | scraped_keys
-
-        print(f"   Total unique units across both sources: {len(all_unit_keys)}")
-        print(f"   Key Three units: {len(key_three_keys)}")
-        print(f"   Scraped units: {len(scraped_keys)}")
-
-        # Validate each unit (from either source)
-        for unit_key in sorted(all_unit_keys):
-            in_key_three = unit_key in key_three_keys
-            in_scraped = unit_key in scraped_keys
-
-            # Determine validation status
-            if in_key_three and in_scraped:
-                status = ValidationStatus.BOTH_SOURCES
-            elif in_key_three and not in_scraped:
-                status = ValidationStatus.KEY_THREE_ONLY
-            elif not in_key_three and in_scraped:
-                status = ValidationStatus.WEB_ONLY
-            else:
-                # This shouldn't happen but included for completeness
-                continue
-
-            # Create validation result with consolidated Key Three data
-            key_three_data = key_three_dict.get(unit_key)
-
-            result = ValidationResult(
-                unit_key=unit_key,
-                status=status,
-                key_three_data=key_three_data,  # Already in correct format (None for web-only)
-                scraped_data=scraped_dict.get(unit_key),
-                issues=[]
-            )
-
-            # Identify specific issues
-            self._analyze_unit_issues(result)
-
-            validation_results.append(result)
-        
-        self.validation_results = validation_results
-        return validation_results
     
     
     def _analyze_unit_issues(self, result: ValidationResult):
@@ -28,7 +28,8 @@ import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
 
-from src.dev.parsing.key_three_parser import KeyThreeParser
+from src.dev.parsing.key_three_parser import parse_unitcommorgname
+from src.pipeline.analysis.key_three_snapshot import load_key_three_snapshot
 
 class UnitEmailGenerator:
     """Generate personalized improvement emails for Scouting units"""
@@ -45,9 +46,6 @@ class UnitEmailGenerator:
         # Load council contacts from configuration
         self.council_contacts = self._load_council_contacts()
 
-        # Initialize parser for unit info extraction
-        self.parser = None
-
         # Quality score grade mappings
         self.grade_thresholds = {
             'A': 90.0,
@@ -112,64 +110,21 @@ class UnitEmailGenerator:
     
     def load_key_three_data(self, key_three_file_path: str) -> Dict:
         """Load Key Three contact information from Excel or JSON"""
-        import pandas as pd
         from pathlib import Path
         
         file_path = Path(key_three_file_path)
         
         if file_path.suffix.lower() == '.xlsx':
-            # Initialize parser for unit info extraction
-            self.parser = KeyThreeParser(key_three_file_path)
-            
-            # Load directly from Excel file
-            df = pd.read_excel(key_three_file_path, header=8)
-            print(f"Loaded {len(df)} Key Three member records from Excel")
-            
-            # Convert to the expected format
-            key_three_members = []
-            for _, row in df.iterrows():
-                member_data = {
-                    'district': str(row.get('districtname', '')).strip(),
-                    'unit_display': str(row.get('displayname', '')).strip(),
-                    'member_name': str(row.get('fullname', '')).strip(),
-                    'address': str(row.get('address', '')).strip(),
-                    'citystate': str(row.get('citystate', '')).strip(),
-                    'zip': str(row.get('zip', '')).strip(),
-                    'email': str(row.get('email', '')).strip(),
-                    'phone': str(row.get('phone', '')).strip(),
-                    'position': str(row.get('position', '')).strip(),
-                    'unit_org_name': str(row.get('unitcommorgname', '')).strip(),
-                    'ypt_status': str(row.get('yptstatus', '')).strip()
-                }
-                
-                # Clean up missing data
-                for key, value in member_data.items():
-                    if value in ['nan', 'None', '', 'NaT']:
-                        member_data[key] = ''
-                
-                key_three_members.append(member_data)
+            # Load from the Excel file, or its stored snapshot when unchanged
+            snapshot = load_key_three_snapshot(key_three_file_path)
+            print(f"Loaded {len(snapshot['members'])} Key Three member records from Excel")
         
         else:
             raise ValueError(f"Unsupported file format. Only Excel .xlsx files are supported. Got: {file_path.suffix}")
         
-        # Index by unit_key (unit_type_unit_number_town) for precise matching
+        # Indexed by unit_key (unit_type_unit_number_town) for precise matching
         # This uses the same unit_key format as scraped data
-        key_three_index = {}
-        for member in key_three_members:
-            unit_org_name = member.get('unit_org_name', '')
-
-            # Extract unit info from unitcommorgname using existing parser
-            unit_info = self.parser.extract_unit_info_from_unitcommorgname(unit_org_name)
-
-            if unit_info and unit_info.get('unit_town'):
-                # Create unit_key in same format as scraped data: "Troop 0001 Acton" (4-digit unit number)
-                # Leading zeros are kept for matching - stripped only for display
-                unit_number = unit_info['unit_number']  # Already 4-digit format from parser
-                unit_key = f"{unit_info['unit_type']} {unit_number} {unit_info['unit_town']}"
-
-                if unit_key not in key_three_index:
-                    key_three_index[unit_key] = []
-                key_three_index[unit_key].append(member)
+        key_three_index = snapshot['index']
 
         return key_three_index
     
@@ -397,8 +352,7 @@ class UnitEmailGenerator:
                 unit_org_name = key_three_members[0].get('unit_org_name', '')
                 if unit_org_name:
                     # Use the existing sophisticated parser
-                    parser = KeyThreeParser("")  # We don't need to load data, just use parsing logic
-                    unit_info = parser.extract_unit_info_from_unitcommorgname(unit_org_name)
+                    unit_info = parse_unitcommorgname(unit_org_name)
                     if unit_info:
                         # Override the parsed values with the more accurate results
                         unit_type = unit_info.get('unit_type', unit_type)
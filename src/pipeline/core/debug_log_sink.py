@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Buffered Debug Log Sink
+Append-only writer for per-session debug logs (unit identifier, discarded units):
+one file handle per session, records batched in memory and flushed in chunks,
+on close and at interpreter exit
+"""
+
+import atexit
+import os
+import weakref
+from typing import List, Optional
+
+# Records held in memory before a write to disk
+DEFAULT_BUFFER_RECORDS = 512
+
+# Live sinks, flushed by the atexit hook
+_open_sinks = weakref.WeakSet()
+
+
+class DebugLogSink:
+    """
+    Buffered append-only debug log
+
+    With path=None the sink only captures records (worker processes); the owner
+    collects them with drain() and writes them through its own file-backed sink,
+    so a session log file is only ever written by the process that opened it.
+    """
+
+    def __init__(self, path: Optional[str] = None, buffer_records: int = DEFAULT_BUFFER_RECORDS):
+        """
+        Args:
+            path: Log file to append to, or None for a capture-only sink
+            buffer_records: Records buffered before flushing to disk
+        """
+        self.path = path
+        self.buffer_records = buffer_records
+        self._buffer: List[str] = []
+        self._handle = None
+        # A forked child inherits this object; only the creating process may write the file
+        self._pid = os.getpid()
+        _open_sinks.add(self)
+
+    def write(self, record: str):
+        """Buffer one complete record (including its trailing newline)"""
+        self._buffer.append(record)
+        if self.path and len(self._buffer) >= self.buffer_records:
+            self.flush()
+
+    def write_records(self, records: List[str]):
+        """Buffer records captured elsewhere (e.g. drained from a worker), keeping their order"""
+        self._buffer.extend(records)
+        if self.path and len(self._buffer) >= self.buffer_records:
+            self.flush()
+
+    def drain(self) -> List[str]:
+        """Return and clear buffered records without writing them"""
+        records, self._buffer = self._buffer, []
+        return records
+
+    def flush(self):
+        """Write buffered records to the log file in one call"""
+        if not self.path or not self._buffer or os.getpid() != self._pid:
+            return
+        if self._handle is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._handle = open(self.path, 'a', encoding='utf-8')
+        self._handle.write(''.join(self.drain()))
+        self._handle.flush()
+
+    def close(self):
+        """Flush and release the file handle"""
+        self.flush()
+        if self._handle is not None and os.getpid() == self._pid:
+            self._handle.close()
+        self._handle = None
+        _open_sinks.discard(self)
+
+
+def flush_all_sinks():
+    """Flush every live sink (registered at exit; call before reading a log mid-run)"""
+    for sink in list(_open_sinks):
+        sink.flush()
+
+
+atexit.register(flush_all_sinks)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Key Three Spreadsheet Loader
+Shared reader for the council's Key Three export (header on row 9). Cleans every
+member field with whole-column operations and returns a table of member records
+with the field names used throughout the pipeline (district, unit_display, ...).
+"""
+
+from typing import Dict, List
+
+import pandas as pd
+
+from src.pipeline.core.workbook_reader import read_workbook
+
+try:
+    import pyarrow  # noqa: F401  (Arrow-backed string columns)
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+KEY_THREE_HEADER_ROW = 8
+
+# Spreadsheet column -> member field
+KEY_THREE_COLUMNS = {
+    'districtname': 'district',
+    'displayname': 'unit_display',
+    'fullname': 'member_name',
+    'address': 'address',
+    'citystate': 'citystate',
+    'zip': 'zip',
+    'email': 'email',
+    'phone': 'phone',
+    'position': 'position',
+    'unitcommorgname': 'unit_org_name',
+    'yptstatus': 'ypt_status',
+}
+
+# Cell text that means "no value" once converted to str (empty cells, None, missing dates)
+MISSING_VALUES = ['nan', 'None', '', 'NaT']
+
+
+def clean_key_three_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Member fields from a raw Key Three frame: str of each cell, stripped, missing -> ''
+    Columns absent from the spreadsheet come back as empty strings
+    """
+    string_dtype = 'string[pyarrow]' if PYARROW_AVAILABLE else object
+    members = pd.DataFrame(index=df.index)
+    for column, field in KEY_THREE_COLUMNS.items():
+        if column not in df.columns:
+            members[field] = ''
+            continue
+        values = df[column]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            values = values.astype(object)  # Cell text as str(Timestamp), not the date-only column format
+        # Missing cells stay NaN through astype(str) on pandas >= 3 and become 'nan' before that
+        values = values.astype(str).str.strip().fillna('')
+        members[field] = values.mask(values.isin(MISSING_VALUES), '')
+    return members.astype(string_dtype).reset_index(drop=True)
+
+
+def load_key_three_table(excel_file) -> pd.DataFrame:
+    """Cleaned Key Three member table (one row per member, all fields str)"""
+    return clean_key_three_frame(read_workbook(excel_file, header=KEY_THREE_HEADER_ROW))
+
+
+def load_key_three_members(excel_file) -> List[Dict[str, str]]:
+    """Key Three member records (dicts keyed by member field), in spreadsheet order"""
+    table = load_key_three_table(excel_file)
+    return [dict(zip(table.columns, map(str, row))) for row in table.itertuples(index=False, name=None)]
@@ -11,10 +11,14 @@ Usage:
 
 import json
 import re
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Pattern, Tuple, Any
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import compress
 from pathlib import Path
 
+import numpy as np
+
 
 @dataclass
 class ScoringWeights:
@@ -45,6 +49,204 @@ class ScoringWeights:
     }
 
 
+# Recommendation tag per missing field (order of scoring follows the weights dicts)
+REQUIRED_MISSING_TAGS = {
+    'meeting_location': 'REQUIRED_MISSING_LOCATION',
+    'meeting_day': 'REQUIRED_MISSING_DAY',
+    'meeting_time': 'REQUIRED_MISSING_TIME',
+    'contact_email': 'REQUIRED_MISSING_EMAIL',
+    'specialty': 'REQUIRED_MISSING_SPECIALTY',
+}
+RECOMMENDED_MISSING_TAGS = {
+    'contact_person': 'RECOMMENDED_MISSING_CONTACT',
+    'phone_number': 'RECOMMENDED_MISSING_PHONE',
+    'website': 'RECOMMENDED_MISSING_WEBSITE',
+    'description': 'RECOMMENDED_MISSING_DESCRIPTION',
+}
+
+# Common PO Box patterns
+POBOX_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\bP\.?O\.?\s*Box\b',
+    r'\bPO\s*Box\b',
+    r'\bPost\s*Office\s*Box\b',
+))
+
+# Street address (number + street name) alongside a PO Box
+STREET_ADDRESS_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\d+\s+[A-Za-z\s]+(?:Street|St|Road|Rd|Avenue|Ave|Lane|Ln|Drive|Dr|Boulevard|Blvd|Way|Circle|Cir)',
+    r'\d+\s+[A-Za-z\s]+(?:Street|St|Road|Rd|Avenue|Ave|Lane|Ln|Drive|Dr|Boulevard|Blvd|Way|Circle|Cir)\b',
+))
+
+# Below this many units the fixed NumPy setup cost outweighs batch scoring
+BATCH_SCORING_MIN_UNITS = 64
+
+# Letter grade lower bounds, best first
+GRADE_THRESHOLDS = (('A', 90), ('B', 80), ('C', 70), ('D', 60))
+
+
+@dataclass
+class BatchScores:
+    """Bulk scoring results aligned with the input unit list"""
+    scores: np.ndarray              # Unrounded scores (same values as score_unit)
+    grades: List[str]
+    recommendations: List[List[str]]
+
+
+@dataclass(frozen=True)
+class EmailClassification:
+    """Personal-email decision and the rule that produced it"""
+    is_personal: bool
+    stage: str   # Rule stage that fired ('default' if none matched)
+    rule: str    # Pattern source of the rule that fired
+
+
+@dataclass(frozen=True)
+class EmailRuleStage:
+    """Ordered group of compiled email rules with one outcome"""
+    name: str
+    target: str                        # 'local' (lowercase local part), 'email_lower' or 'email'
+    is_personal: bool                  # Outcome when any rule in the stage matches
+    rules: Tuple[Pattern, ...]
+
+    def first_match(self, values: Dict[str, str]) -> Optional[Pattern]:
+        """First rule matching this stage's target, or None"""
+        value = values[self.target]
+        for rule in self.rules:
+            if rule.search(value):
+                return rule
+        return None
+
+
+def _compile_stage(name: str, target: str, is_personal: bool, patterns: List[str], flags: int = 0) -> EmailRuleStage:
+    return EmailRuleStage(name, target, is_personal, tuple(re.compile(p, flags) for p in patterns))
+
+
+# Stages evaluated in order before unit context checks; the first stage with a match decides
+EMAIL_STAGES_BEFORE_CONTEXT = (
+    # FIRST: unit-specific role patterns override personal detection
+    _compile_stage('unit_role', 'local', False, [
+        r'^scoutmaster',
+        r'^cubmaster',
+        r'^committee',
+        r'^beascout',            # Platform-specific email
+        r'^secretary',
+        r'^info',
+        r'^admin',
+        r'bsa[\.\w]*troop',      # BSA.TROOP patterns
+        r'pack\d+',              # pack + number patterns
+        r'troop\d+',             # troop + number patterns
+        r'crew\d+',              # crew + number patterns
+        r'ship\d+',              # ship + number patterns
+        r'den\.leader',          # den.leader patterns
+        r'gardnerscouting',      # specific unit patterns like GardnerScouting
+        r'\w*troop\d+\w*',       # general troop + number patterns
+        r'\w*pack\d+\w*',        # general pack + number patterns
+    ]),
+    # SECOND: personal identifiers and personal/family domains, regardless of unit context
+    _compile_stage('personal_identifier', 'local', True, [
+        r'[a-z]+\.[a-z]+',             # first.last format anywhere (overrides unit context)
+        r'[a-z]+\.[a-z]+\.[a-z]+',     # first.middle.last anywhere
+        r'^[a-z]{3}$',                 # 3-letter initials (like DRD)
+        r'[a-z]+[a-z]+rose',           # compound personal names like "carlsuzannerose"
+    ]),
+    _compile_stage('personal_family_domain', 'email_lower', True, [
+        r'@.*family\.com$',            # @grindleyfamily.com
+        r'@.*currier\.us$',            # @currier.us
+        r'@.*boutwellowens\.com$',     # @boutwellowens.com
+        r'@.*micro-monkey\.com$',      # @micro-monkey.com
+    ]),
+    # THIRD: unit-only identifiers (no personal names mixed in)
+    _compile_stage('unit_only', 'local', False, [
+        r'^[a-z]*pack\d+[a-z]*$',           # pack62, westfordpack100, etc.
+        r'^[a-z]*troop\d+[a-z]*$',          # troop100, etc.
+        r'^[a-z]*crew\d+[a-z]*$',           # crew100, etc.
+        r'^[a-z]*ship\d+[a-z]*$',           # ship100, etc.
+        r'^[a-z]*scouts?[a-z]*$',           # scouts, ayerscouts, etc.
+        r'^cubscout[a-z]*pack\d+[a-z]*$',   # cubscoutchelmsfordpack81, etc.
+        r'^[a-z]*scoutmaster\d*[a-z]*$',    # scoutmaster1gstow, etc.
+    ]),
+)
+
+# Stages evaluated after unit context checks
+EMAIL_STAGES_AFTER_CONTEXT = (
+    _compile_stage('ambiguous_personal', 'local', True, [
+        r'^[a-z]{2,3}[a-z]{4,8}$',     # initials + name (2-3 chars + 4-8 chars)
+        r'[a-z]+[0-9]{2,4}$',          # ends with name + year/numbers (after unit number check)
+        r'[a-z]+[0-9]{1,3}$',          # ends with name + small numbers (after unit number check)
+    ]),
+    # LAST: no unit or personal identifiers, so personal domains decide
+    _compile_stage('personal_domain', 'email', True, [
+        r'@gmail\.com$',
+        r'@yahoo\.com$',
+        r'@hotmail\.com$',
+        r'@aol\.com$',
+        r'@comcast\.net$',
+    ], re.IGNORECASE),
+)
+
+EMAIL_CLASSIFICATION_CACHE_SIZE = 4096
+EMAIL_NO_RULE = EmailClassification(False, 'default', '')
+
+
+@lru_cache(maxsize=None)
+def _unit_number_stage(unit_number: int) -> EmailRuleStage:
+    """Unit number in the email means unit-specific (compiled once per unit number)"""
+    return _compile_stage('unit_number', 'local', False, [
+        rf'\b0*{unit_number}\b',        # unit number with optional leading zeros
+        rf'^{unit_number}[a-z]',        # unit number at start followed by letters (130scoutmaster)
+        rf'[a-z]{unit_number}[a-z]',    # unit number embedded in letters (troop195scoutmaster)
+    ])
+
+
+@lru_cache(maxsize=None)
+def _unit_town_stage(unit_town: str) -> EmailRuleStage:
+    """Unit town name in the email means likely unit-specific (compiled once per town)"""
+    return _compile_stage('unit_town', 'local', False, [rf'\b{re.escape(unit_town)}\b'])
+
+
+def _parse_unit_number(unit_number: str) -> Optional[int]:
+    """Unit number without leading zeros, or None if not numeric"""
+    if not unit_number:
+        return None
+    try:
+        return int(unit_number.lstrip('0') or '0')
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=EMAIL_CLASSIFICATION_CACHE_SIZE)
+def classify_email(email: str, unit_number: str = '', unit_town: str = '') -> EmailClassification:
+    """
+    Run the email rule stages in order and report the first rule that fires
+    Memoized per (email, unit_number, unit_town)
+
+    Args:
+        email: Contact email (non-empty)
+        unit_number: Unit number as stored on the unit (leading zeros allowed)
+        unit_town: Unit town name
+
+    Returns:
+        EmailClassification with the deciding stage and rule
+    """
+    values = {'local': email.split('@')[0].lower(), 'email_lower': email.lower(), 'email': email}
+
+    # Unit context (unit number, then meaningful town names) is checked between the fixed stages
+    context_stages = []
+    number = _parse_unit_number(unit_number)
+    if number:
+        context_stages.append(_unit_number_stage(number))
+    town = unit_town.lower()
+    if town and len(town) >= 4:
+        context_stages.append(_unit_town_stage(town))
+
+    for stage in (*EMAIL_STAGES_BEFORE_CONTEXT, *context_stages, *EMAIL_STAGES_AFTER_CONTEXT):
+        rule = stage.first_match(values)
+        if rule is not None:
+            return EmailClassification(stage.is_personal, stage.name, rule.pattern)
+
+    return EMAIL_NO_RULE
+
+
 class UnitQualityScorer:
     """Scores unit information completeness and generates recommendations"""
     
@@ -87,169 +289,28 @@ class UnitQualityScorer:
         if not location:
             return False
         
-        # Common PO Box patterns
-        pobox_patterns = [
-            r'\bP\.?O\.?\s*Box\b',
-            r'\bPO\s*Box\b',
-            r'\bPost\s*Office\s*Box\b'
-        ]
-        
-        has_pobox = any(re.search(pattern, location, re.IGNORECASE) for pattern in pobox_patterns)
+        has_pobox = any(pattern.search(location) for pattern in POBOX_PATTERNS)
         
         if not has_pobox:
             return False  # No PO Box found
         
         # Check if there's also a street address (number + street name)
-        street_patterns = [
-            r'\d+\s+[A-Za-z\s]+(?:Street|St|Road|Rd|Avenue|Ave|Lane|Ln|Drive|Dr|Boulevard|Blvd|Way|Circle|Cir)',
-            r'\d+\s+[A-Za-z\s]+(?:Street|St|Road|Rd|Avenue|Ave|Lane|Ln|Drive|Dr|Boulevard|Blvd|Way|Circle|Cir)\b'
-        ]
-        
-        has_street_address = any(re.search(pattern, location, re.IGNORECASE) for pattern in street_patterns)
+        has_street_address = any(pattern.search(location) for pattern in STREET_ADDRESS_PATTERNS)
         
         # Only flag as PO Box location if there's NO street address
         return not has_street_address
     
     def is_personal_email(self, email: str, unit_data: Dict[str, Any] = None) -> bool:
         """Check if email appears to be personal rather than unit-specific"""
+        return self.classify_email(email, unit_data).is_personal
+
+    def classify_email(self, email: str, unit_data: Dict[str, Any] = None) -> 'EmailClassification':
+        """Classify email as personal or unit-specific, reporting the rule that decided it"""
         if not email:
-            return False
-        
-        # Extract the local part (before @) for analysis
-        local_part = email.split('@')[0].lower()
-        
-        # Extract unit number for comparison if available
-        unit_number = None
-        if unit_data:
-            unit_num_str = unit_data.get('unit_number', '')
-            if unit_num_str:
-                # Remove leading zeros and convert to int for matching
-                try:
-                    unit_number = int(unit_num_str.lstrip('0') or '0')
-                except ValueError:
-                    unit_number = None
-        
-        # FIRST: Check for unit-specific patterns that should override personal detection
-        unit_role_patterns = [
-            r'^scoutmaster',
-            r'^cubmaster', 
-            r'^committee',
-            r'^beascout',  # Platform-specific email
-            r'^secretary',
-            r'^info',
-            r'^admin',
-            r'bsa[\.\w]*troop',      # BSA.TROOP patterns
-            r'pack\d+',              # pack + number patterns
-            r'troop\d+',             # troop + number patterns  
-            r'crew\d+',              # crew + number patterns
-            r'ship\d+',              # ship + number patterns
-            r'den\.leader',          # den.leader patterns
-            r'gardnerscouting',      # specific unit patterns like GardnerScouting
-            r'\w*troop\d+\w*',       # general troop + number patterns
-            r'\w*pack\d+\w*',        # general pack + number patterns
-        ]
-        
-        is_unit_role = any(re.search(pattern, local_part) 
-                          for pattern in unit_role_patterns)
-        
-        if is_unit_role:
-            return False  # Unit role emails are not personal
-        
-        # SECOND: Check for personal identifier patterns FIRST (they override unit patterns)
-        personal_patterns = [
-            r'[a-z]+\.[a-z]+',             # first.last format anywhere (overrides unit context)
-            r'[a-z]+\.[a-z]+\.[a-z]+',     # first.middle.last anywhere  
-            r'^[a-z]{3}$',                 # 3-letter initials (like DRD)
-            r'[a-z]+[a-z]+rose',           # compound personal names like "carlsuzannerose"
-        ]
-        
-        has_personal_identifier = any(re.search(pattern, local_part) 
-                                    for pattern in personal_patterns)
-        
-        # Also check for obvious personal/family domain names
-        full_email_lower = email.lower()
-        personal_domain_patterns = [
-            r'@.*family\.com$',            # @grindleyfamily.com 
-            r'@.*currier\.us$',            # @currier.us
-            r'@.*boutwellowens\.com$',     # @boutwellowens.com
-            r'@.*micro-monkey\.com$',      # @micro-monkey.com
-        ]
-        
-        has_personal_domain = any(re.search(pattern, full_email_lower) 
-                                for pattern in personal_domain_patterns)
-        
-        # If has clear personal identifiers or personal domains, it's personal regardless of unit context
-        if has_personal_identifier or has_personal_domain:
-            return True
-        
-        # THIRD: Check for unit-only identifiers (no personal names mixed in)
-        # These are clearly unit emails with numbers or other patterns
-        unit_only_patterns = [
-            r'^[a-z]*pack\d+[a-z]*$',           # pack62, westfordpack100, etc.
-            r'^[a-z]*troop\d+[a-z]*$',          # troop100, etc.
-            r'^[a-z]*crew\d+[a-z]*$',           # crew100, etc.
-            r'^[a-z]*ship\d+[a-z]*$',           # ship100, etc.
-            r'^[a-z]*scouts?[a-z]*$',           # scouts, ayerscouts, etc.
-            r'^cubscout[a-z]*pack\d+[a-z]*$',   # cubscoutchelmsfordpack81, etc.
-            r'^[a-z]*scoutmaster\d*[a-z]*$',    # scoutmaster1gstow, etc.
-        ]
-        
-        has_unit_only_identifier = any(re.search(pattern, local_part) 
-                                     for pattern in unit_only_patterns)
-        
-        if has_unit_only_identifier:
-            return False  # Clear unit-only identifier - not personal
-            
-        # FOURTH: Check for unit context (unit numbers and town names) to avoid false positives
-        # First check for unit numbers in the email to avoid false positives
-        if unit_number:
-            # Look for unit number anywhere in email (with or without leading zeros)
-            unit_patterns = [
-                rf'\b0*{unit_number}\b',  # unit number with optional leading zeros
-                rf'^{unit_number}[a-z]',  # unit number at start followed by letters (130scoutmaster)
-                rf'[a-z]{unit_number}[a-z]', # unit number embedded in letters (troop195scoutmaster)
-            ]
-            
-            has_unit_number = any(re.search(pattern, local_part) for pattern in unit_patterns)
-            if has_unit_number:
-                return False  # Contains unit number - not personal
-        
-        # Check for unit town name in email to avoid false positives
-        if unit_data:
-            unit_town = unit_data.get('unit_town', '').lower()
-            if unit_town and len(unit_town) >= 4:  # Only check meaningful town names
-                # Look for town name in email local part
-                town_pattern = rf'\b{re.escape(unit_town)}\b'
-                if re.search(town_pattern, local_part):
-                    return False  # Contains unit town name - likely unit-specific
-        
-        ambiguous_personal_patterns = [
-            r'^[a-z]{2,3}[a-z]{4,8}$',     # initials + name (2-3 chars + 4-8 chars)
-            r'[a-z]+[0-9]{2,4}$',          # ends with name + year/numbers (but check unit number first)
-            r'[a-z]+[0-9]{1,3}$',          # ends with name + small numbers (but check unit number first)
-        ]
-        
-        has_ambiguous_personal = any(re.search(pattern, local_part) 
-                                   for pattern in ambiguous_personal_patterns)
-        
-        # If has ambiguous personal patterns, it's personal
-        if has_ambiguous_personal:
-            return True
-        
-        # FOURTH: For emails without unit or personal identifiers, check personal domains
-        personal_domains = [
-            r'@gmail\.com$',
-            r'@yahoo\.com$', 
-            r'@hotmail\.com$',
-            r'@aol\.com$',
-            r'@comcast\.net$'
-        ]
-        
-        is_personal_domain = any(re.search(pattern, email, re.IGNORECASE) 
-                                for pattern in personal_domains)
-        
-        # If on personal domain with no unit identifiers, it's personal
-        return is_personal_domain
+            return EMAIL_NO_RULE
+        if not unit_data:
+            return classify_email(email)
+        return classify_email(email, unit_data.get('unit_number', ''), unit_data.get('unit_town', ''))
     
     def score_unit(self, unit: Dict[str, Any]) -> Tuple[float, List[str]]:
         """Score a single unit and return score and recommendations"""
@@ -342,6 +403,130 @@ class UnitQualityScorer:
         """Get human-readable descriptions for recommendation identifiers"""
         return [self.recommendation_map.get(rec_id, rec_id) for rec_id in recommendation_ids]
     
+    def score_units(self, units: List[Dict[str, Any]]) -> BatchScores:
+        """
+        Score a list of units in bulk with the same results as score_unit()
+
+        Field presence is built once as a units x fields matrix and the scoring
+        weights are applied column by column in score_unit's field order, so
+        the float arithmetic matches per-unit scoring exactly.
+
+        Args:
+            units: Unit dicts
+
+        Returns:
+            BatchScores with scores, letter grades and recommendation tags per unit
+        """
+        count = len(units)
+        if count == 0:
+            return BatchScores(np.zeros(0), [], [])
+
+        standard = self.weights.STANDARD_REQUIRED
+        specialized_weights = self.weights.SPECIALIZED_REQUIRED
+        fields = list(dict.fromkeys([*standard, *specialized_weights]))
+
+        # One presence matrix for required and recommended fields (same test as is_field_present)
+        presence_fields = fields + [f for f in RECOMMENDED_MISSING_TAGS if f != 'description' and f not in fields]
+        presence = np.array([[isinstance(value, str) and bool(value.strip())
+                              for value in [u.get(f, '') for u in units]] for f in presence_fields],
+                            dtype=bool).T
+        present = presence[:, :len(fields)]
+
+        specialized = np.fromiter((self.is_specialized_unit(u) for u in units), dtype=bool, count=count)[:, None]
+        required = np.where(specialized, [f in specialized_weights for f in fields], [f in standard for f in fields])
+        weights = np.where(specialized,
+                           [specialized_weights.get(f, 0.0) for f in fields],
+                           [standard.get(f, 0.0) for f in fields])
+        missing = required & ~present
+        checked = required & present
+
+        # Quality checks only run where the field is required and present (as in score_unit)
+        location_col = fields.index('meeting_location')
+        email_col = fields.index('contact_email')
+        pobox = np.zeros(count, dtype=bool)
+        misplaced_address = np.zeros(count, dtype=bool)
+        personal_email = np.zeros(count, dtype=bool)
+        for i in np.flatnonzero(checked[:, location_col]):
+            location = units[i].get('meeting_location', '')
+            if self.is_pobox_location(location):
+                pobox[i] = True
+            elif not units[i].get('unit_address', '').strip() and location and location.strip():
+                misplaced_address[i] = True
+        for i in np.flatnonzero(checked[:, email_col]):
+            personal_email[i] = self.is_personal_email(units[i].get('contact_email', ''), units[i])
+
+        quality = np.zeros((count, len(fields)), dtype=bool)
+        quality[:, location_col] = pobox | misplaced_address
+        quality[:, email_col] = personal_email
+        deductions = np.where(missing, weights, np.where(quality, weights * 0.5, 0.0))
+
+        # Sum and deduct field by field in score_unit order
+        scores = np.zeros(count)
+        for col in range(len(fields)):
+            scores += np.where(required[:, col], weights[:, col], 0.0)
+        for col in range(len(fields)):
+            scores -= deductions[:, col]
+        scores = np.maximum(scores, 0.0)
+
+        grades = np.select([scores >= bound for _, bound in GRADE_THRESHOLDS],
+                           [grade for grade, _ in GRADE_THRESHOLDS], 'F').tolist()
+
+        # Tag columns in the order score_unit appends them
+        tag_names, tag_columns = [], []
+        for col, field in enumerate(fields):
+            tag_names.append(REQUIRED_MISSING_TAGS[field])
+            tag_columns.append(missing[:, col])
+            if field == 'meeting_location':
+                tag_names += ['QUALITY_POBOX_LOCATION', 'QUALITY_UNIT_ADDRESS']
+                tag_columns += [pobox, misplaced_address]
+            elif field == 'contact_email':
+                tag_names.append('QUALITY_PERSONAL_EMAIL')
+                tag_columns.append(personal_email)
+        for field, tag in RECOMMENDED_MISSING_TAGS.items():
+            tag_names.append(tag)
+            if field == 'description':
+                # Structural detection - unit-description div was present
+                tag_columns.append(np.fromiter((not u.get('_has_description_div', False) for u in units),
+                                               dtype=bool, count=count))
+            else:
+                tag_columns.append(~presence[:, presence_fields.index(field)])
+        tag_matrix = np.column_stack(tag_columns).tolist()
+        recommendations = [list(compress(tag_names, row)) for row in tag_matrix]
+
+        return BatchScores(scores, grades, recommendations)
+
+    def apply_scores(self, units: List[Dict[str, Any]]):
+        """
+        Add completeness_score, completeness_grade and quality_tags to each unit in place
+        Lists of BATCH_SCORING_MIN_UNITS or more are scored in bulk; smaller lists, or a
+        batch that fails, are scored per unit so one bad unit only affects itself
+        """
+        if len(units) >= BATCH_SCORING_MIN_UNITS:
+            try:
+                batch = self.score_units(units)
+            except Exception:
+                batch = None
+            if batch is not None:
+                for unit, score, grade, recommendations in zip(units, batch.scores.tolist(), batch.grades,
+                                                                batch.recommendations):
+                    unit['completeness_score'] = round(score, 1)
+                    unit['completeness_grade'] = grade
+                    unit['quality_tags'] = recommendations
+                return
+
+        for index, unit in enumerate(units):
+            try:
+                score, recommendations = self.score_unit(unit)
+                unit['completeness_score'] = round(score, 1)
+                unit['completeness_grade'] = self.get_letter_grade(score)
+                unit['quality_tags'] = recommendations
+            except Exception as e:
+                # Fallback if quality scoring fails - don't break unit parsing
+                print(f"Warning: Quality scoring failed for unit {unit.get('unit_key', index)}: {e}")
+                unit['completeness_score'] = 0.0
+                unit['completeness_grade'] = 'F'
+                unit['quality_tags'] = []
+
     def score_all_units(self, units_data: Dict[str, Any]) -> Dict[str, Any]:
         """Score all units and return results with recommendations"""
         results = {
@@ -353,13 +538,11 @@ class UnitQualityScorer:
             'units_with_scores': []
         }
         
-        total_score = 0.0
         units = units_data.get('all_units', []) or units_data.get('units_with_scores', [])
+        batch = self.score_units(units)
         
-        for unit in units:
-            score, recommendations = self.score_unit(unit)
-            letter_grade = self.get_letter_grade(score)
-            
+        for unit, score, letter_grade, recommendations in zip(units, batch.scores.tolist(), batch.grades,
+                                                              batch.recommendations):
             # Add scoring information to unit
             unit_with_score = unit.copy()
             unit_with_score.update({
@@ -370,14 +553,18 @@ class UnitQualityScorer:
             
             results['units_with_scores'].append(unit_with_score)
             results['scoring_summary'][letter_grade] += 1
-            total_score += score
         
         if len(units) > 0:
-            results['average_score'] = round(total_score / len(units), 1)
+            results['average_score'] = round(sum(batch.scores.tolist()) / len(units), 1)
         
         return results
 
 
+@lru_cache(maxsize=None)
+def get_quality_scorer() -> UnitQualityScorer:
+    """Shared scorer instance (stateless, built once per process)"""
+    return UnitQualityScorer()
+
 def main():
     """Main function for command-line usage"""
     import sys
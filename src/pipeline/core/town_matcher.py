@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Shared HNE town matcher
+Single-pass trie scan that finds every HNE town name and alias in a text,
+used by all town-extraction paths instead of per-town linear scans
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+# Trie terminal marker (never a character key)
+_END = None
+
+BOUNDARY_MODES = ('word', 'token', 'none')
+
+
+@dataclass(frozen=True)
+class TownMatch:
+    """One town or alias occurrence found in a text"""
+    town: str            # Canonical HNE town (aliases resolved)
+    name: str            # Matched town or alias in its mapping spelling
+    start: int           # Start offset in the searched text
+    end: int             # End offset (exclusive)
+    is_alias: bool
+    rank: int            # Priority: aliases in mapping order, then towns longest first
+    word_bounded: bool   # Regex \b semantics on both sides
+    token_bounded: bool  # Whitespace (or text edge) on both sides
+
+
+def _is_word_char(char: str) -> bool:
+    """Match re's \\w for str patterns"""
+    return char.isalnum() or char == '_'
+
+
+class TownMatcher:
+    """
+    Trie over lowercase town names and aliases
+
+    find_all() walks the text once, reporting every occurrence with its position;
+    callers then choose by priority (ranked) or position (leftmost) to keep their
+    own matching rules.
+    """
+
+    def __init__(self, towns: Iterable[str], aliases: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            towns: Canonical town names in mapping order
+            aliases: Alias -> canonical town (aliases to unknown towns are ignored)
+        """
+        towns = list(towns)
+        town_set = set(towns)
+        valid_aliases = [(alias, canonical) for alias, canonical in (aliases or {}).items()
+                         if canonical in town_set]
+
+        self.towns = towns
+        self.aliases = dict(valid_aliases)
+        self._root = {}
+        self._person_patterns = {}
+
+        # Aliases outrank towns; towns rank longest first (stable, so ties keep mapping order)
+        rank = 0
+        for alias, canonical in valid_aliases:
+            self._insert(alias, (canonical, alias, True, rank))
+            rank += 1
+        for town in sorted(towns, key=len, reverse=True):
+            self._insert(town, (town, town, False, rank))
+            rank += 1
+
+    def _insert(self, name: str, entry: tuple):
+        node = self._root
+        for char in name.lower():
+            node = node.setdefault(char, {})
+        node.setdefault(_END, entry)
+
+    def find_all(self, text: str, boundary: str = 'word', include_aliases: bool = True) -> List[TownMatch]:
+        """
+        Find every town/alias occurrence in one pass (case-insensitive)
+
+        Args:
+            text: Text to scan
+            boundary: 'word' (regex \\b), 'token' (whitespace-delimited) or 'none' (substring)
+            include_aliases: Include alias matches
+
+        Returns:
+            Matches ordered by position, longest first at the same position
+        """
+        if boundary not in BOUNDARY_MODES:
+            raise ValueError(f"Unknown boundary mode: {boundary}")
+        if not text:
+            return []
+
+        lower = text.lower()
+        if len(lower) != len(text):
+            # Keep offsets aligned with the original text for length-changing lowercase
+            lower = ''.join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+        length = len(lower)
+        matches = []
+        for start in range(length):
+            # No \b between two word characters, so no word-bounded name can start here
+            inside_word = start > 0 and _is_word_char(lower[start - 1]) and _is_word_char(lower[start])
+            starts_token = start == 0 or lower[start - 1].isspace()
+            if boundary == 'word' and inside_word:
+                continue
+            if boundary == 'token' and not starts_token:
+                continue
+
+            node = self._root
+            position = start
+            found = []
+            while position < length:
+                node = node.get(lower[position])
+                if node is None:
+                    break
+                position += 1
+                entry = node.get(_END)
+                if entry is None:
+                    continue
+                town, name, is_alias, rank = entry
+                if is_alias and not include_aliases:
+                    continue
+                word_bounded = self._has_word_boundaries(lower, start, position)
+                token_bounded = starts_token and (position == length or lower[position].isspace())
+                if boundary == 'word' and not word_bounded:
+                    continue
+                if boundary == 'token' and not token_bounded:
+                    continue
+                found.append(TownMatch(town, name, start, position, is_alias, rank, word_bounded, token_bounded))
+
+            # Longest first at the same start position
+            matches.extend(reversed(found))
+        return matches
+
+    @staticmethod
+    def _has_word_boundaries(lower: str, start: int, end: int) -> bool:
+        """True where rf'\\b{name}\\b' would match text[start:end]"""
+        before = start > 0 and _is_word_char(lower[start - 1])
+        after = end < len(lower) and _is_word_char(lower[end])
+        return (before != _is_word_char(lower[start])) and (after != _is_word_char(lower[end - 1]))
+
+    @staticmethod
+    def ranked(matches: List[TownMatch]) -> List[TownMatch]:
+        """First occurrence of each distinct name, best priority first"""
+        first_seen = {}
+        for match in matches:
+            first_seen.setdefault(match.name, match)
+        return sorted(first_seen.values(), key=lambda m: m.rank)
+
+    @staticmethod
+    def leftmost(matches: List[TownMatch]) -> Optional[TownMatch]:
+        """Earliest occurrence, longest name on ties"""
+        return matches[0] if matches else None
+
+    def looks_like_person_name(self, text: str, town: str) -> bool:
+        """
+        True if the town appears as a surname, e.g. "Joseph Warren" ("FirstName TownName")
+        Case-sensitive on the town's mapping spelling
+        """
+        pattern = self._person_patterns.get(town)
+        if pattern is None:
+            pattern = re.compile(rf'\b[A-Z][a-z]+\s+{re.escape(town)}\b')
+            self._person_patterns[town] = pattern
+        return pattern.search(text) is not None
+
+
+@lru_cache(maxsize=None)
+def get_town_matcher() -> TownMatcher:
+    """Shared matcher over HNE towns and aliases from district_mapping (built once)"""
+    from src.pipeline.core.district_mapping import TOWN_TO_DISTRICT, TOWN_ALIASES
+    return TownMatcher(TOWN_TO_DISTRICT.keys(), TOWN_ALIASES)
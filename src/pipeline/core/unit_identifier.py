@@ -7,13 +7,65 @@ Implements the architecture from Rethinking_Processing.md
 
 import re
 import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 # Add project root to path for imports
 sys.path.append(str(Path(__file__).parent.parent.parent.parent))
 
-from src.pipeline.core.district_mapping import get_district_for_town
+from src.pipeline.core.district_mapping import get_district_for_town, TOWN_ALIASES
+from src.pipeline.core.debug_log_sink import DebugLogSink
+
+# Case-folded alias lookup built once (first alias wins if two differ only by case)
+TOWN_ALIASES_LOWER = {}
+for _alias, _canonical in TOWN_ALIASES.items():
+    TOWN_ALIASES_LOWER.setdefault(_alias.lower(), _canonical)
+
+TOWN_NAME_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=TOWN_NAME_CACHE_SIZE)
+def _normalize_town_name_cached(town: str) -> str:
+    """Memoized body of UnitIdentifierNormalizer._normalize_town_name (town already stripped)"""
+    # Direct mapping first
+    if town in TOWN_ALIASES:
+        return TOWN_ALIASES[town]
+
+    # Handle case variations
+    canonical = TOWN_ALIASES_LOWER.get(town.lower())
+    if canonical:
+        return canonical
+
+    return town.title()
+
+
+@dataclass(frozen=True)
+class UnitKey:
+    """
+    Typed unit_key (<unit type> <4-digit unit number> <canonical town>) for joining sources
+    Hashes and compares on its parts; str() gives the unit_key string
+    """
+    unit_type: str
+    unit_number: str
+    unit_town: str
+
+    def __str__(self) -> str:
+        return f"{self.unit_type} {self.unit_number} {self.unit_town}"
+
+    @classmethod
+    def from_parts(cls, unit_type: str, unit_number: str, unit_town: str) -> Optional['UnitKey']:
+        """
+        Canonical key from a unit's parts: capitalized type, 4-digit number, canonical town
+        ("crew", "204", "west boylston" -> Crew 0204 West Boylston); None if a part is missing
+        """
+        unit_type, unit_number, unit_town = (str(part or '').strip() for part in (unit_type, unit_number, unit_town))
+        if not (unit_type and unit_number and unit_town):
+            return None
+        return cls(unit_type.capitalize(),
+                   UnitIdentifierNormalizer._normalize_unit_number(unit_number),
+                   UnitIdentifierNormalizer._normalize_town_name(unit_town))
+
 
 class UnitIdentifierNormalizer:
     """
@@ -21,48 +73,90 @@ class UnitIdentifierNormalizer:
     Ensures consistent format for reliable data joining and deduplication
     """
 
+    # Session debug log sinks (created on first record, one handle per log per session)
+    _debug_sink = None
+    _discarded_debug_sink = None
+
     @classmethod
     def reset_debug_session(cls, source='scraped'):
         """Reset debug session for new execution"""
         import datetime
         import os
         
-        if hasattr(cls, '_debug_filename'):
-            delattr(cls, '_debug_filename')
-        if hasattr(cls, '_discarded_debug_filename'):
-            delattr(cls, '_discarded_debug_filename')
+        cls.close_debug_logs()
         cls._debug_source = source
         
         # Create and set shared timestamp for entire session to ensure single log file
         shared_timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         os.environ['UNIT_DEBUG_TIMESTAMP'] = shared_timestamp
+
+    @classmethod
+    def get_debug_log_paths(cls):
+        """Return (unit debug log, discarded unit debug log) paths for the current session"""
+        import os
+
+        shared_timestamp = os.environ.get('UNIT_DEBUG_TIMESTAMP')
+        if not shared_timestamp:
+            raise RuntimeError("UNIT_DEBUG_TIMESTAMP not set. Call reset_debug_session() first.")
+        source = getattr(cls, '_debug_source', 'scraped')
+        return (f'data/debug/unit_identifier_debug_{source}_{shared_timestamp}.log',
+                f'data/debug/discarded_unit_identifier_debug_{source}_{shared_timestamp}.log')
+
+    @classmethod
+    def get_debug_sinks(cls):
+        """Return (unit debug sink, discarded unit debug sink), opening session sinks on first use"""
+        if cls._debug_sink is None or cls._discarded_debug_sink is None:
+            # Always use shared timestamp from environment (set by reset_debug_session)
+            unit_path, discarded_path = cls.get_debug_log_paths()
+            if cls._debug_sink is None:
+                cls._debug_sink = DebugLogSink(unit_path)
+            if cls._discarded_debug_sink is None:
+                cls._discarded_debug_sink = DebugLogSink(discarded_path)
+        return cls._debug_sink, cls._discarded_debug_sink
+
+    @classmethod
+    def capture_debug_logs(cls):
+        """Buffer debug records in memory only (worker processes); collect with drain_debug_logs()"""
+        cls._debug_sink = DebugLogSink()
+        cls._discarded_debug_sink = DebugLogSink()
+
+    @classmethod
+    def set_debug_sinks(cls, sinks):
+        """Replace the (unit, discarded) debug sinks; returns the previous pair for restoring"""
+        previous = (cls._debug_sink, cls._discarded_debug_sink)
+        cls._debug_sink, cls._discarded_debug_sink = sinks
+        return previous
+
+    @classmethod
+    def drain_debug_logs(cls):
+        """Return and clear buffered (unit records, discarded unit records)"""
+        unit_sink, discarded_sink = cls.get_debug_sinks()
+        return unit_sink.drain(), discarded_sink.drain()
+
+    @classmethod
+    def flush_debug_logs(cls):
+        """Write buffered debug records to the session logs"""
+        for sink in (cls._debug_sink, cls._discarded_debug_sink):
+            if sink is not None:
+                sink.flush()
+
+    @classmethod
+    def close_debug_logs(cls):
+        """Flush and close the session debug logs"""
+        for sink in (cls._debug_sink, cls._discarded_debug_sink):
+            if sink is not None:
+                sink.close()
+        cls._debug_sink = None
+        cls._discarded_debug_sink = None
     
     @classmethod
     def log_discarded_unit(cls, unit_type: str, unit_number: str, town: str, 
                           chartered_org: str, reason: str):
         """Log units that were discarded during parsing"""
-        import datetime
-        import os
-        
-        # Use consistent timestamp across entire run
-        if not hasattr(cls, '_discarded_debug_filename'):
-            # Always use shared timestamp from environment (set by reset_debug_session)
-            shared_timestamp = os.environ.get('UNIT_DEBUG_TIMESTAMP')
-            if not shared_timestamp:
-                raise RuntimeError("UNIT_DEBUG_TIMESTAMP not set. Call reset_debug_session() first.")
-            
-            source = getattr(cls, '_debug_source', 'scraped')
-            cls._discarded_debug_filename = f'data/debug/discarded_unit_identifier_debug_{source}_{shared_timestamp}.log'
-            
-            # Ensure debug directory exists
-            os.makedirs('data/debug', exist_ok=True)
-        
-        with open(cls._discarded_debug_filename, 'a', encoding='utf-8') as f:
-            f.write(f"  unit_type: '{unit_type}', ")
-            f.write(f"  unit_number: '{unit_number}', ")
-            f.write(f"  unit_town: '{town}', ")
-            f.write(f"  chartered_org: '{chartered_org}', ")
-            f.write(f"  reason: '{reason}'\n")
+        cls.get_debug_sinks()[1].write(
+            f"  unit_type: '{unit_type}',   unit_number: '{unit_number}',   unit_town: '{town}', "
+            f"  chartered_org: '{chartered_org}',   reason: '{reason}'\n"
+        )
 
     @staticmethod
     def normalize_unit_identifier(unit_type: str, unit_number: str, town: str) -> str:
@@ -127,21 +221,18 @@ class UnitIdentifierNormalizer:
         if not town:
             return ""
 
-        # Import centralized town aliases
-        from src.pipeline.core.district_mapping import TOWN_ALIASES
-        
-        town = town.strip()
-
-        # Direct mapping first
-        if town in TOWN_ALIASES:
-            return TOWN_ALIASES[town]
+        return _normalize_town_name_cached(town.strip())
 
-        # Handle case variations
-        for variant, canonical in TOWN_ALIASES.items():
-            if town.lower() == variant.lower():
-                return canonical
+    @staticmethod
+    def get_town_cache_stats() -> Dict[str, int]:
+        """Town normalization cache counters (hits, misses, currsize, maxsize) for this process"""
+        info = _normalize_town_name_cached.cache_info()
+        return {'hits': info.hits, 'misses': info.misses, 'currsize': info.currsize, 'maxsize': info.maxsize}
 
-        return town.title()
+    @staticmethod
+    def clear_town_cache():
+        """Reset town normalization cache and its counters"""
+        _normalize_town_name_cached.cache_clear()
 
     @staticmethod
     def _extract_town_from_chartered_org(chartered_org: str) -> str:
@@ -157,29 +248,19 @@ class UnitIdentifierNormalizer:
         if not chartered_org:
             return ""
         
-        import re
-        
-        # Use centralized HNE towns mapping
+        # Use shared matcher over centralized HNE towns mapping
         try:
-            from src.pipeline.core.district_mapping import TOWN_TO_DISTRICT
-            
-            # Get HNE towns from centralized mapping
-            hne_towns = list(TOWN_TO_DISTRICT.keys())
-            
-            org_lower = chartered_org.lower()
-            
-            # Look for town names in the organization name
-            # Sort by length (longest first) to match "West Boylston" before "Boylston"
-            sorted_towns = sorted(hne_towns, key=len, reverse=True)
+            from src.pipeline.core.town_matcher import get_town_matcher
+            matcher = get_town_matcher()
             
-            for town in sorted_towns:
-                town_lower = town.lower()
-                if town_lower in org_lower:
-                    # Additional check: make sure it's not part of a person's name
-                    # Look for patterns like "FirstName TownName" which indicate a person
-                    if re.search(rf'\b[A-Z][a-z]+\s+{re.escape(town)}\b', chartered_org):
-                        continue  # Skip this match - likely a person's name
-                    return town
+            # Look for town names in the organization name (substring match)
+            # Ranked longest first to match "West Boylston" before "Boylston"
+            for match in matcher.ranked(matcher.find_all(chartered_org, boundary='none', include_aliases=False)):
+                # Additional check: make sure it's not part of a person's name
+                # Look for patterns like "FirstName TownName" which indicate a person
+                if matcher.looks_like_person_name(chartered_org, match.town):
+                    continue  # Skip this match - likely a person's name
+                return match.town
                         
         except ImportError:
             pass  # Fallback if district mapping not available
@@ -215,18 +296,23 @@ class UnitIdentifierNormalizer:
             )
             return None
         
-        # Create normalized identifier (automatically uses display format)
-        unit_key = UnitIdentifierNormalizer.normalize_unit_identifier(unit_type, unit_number, town)
+        # Typed key (canonical type, 4-digit number and town); unit_key and the part fields come from it
+        unit_key = UnitKey.from_parts(unit_type, unit_number, town)
+        if unit_key is None:
+            UnitIdentifierNormalizer.log_discarded_unit(
+                unit_type, unit_number, town, chartered_org, 'Missing unit type or number'
+            )
+            return None
 
         # Get district assignment
         district = get_district_for_town(town)
 
         # Create base record structure
         record = {
-            'unit_key': unit_key,
-            'unit_type': unit_type.strip().capitalize(),
-            'unit_number': UnitIdentifierNormalizer._normalize_unit_number(unit_number),
-            'unit_town': UnitIdentifierNormalizer._normalize_town_name(town),
+            'unit_key': str(unit_key),
+            'unit_type': unit_key.unit_type,
+            'unit_number': unit_key.unit_number,
+            'unit_town': unit_key.unit_town,
             'chartered_organization': chartered_org.strip() if chartered_org else "",
             'district': district,
         }
@@ -234,38 +320,19 @@ class UnitIdentifierNormalizer:
         # Add additional fields
         record.update(additional_fields)
 
-        # Debug logging AFTER normalization with session timestamp
-        import datetime
-        import os
+        # Debug logging AFTER normalization (buffered session sink)
+        entry = (f"  unit_type: '{record['unit_type']}',   unit_number: '{record['unit_number']}', "
+                 f"  unit_town: '{record['unit_town']}',   chartered_org: '{record['chartered_organization']}'\n")
 
-        # Use a session-based timestamp (created once per execution)
-        if not hasattr(UnitIdentifierNormalizer, '_debug_filename'):
-            # Use shared timestamp from environment (set by reset_debug_session)
-            import os
-            shared_timestamp = os.environ.get('UNIT_DEBUG_TIMESTAMP')
-            if not shared_timestamp:
-                raise RuntimeError("UNIT_DEBUG_TIMESTAMP not set. Call reset_debug_session() first.")
-            source = getattr(UnitIdentifierNormalizer, '_debug_source', 'scraped')
-            UnitIdentifierNormalizer._debug_filename = f'data/debug/unit_identifier_debug_{source}_{shared_timestamp}.log'
-
-            # Ensure debug directory exists
-            os.makedirs('data/debug', exist_ok=True)
-
-        with open(UnitIdentifierNormalizer._debug_filename, 'a', encoding='utf-8') as f:
-            f.write(f"  unit_type: '{record['unit_type']}', ")
-            f.write(f"  unit_number: '{record['unit_number']}', ")
-            f.write(f"  unit_town: '{record['unit_town']}', ")
-            f.write(f"  chartered_org: '{record['chartered_organization']}'\n")
-            
-            # Add Key Three member details if available
-            if 'key_three_members' in additional_fields:
-                members = additional_fields['key_three_members']
-                for i, member in enumerate(members, 1):
-                    f.write(f"    Member {i}: {member['fullname']} | ")
-                    f.write(f"Email: {member['email']} | ")
-                    f.write(f"Phone: {member['phone']} | ")
-                    f.write(f"Position: {member['position']} | ")
-                    f.write(f"Status: {member['status']}\n")
+        # Add Key Three member details if available
+        if 'key_three_members' in additional_fields:
+            members = additional_fields['key_three_members']
+            for i, member in enumerate(members, 1):
+                entry += (f"    Member {i}: {member['fullname']} | Email: {member['email']} | "
+                          f"Phone: {member['phone']} | Position: {member['position']} | "
+                          f"Status: {member['status']}\n")
+
+        UnitIdentifierNormalizer.get_debug_sinks()[0].write(entry)
 
         return record
 
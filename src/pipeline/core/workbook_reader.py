@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Workbook Reader
+Single entry point for reading .xlsx files (Key Three export, quality reports).
+Uses the python-calamine backend (Rust xlsx parser) when installed and falls back
+to openpyxl otherwise; both return the same frames and cell values.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+ENGINE_CALAMINE = 'calamine'
+ENGINE_OPENPYXL = 'openpyxl'
+
+
+def get_workbook_engine(engine: Optional[str] = None) -> str:
+    """Requested engine, else calamine when installed, else openpyxl"""
+    if engine:
+        return engine
+    return ENGINE_CALAMINE if CALAMINE_AVAILABLE else ENGINE_OPENPYXL
+
+
+def read_workbook(excel_file, sheet_name=0, header=0, engine: Optional[str] = None, **kwargs):
+    """
+    pd.read_excel with the fastest available engine
+    sheet_name=None reads every sheet in one pass (dict of sheet name -> DataFrame)
+    """
+    return pd.read_excel(excel_file, sheet_name=sheet_name, header=header,
+                         engine=get_workbook_engine(engine), **kwargs)
+
+
+def read_workbook_values(excel_file, engine: Optional[str] = None) -> Dict[str, List[tuple]]:
+    """
+    Cell values of every sheet as rows of tuples, row 1 / column A at index 0
+    (formulas as their cached values, empty cells None)
+    """
+    engine = get_workbook_engine(engine)
+    if engine == ENGINE_CALAMINE:
+        workbook = CalamineWorkbook.from_path(str(Path(excel_file)))
+        sheets = {}
+        for name in workbook.sheet_names:
+            rows = workbook.get_sheet_by_name(name).to_python(skip_empty_area=False)
+            sheets[name] = [tuple(None if value == '' else value for value in row) for row in rows]
+        return sheets
+
+    from openpyxl import load_workbook
+    workbook = load_workbook(excel_file, read_only=True, data_only=True)
+    try:
+        return {ws.title: list(ws.iter_rows(values_only=True)) for ws in workbook.worksheets}
+    finally:
+        workbook.close()
@@ -13,6 +13,151 @@ import re
 from bs4 import BeautifulSoup
 import json
 
+# Optional fast parser backends - html.parser (pure Python) is always available
+try:
+    import lxml  # noqa: F401  (used through BeautifulSoup's 'lxml' tree builder)
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+DEFAULT_PARSER_BACKEND = 'html.parser'
+PARSER_BACKENDS = ('html.parser', 'lxml', 'selectolax')
+
+# ---------------------------------------------------------------------------
+# Compiled pattern registry - built once at import and shared by every unit
+# ---------------------------------------------------------------------------
+
+# format_meeting_location()
+WHITESPACE_PATTERN = re.compile(r'\s+')
+CITY_STATE_ZIP_PATTERN = re.compile(r'([A-Za-z0-9])\s+([A-Z][a-z]+\s+[A-Z]{2}\s+\d{5})')
+PERIOD_CITY_STATE_ZIP_PATTERN = re.compile(r'(\.\s+)([A-Z][a-z]+)(\s+[A-Z]{2}\s+\d{5})')
+BUILDING_THEN_STREET_PATTERN = re.compile(r'([A-Za-z][A-Za-z\s\.\'&-]+(?:Church|Building|Hall|Center|School|Library))\s+(\d+\s+[A-Za-z\s]+(?:ST|St|Street|Rd|Road|Ave|Avenue|Ln|Lane|Dr|Drive|Blvd|Boulevard|Way|Place|Court|Ct))')
+NAME_THEN_STREET_PATTERN = re.compile(r'([A-Za-z][A-Za-z\s\'&.-]+[A-Za-z])\s+(\d+\s+[A-Za-z\s]+(?:St|Street|Rd|Road|Ave|Avenue|Ln|Lane|Dr|Drive|Blvd|Boulevard|Way|Place|Court|Ct))')
+STREET_THEN_NAME_PATTERN = re.compile(r'(\d+\s+[A-Za-z\s]+(?:St|Street|Rd|Road|Ave|Avenue|Ln|Lane|Dr|Drive|Blvd|Boulevard|Way|Place|Court|Ct))([A-Z][A-Za-z\s\'&.-]+)')
+COMMA_DIGIT_PATTERN = re.compile(r',(\d)')
+
+# format_meeting_time()
+DIGIT_TIME_PATTERN = re.compile(r'^(\d{3,4})\s*([ap])\.?m?\.?$', re.IGNORECASE)
+FORMATTED_TIME_PATTERN = re.compile(r'\d{1,2}:\d{2}\s*[ap]m', re.IGNORECASE)
+HOUR_MINUTE_AMPM_PATTERN = re.compile(r'(\d{1,2}):(\d{2})\s*([ap])\.?m?\.?', re.IGNORECASE)
+HOUR_AMPM_PATTERN = re.compile(r'(\d{1,2})\s*([ap])\.?m?\.?', re.IGNORECASE)
+
+# extract_location_components() - full location candidates (address/description sources)
+LOCATION_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    # Complete street addresses: number + street name + street type
+    r'\b(\d+\s+[A-Za-z][A-Za-z\s]{2,}(?:Street|St|Road|Rd|Avenue|Ave|Lane|Ln|Drive|Dr|Boulevard|Blvd|Way|Court|Ct|Place|Pl)\.?(?:\s*,?\s*[A-Za-z][A-Za-z\s]*\s*[A-Z]{0,2}\s*\d{0,5})*)',
+    # Named venues with street addresses
+    r'\b([A-Z][A-Za-z][A-Za-z\s]{5,}(?:School|Church|Hall|Center|Centre|Building|Library|Post|Legion|VFW|Club|Association|Parish|Camp),?\s+\d+\s+[A-Za-z][A-Za-z\s]{2,}(?:Street|St|Road|Rd|Avenue|Ave|Lane|Ln|Drive|Dr))',
+    # Institutional locations with context
+    r'\b(?:at\s+the\s+|meets?\s+at\s+the\s+|located\s+at\s+the\s+)([A-Z][A-Za-z][A-Za-z\s]{5,}(?:School|Church|Hall|Center|Centre|Building|Library|Station|Department))',
+)]
+LOCATION_KEYWORD_PATTERN = re.compile(r'\b(?:Street|St|Road|Rd|Avenue|Ave|Lane|Ln|Drive|Dr|Boulevard|Blvd|Way|Court|Ct|Place|Pl|School|Church|Hall|Center|Centre|Building|Library|Station|Department)\b', re.IGNORECASE)
+LOCATION_SENTENCE_WORD_PATTERN = re.compile(r'\b(?:is|are|was|were|have|has|had|will|would|should|could|can|may|might|do|does|did|welcome|upcoming|chartered|located|serves|meet|when|where|what|who|why|how)\b', re.IGNORECASE)
+LOCATION_NUMBER_SENTENCE_PATTERN = re.compile(r'^\d+\s+(?:is|are|was|were|have|has|had|will|would|welcome|upcoming|for|with|of|in)', re.IGNORECASE)
+DIGITS_ONLY_PATTERN = re.compile(r'^\d+$')
+
+# extract_location_components() - town candidates by source type
+ORG_NAME_TOWN_PATTERNS = [re.compile(p) for p in (
+    r'^([A-Za-z\s]+)-',  # "Town-Organization"
+    r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:Rod and Gun|Fire|Police|American Legion|VFW|Lions|Rotary|Knights)',  # "Town Organization"
+)]
+ADDRESS_TOWN_PATTERNS = [re.compile(p) for p in (
+    r',\s*([A-Za-z\s]+)\s+MA\s+(\d{5})',  # ", Town MA 12345" - capture zip too
+    r',\s*([A-Za-z\s]+)\s+([A-Z]{2})\s+(\d{5})',  # ", Town ST 12345" - capture state and zip
+    r',\s*([A-Za-z\s]+)\s+MA',  # ", Town MA"
+    r',\s*([A-Za-z\s]+)\s*$',  # ", Town" at end
+)]
+
+# extract_town_from_address()
+MEETING_LOCATION_TOWN_PATTERNS = [re.compile(p) for p in (
+    r',\s*([A-Za-z\s]+)\s+MA\s+\d{5}',  # ", Town MA 12345"
+    r',\s*([A-Za-z\s]+)\s+MA',           # ", Town MA"
+    r',\s*([A-Za-z\s]+)\s*$',            # ", Town" at end
+)]
+
+# extract_town_from_org()
+TIME_RANGE_PATTERN = re.compile(r'\d{1,2}:\d{2}\s*[ap]?m?\s*-\s*\d{1,2}:\d{2}\s*[ap]?m?', re.IGNORECASE)
+
+# extract_unit_fields()
+MAILTO_HREF_PATTERN = re.compile(r'mailto:')
+TEL_HREF_PATTERN = re.compile(r'tel:')
+HTTP_HREF_PATTERN = re.compile(r'^https?://')
+CONTACT_LABEL_PATTERN = re.compile(r'Contact:', re.IGNORECASE)
+BLANK_TEXT_PATTERN = re.compile(r'^[\s\n]*$')
+NON_DIGIT_PATTERN = re.compile(r'[^\d]')
+COMPOSITION_PATTERN = re.compile(r'(Boy|Girl|Boys|Girls|Coed)')
+STREET_NUMBER_ADDRESS_PATTERN = re.compile(r'\d+\s+[A-Za-z][A-Za-z\s]+(?:Street|St|Road|Rd|Avenue|Ave|Lane|Ln|Drive|Dr|Boulevard|Blvd|Way|Court|Ct|Place|Pl)', re.IGNORECASE)
+CONTACT_EMAIL_DESCRIPTION_PATTERN = re.compile(r'Contact:\s*[A-Za-z\s]+\s*Email:', re.IGNORECASE)
+
+# parse_specialty_info()
+UNIT_PREFIX_PATTERN = re.compile(r'^(Crew|Post|Club|Pack|Troop)\s+\d+\s+')
+
+# extract_meeting_info()
+DAY_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'meets?\s+(?:most\s+)?(?:on\s+)?([A-Za-z]+day)s?',  # "meets most Wednesdays"
+    r'([A-Za-z]+day)s?\s+(?:at|from|nights?)',  # "Wednesday nights", "Mondays at"
+    r'(?:every\s+)?([A-Za-z]+day)\s+(?:night|evening)',  # "every Monday night"
+    r'(?:first|second|third|fourth|1st|2nd|3rd|4th|last)\s+(?:and\s+(?:second|third|fourth|2nd|3rd|4th)\s+)?([A-Za-z]+day)',  # "1st & 3rd Tuesday"
+    r'([A-Za-z]+day)s?\s+\d{1,2}:\d{2}',  # "Monday 7:00"
+    r'\d{1,2}:\d{2}\s*[ap]?m?\s*([A-Za-z]+day)s?',  # "7pm Tuesdays", "6:30 PM Wednesdays"
+    r'(?:meet|meets)\s+\d{1,2}[ap]?m?\s*([A-Za-z]+day)s?',  # "Meet 7pm Tuesdays"
+    # Day abbreviations - capture and expand to full day names
+    r'(?:every\s+)?(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\.?\s+(?:night|evening)',  # "every Tue. night"
+    r'(?:meet|meets)\s+(?:every\s+)?(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\.?',  # "Meet every Tues."
+    r'(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\.?\s+(?:night|evening)',  # "Tues. night"
+    r'(Tues|Thurs)\.?',  # Common abbreviations "Tues." or "Thurs."
+)]
+DAY_ABBREVIATIONS = {
+    'Mon': 'Monday',
+    'Tue': 'Tuesday',
+    'Tues': 'Tuesday',
+    'Wed': 'Wednesday',
+    'Thu': 'Thursday',
+    'Thurs': 'Thursday',
+    'Fri': 'Friday',
+    'Sat': 'Saturday',
+    'Sun': 'Sunday'
+}
+
+# Meeting time patterns - enhanced with boundary checks to avoid email/unit number contamination
+# while still capturing legitimate meeting times from descriptions
+TIME_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(\d{1,2}:\d{2})\s*-\s*(\d{1,2}:\d{2})\s*([ap])\.?m?\.?',  # "7:00 - 8:30 p.m."
+    r'(\d{1,2}:\d{2})\s*([ap])\.?m?\.?\s*-\s*(\d{1,2}:\d{2})\s*([ap])\.?m?\.?',  # "6:30 p.m. - 8:00 p.m."
+    r'(\d{1,2}:\d{2})\s*-\s*(\d{1,2}:\d{2})',  # "7:00 - 8:30" (full time range, no AM/PM)
+    r'(?:\s|,)\s*(\d{1,2})\s*-\s*(\d{1,2}:\d{2})',  # " 7 - 8:30" (simple time range after space/comma)
+    r'(?:at\s+)?(\d{1,2}:\d{2})\s*([ap])\.?m?\.?',  # "at 6:30pm", "7:00 PM"
+    r'(?:at\s+)(\d{3,4})\s*([ap])\.?m?\.?',  # "at 330pm", "at 1230 PM" - requires "at" context
+
+    # ENHANCED: Legitimate time patterns with proper context to avoid unit identifier contamination
+    r'(?:at|meets?)\s+(\d{1,2})\s*([ap])\.?m?\.?',  # "at 7pm" or "meets 6am" - requires context word
+    r'(?:from\s+)?(\d{1,2}:\d{2})\s*(?:to\s+(\d{1,2}:\d{2}))?\s*([ap])\.?m?\.?',  # "from 7:00 to 8:30 PM"
+
+    # NEW: Additional legitimate patterns for meeting descriptions
+    r'(?:from\s+)(\d{1,2})\s*([ap])m?\s*-\s*(\d{1,2})\s*([ap])m?',  # "from 6pm - 7pm"
+    r'(?:nights?\s+from\s+)(\d{1,2})\s*([ap])m?\s*-\s*(\d{1,2})\s*([ap])m?',  # "nights from 6pm - 7pm"
+    r'(?:meetings?\s*-\s*)(\d{1,2})\s*-\s*(\d{1,2})\s*([ap])m?',  # "meetings - 7-8pm"
+    r'(?:on\s+\w+days?\s+)(\d{1,2})\s*([ap])m?(?:\s+at)',  # "on Tuesdays 6PM at"
+    r'(?:meet(?:s|ing)?.*?)(\d{1,2}:\d{2})\s*-\s*(\d{1,2})\s*([ap])m?',  # "meets from 6:30-8 pm"
+    r'(?:from\s+)(\d{1,2})\s*-\s*(\d{1,2})\s*([ap])m?',  # "from 4-6 pm"
+)]
+
+# Organizational words that mark "<Word> <Town>" as an organization rather than a person's name
+ORG_CONTEXT_WORDS = ['veterans', 'foreign', 'wars', 'american', 'legion', 'post', 'vfw']
+
+try:
+    from src.pipeline.core.district_mapping import TOWN_TO_DISTRICT, TOWN_ALIASES
+    from src.pipeline.core.town_matcher import get_town_matcher
+except ImportError:
+    TOWN_TO_DISTRICT, TOWN_ALIASES = {}, {}
+    get_town_matcher = None
+
 def load_location_exceptions():
     """Load location exception configuration for units without street numbers"""
     exception_file = Path(__file__).parent.parent.parent.parent / 'data/config/location_exceptions.json'
@@ -60,29 +205,29 @@ def format_meeting_location(raw_location):
     # Expected format: Building Name, Street Address, City State ZIP
     
     # Remove extra spaces and normalize
-    location = re.sub(r'\s+', ' ', raw_location.strip())
+    location = WHITESPACE_PATTERN.sub(' ', raw_location.strip())
     
     # Add comma before city/state/zip pattern but handle periods properly
     # Pattern: "word Townname MA 12345" -> "word, Townname MA 12345" (but not if word ends with period)
     # First handle the normal case (no period before city/state)
-    location = re.sub(r'([A-Za-z0-9])\s+([A-Z][a-z]+\s+[A-Z]{2}\s+\d{5})', r'\1, \2', location)
+    location = CITY_STATE_ZIP_PATTERN.sub(r'\1, \2', location)
     # Then handle the period case: "E. Townname MA 12345" -> "E. Townname, MA 12345" 
-    location = re.sub(r'(\.\s+)([A-Z][a-z]+)(\s+[A-Z]{2}\s+\d{5})', r'\1\2,\3', location)
+    location = PERIOD_CITY_STATE_ZIP_PATTERN.sub(r'\1\2,\3', location)
     
     # Add comma and space between building name and street address
     # Handle two patterns: Building Name + Street Address OR Street Address + Building Name
     
     # Pattern 1: Building name followed by street number - use more specific patterns for common building types
-    location = re.sub(r'([A-Za-z][A-Za-z\s\.\'&-]+(?:Church|Building|Hall|Center|School|Library))\s+(\d+\s+[A-Za-z\s]+(?:ST|St|Street|Rd|Road|Ave|Avenue|Ln|Lane|Dr|Drive|Blvd|Boulevard|Way|Place|Court|Ct))', r'\1, \2', location)
+    location = BUILDING_THEN_STREET_PATTERN.sub(r'\1, \2', location)
     
     # Pattern 1b: General building name pattern (fallback for other building types)
-    location = re.sub(r'([A-Za-z][A-Za-z\s\'&.-]+[A-Za-z])\s+(\d+\s+[A-Za-z\s]+(?:St|Street|Rd|Road|Ave|Avenue|Ln|Lane|Dr|Drive|Blvd|Boulevard|Way|Place|Court|Ct))', r'\1, \2', location)
+    location = NAME_THEN_STREET_PATTERN.sub(r'\1, \2', location)
     
     # Pattern 2: Street address followed by building name (435 Central StreetSt. Matthew's Church)
-    location = re.sub(r'(\d+\s+[A-Za-z\s]+(?:St|Street|Rd|Road|Ave|Avenue|Ln|Lane|Dr|Drive|Blvd|Boulevard|Way|Place|Court|Ct))([A-Z][A-Za-z\s\'&.-]+)', r'\1, \2', location)
+    location = STREET_THEN_NAME_PATTERN.sub(r'\1, \2', location)
     
     # Fix cases where comma exists but no space after it
-    location = re.sub(r',(\d)', r', \1', location)
+    location = COMMA_DIGIT_PATTERN.sub(r', \1', location)
     
     return location
 
@@ -95,7 +240,7 @@ def format_meeting_time(time_str):
     time_str = time_str.replace('.', '').strip()
     
     # Handle 3-4 digit times (e.g., "330" -> "3:30", "1230" -> "12:30")
-    digit_match = re.match(r'^(\d{3,4})\s*([ap])\.?m?\.?$', time_str, re.IGNORECASE)
+    digit_match = DIGIT_TIME_PATTERN.match(time_str)
     if digit_match:
         digits = digit_match.group(1)
         am_pm = digit_match.group(2)
@@ -108,9 +253,9 @@ def format_meeting_time(time_str):
         time_str = f"{hour}:{minute} {am_pm}M"
     
     # Convert to standard format - check for already formatted times first
-    if not re.search(r'\d{1,2}:\d{2}\s*[ap]m', time_str, re.IGNORECASE):
-        time_str = re.sub(r'(\d{1,2}):(\d{2})\s*([ap])\.?m?\.?', r'\1:\2 \3M', time_str, flags=re.IGNORECASE)
-        time_str = re.sub(r'(\d{1,2})\s*([ap])\.?m?\.?', r'\1:00 \2M', time_str, flags=re.IGNORECASE)
+    if not FORMATTED_TIME_PATTERN.search(time_str):
+        time_str = HOUR_MINUTE_AMPM_PATTERN.sub(r'\1:\2 \3M', time_str)
+        time_str = HOUR_AMPM_PATTERN.sub(r'\1:00 \2M', time_str)
     
     return time_str.upper()
 
@@ -147,27 +292,17 @@ def extract_location_components(text, source_type='address'):
     
     # For address and description sources, extract full location first
     if source_type in ['address', 'description']:
-        # Use the same patterns from extract_address_from_text()
-        location_patterns = [
-            # Complete street addresses: number + street name + street type
-            r'\b(\d+\s+[A-Za-z][A-Za-z\s]{2,}(?:Street|St|Road|Rd|Avenue|Ave|Lane|Ln|Drive|Dr|Boulevard|Blvd|Way|Court|Ct|Place|Pl)\.?(?:\s*,?\s*[A-Za-z][A-Za-z\s]*\s*[A-Z]{0,2}\s*\d{0,5})*)',
-            # Named venues with street addresses  
-            r'\b([A-Z][A-Za-z][A-Za-z\s]{5,}(?:School|Church|Hall|Center|Centre|Building|Library|Post|Legion|VFW|Club|Association|Parish|Camp),?\s+\d+\s+[A-Za-z][A-Za-z\s]{2,}(?:Street|St|Road|Rd|Avenue|Ave|Lane|Ln|Drive|Dr))',
-            # Institutional locations with context
-            r'\b(?:at\s+the\s+|meets?\s+at\s+the\s+|located\s+at\s+the\s+)([A-Z][A-Za-z][A-Za-z\s]{5,}(?:School|Church|Hall|Center|Centre|Building|Library|Station|Department))',
-        ]
-        
-        for pattern in location_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in LOCATION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 potential_location = match.group(1).strip()
                 # Apply strict filtering to avoid sentence fragments
                 if (len(potential_location) > 10 and
-                    re.search(r'\b(?:Street|St|Road|Rd|Avenue|Ave|Lane|Ln|Drive|Dr|Boulevard|Blvd|Way|Court|Ct|Place|Pl|School|Church|Hall|Center|Centre|Building|Library|Station|Department)\b', potential_location, re.IGNORECASE) and
-                    not re.search(r'\b(?:is|are|was|were|have|has|had|will|would|should|could|can|may|might|do|does|did|welcome|upcoming|chartered|located|serves|meet|when|where|what|who|why|how)\b', potential_location, re.IGNORECASE) and
-                    not re.search(r'^\d+\s+(?:is|are|was|were|have|has|had|will|would|welcome|upcoming|for|with|of|in)', potential_location, re.IGNORECASE) and
+                    LOCATION_KEYWORD_PATTERN.search(potential_location) and
+                    not LOCATION_SENTENCE_WORD_PATTERN.search(potential_location) and
+                    not LOCATION_NUMBER_SENTENCE_PATTERN.search(potential_location) and
                     not '@' in potential_location and
-                    not re.match(r'^\d+$', potential_location) and
+                    not DIGITS_ONLY_PATTERN.match(potential_location) and
                     not potential_location.lower().startswith(('when ', 'where ', 'what ', 'who ', 'why ', 'how ', 'for ', 'with ', 'of '))):
                     result['full_location'] = potential_location
                     break
@@ -175,23 +310,11 @@ def extract_location_components(text, source_type='address'):
     # Extract town from full location or directly from text
     text_to_parse = result['full_location'] if result['full_location'] else text
     
-    if source_type == 'org_name':
-        # Organization name patterns (from extract_town_from_org)
-        town_patterns = [
-            r'^([A-Za-z\s]+)-',  # "Town-Organization"
-            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:Rod and Gun|Fire|Police|American Legion|VFW|Lions|Rotary|Knights)',  # "Town Organization"
-        ]
-    else:
-        # Address patterns (from extract_town_from_address)
-        town_patterns = [
-            r',\s*([A-Za-z\s]+)\s+MA\s+(\d{5})',  # ", Town MA 12345" - capture zip too
-            r',\s*([A-Za-z\s]+)\s+([A-Z]{2})\s+(\d{5})',  # ", Town ST 12345" - capture state and zip
-            r',\s*([A-Za-z\s]+)\s+MA',  # ", Town MA"
-            r',\s*([A-Za-z\s]+)\s*$',  # ", Town" at end
-        ]
+    # Organization name patterns (from extract_town_from_org) or address patterns (from extract_town_from_address)
+    town_patterns = ORG_NAME_TOWN_PATTERNS if source_type == 'org_name' else ADDRESS_TOWN_PATTERNS
     
     for pattern in town_patterns:
-        match = re.search(pattern, text_to_parse)
+        match = pattern.search(text_to_parse)
         if match:
             result['town'] = match.group(1).strip()
             # Extract state and zip if captured
@@ -216,14 +339,8 @@ def extract_town_from_address(meeting_location):
         return ""
     
     # Common patterns for addresses ending with town and state/zip
-    address_patterns = [
-        r',\s*([A-Za-z\s]+)\s+MA\s+\d{5}',  # ", Town MA 12345"
-        r',\s*([A-Za-z\s]+)\s+MA',           # ", Town MA"
-        r',\s*([A-Za-z\s]+)\s*$',            # ", Town" at end
-    ]
-    
-    for pattern in address_patterns:
-        match = re.search(pattern, meeting_location)
+    for pattern in MEETING_LOCATION_TOWN_PATTERNS:
+        match = pattern.search(meeting_location)
         if match:
             return match.group(1).strip()
     
@@ -255,63 +372,36 @@ def extract_town_from_org(chartered_org):
     if '-' in chartered_org:
         # Only use dash-based extraction for organizational naming patterns
         # Skip if this looks like a time range (e.g., "7:00pm-8:30pm") or description text
-        if not re.search(r'\d{1,2}:\d{2}\s*[ap]?m?\s*-\s*\d{1,2}:\d{2}\s*[ap]?m?', chartered_org, re.IGNORECASE):
+        if not TIME_RANGE_PATTERN.search(chartered_org):
             # Also skip if the text is too long to be an organization name (likely description)
             if len(chartered_org) < 200:  # Reasonable organization name length limit
                 town = chartered_org.split('-')[0].strip()
                 # Check if the extracted town is an alias and resolve it
-                try:
-                    from src.pipeline.core.district_mapping import TOWN_ALIASES, TOWN_TO_DISTRICT
-                    if town in TOWN_ALIASES:
-                        canonical_town = TOWN_ALIASES[town]
-                        if canonical_town in TOWN_TO_DISTRICT:
-                            return canonical_town
-                except ImportError:
-                    pass
+                if town in TOWN_ALIASES and TOWN_ALIASES[town] in TOWN_TO_DISTRICT:
+                    return TOWN_ALIASES[town]
                 return town
     
     # Method 2: Search for HNE town names in organization
-    # Use centralized district mapping for HNE towns and aliases
-    try:
-        from src.pipeline.core.district_mapping import TOWN_TO_DISTRICT, TOWN_ALIASES
-        hne_towns = list(TOWN_TO_DISTRICT.keys())
-        
-        org_lower = chartered_org.lower()
-        
-        # First check TOWN_ALIASES for abbreviated forms (e.g., "W Boylston" -> "West Boylston")
-        for alias, canonical_town in TOWN_ALIASES.items():
-            alias_lower = alias.lower()
-            if re.search(rf'\b{re.escape(alias_lower)}\b', org_lower):
-                # Verify the canonical town is actually an HNE town
-                if canonical_town in TOWN_TO_DISTRICT:
-                    return canonical_town
-        
-        # Then check full HNE town names
-        # Sort by length (longest first) to match "West Boylston" before "Boylston"
-        sorted_towns = sorted(hne_towns, key=len, reverse=True)
-        
-        for town in sorted_towns:
+    # One pass of the shared town matcher (word boundaries prevent "athol" in "catholic")
+    if get_town_matcher is not None:
+        matcher = get_town_matcher()
+        # Aliases (e.g., "W Boylston" -> "West Boylston") rank first, then towns longest first
+        # so "West Boylston" is preferred over "Boylston"
+        for match in matcher.ranked(matcher.find_all(chartered_org, boundary='word')):
+            if match.is_alias:
+                return match.town
+            town = match.town
             # Avoid matching names that are part of historical figures
             # e.g., "Joseph Warren" should not match "Warren" the town
-            town_lower = town.lower()
-            # Use word boundary matching to prevent false positives like "athol" in "catholic"
-            if re.search(rf'\b{re.escape(town_lower)}\b', org_lower):
-                # Additional check: make sure it's not part of a person's name
-                # Look for patterns like "FirstName LastName" where LastName is a town name
-                # But exclude common organizational words that precede town names
-                person_pattern = rf'\b[A-Z][a-z]+\s+{re.escape(town)}\b'
-                if re.search(person_pattern, chartered_org):
-                    # Check if it's preceded by common org words - if so, it's NOT a person
-                    org_words = ['veterans', 'foreign', 'wars', 'american', 'legion', 'post', 'vfw']
-                    preceding_text = chartered_org[:chartered_org.lower().find(town_lower)].lower()
-                    if any(word in preceding_text for word in org_words):
-                        return town  # Valid organizational context
-                    else:
-                        continue  # Likely a person's name
-                return town
-        
-    except ImportError:
-        pass  # Fallback if HNE towns data not available
+            # But exclude common organizational words that precede town names
+            if matcher.looks_like_person_name(chartered_org, town):
+                # Check if it's preceded by common org words - if so, it's NOT a person
+                preceding_text = chartered_org[:chartered_org.lower().find(town.lower())].lower()
+                if any(word in preceding_text for word in ORG_CONTEXT_WORDS):
+                    return town  # Valid organizational context
+                else:
+                    continue  # Likely a person's name
+            return town
     
     # Method 3: Common patterns for non-HNE towns
     org_lower = chartered_org.lower()
@@ -339,6 +429,8 @@ def filter_hne_units(units):
         from src.pipeline.core.hne_towns import get_hne_towns_and_zipcodes
         hne_towns, _ = get_hne_towns_and_zipcodes()
         hne_towns_lower = [town.lower() for town in hne_towns]
+        from src.pipeline.core.town_matcher import get_town_matcher
+        town_matcher = get_town_matcher()
     except ImportError as e:
         # CRITICAL FAILURE - Cannot proceed without HNE territory data
         raise RuntimeError(
@@ -375,20 +467,13 @@ def filter_hne_units(units):
                 determined_town = normalized_town  # Use normalized name for logging
         else:
             # No unit town identified - use chartered organization as fallback
-            # Sort by length (longest first) to match "West Boylston" before "Boylston"
-            sorted_towns = sorted(hne_towns, key=len, reverse=True)
-            found_org_town = None
-            for town in sorted_towns:
-                town_lower = town.lower()
-                if town_lower in chartered_org:
-                    # Additional validation to avoid false positives
-                    # Make sure it's a word boundary match
-                    if re.search(rf'\b{re.escape(town_lower)}\b', chartered_org):
-                        is_hne = True
-                        found_org_town = town
-                        # Update unit_town with the detected town
-                        unit['unit_town'] = town
-                        break
+            # Word-bounded town matches, longest first to match "West Boylston" before "Boylston"
+            org_matches = town_matcher.ranked(town_matcher.find_all(chartered_org, boundary='word',
+                                                                    include_aliases=False))
+            if org_matches:
+                is_hne = True
+                # Update unit_town with the detected town
+                unit['unit_town'] = org_matches[0].town
             
             # Use the already-extracted town from unified extraction
             determined_town = unit.get('unit_town', 'Unknown')
@@ -432,9 +517,9 @@ def parse_specialty_info(primary_id, chartered_org):
         # Clean up chartered org (remove specialty part)
         clean_org = parts[0].strip()
         # Remove unit info from org name
-        clean_org = re.sub(r'^(Crew|Post|Club|Pack|Troop)\s+\d+\s+', '', clean_org).strip()
+        clean_org = UNIT_PREFIX_PATTERN.sub('', clean_org).strip()
         # Normalize whitespace (collapse multiple spaces to single space)
-        clean_org = re.sub(r'\s+', ' ', clean_org)
+        clean_org = WHITESPACE_PATTERN.sub(' ', clean_org)
 
         # Extract specialty
         specialty = parts[1].strip()
@@ -442,9 +527,9 @@ def parse_specialty_info(primary_id, chartered_org):
     
     return chartered_org, ""
 
-def extract_unit_fields(wrapper, index, unit_name_elem=None):
-    """Extract all possible fields from a unit wrapper"""
-    unit_data = {
+def new_unit_data(index):
+    """Empty unit record with every field in output order"""
+    return {
         'index': index,
         'primary_identifier': '',
         'unit_type': '',
@@ -464,39 +549,69 @@ def extract_unit_fields(wrapper, index, unit_name_elem=None):
         'distance': '',
         'raw_content': ''
     }
+
+def apply_unit_name(unit_data, full_name):
+    """Set primary identifier, unit type/number, town, chartered org and specialty from the unit name"""
+    unit_data['primary_identifier'] = full_name
+    
+    # Parse unit type, number, and organization
+    name_parts = full_name.split()
+    if len(name_parts) >= 2:
+        unit_data['unit_type'] = name_parts[0]
+        unit_data['unit_number'] = name_parts[1]
+        if len(name_parts) > 2:
+            chartered_org = ' '.join(name_parts[2:])
+            
+            # Extract town name from chartered organization
+            unit_data['unit_town'] = extract_town_from_org(chartered_org)
+
+            # Handle specialty parsing for all unit types (BeAScout now provides specialty for Troops too)
+            clean_org, specialty = parse_specialty_info(full_name, chartered_org)
+            unit_data['chartered_organization'] = clean_org
+            unit_data['specialty'] = specialty
+
+def format_distance(distance_text):
+    """'1.2 mi' -> '1.2 miles' (empty if no distance)"""
+    return distance_text.split()[0] + ' miles' if distance_text else ''
+
+def format_phone_number(phone_text):
+    """Format as (XXX) XXX-XXXX when the text holds 10 digits, otherwise keep it as is"""
+    # Extract just the digits
+    digits = NON_DIGIT_PATTERN.sub('', phone_text)
+    if len(digits) == 10:
+        return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
+    return phone_text
+
+def is_unit_website(href):
+    """Skip mailto, tel, and online registration links"""
+    return ('mailto:' not in href and 'tel:' not in href and 
+            'OnlineReg' not in href and 'my.scouting.org' not in href)
+
+def extract_unit_fields(wrapper, index, unit_name_elem=None, distance_elem=None):
+    """Extract all possible fields from a unit wrapper
+
+    distance_elem is the unit's own unit-miles div when known (card-scoped extraction);
+    otherwise distance is looked up from the unit name's enclosing list row.
+    """
+    unit_data = new_unit_data(index)
+    unit_address = ""
     
     try:
         # Use the provided unit_name_elem for more accurate pairing
         if unit_name_elem:
             h5_elem = unit_name_elem.find('h5')
             if h5_elem:
-                full_name = h5_elem.get_text(separator=' ').replace('\n', ' ').strip()
-                unit_data['primary_identifier'] = full_name
-                
-                # Parse unit type, number, and organization
-                name_parts = full_name.split()
-                if len(name_parts) >= 2:
-                    unit_data['unit_type'] = name_parts[0]
-                    unit_data['unit_number'] = name_parts[1]
-                    if len(name_parts) > 2:
-                        chartered_org = ' '.join(name_parts[2:])
-                        
-                        # Extract town name from chartered organization
-                        unit_data['unit_town'] = extract_town_from_org(chartered_org)
-
-                        # Handle specialty parsing for all unit types (BeAScout now provides specialty for Troops too)
-                        clean_org, specialty = parse_specialty_info(full_name, chartered_org)
-                        unit_data['chartered_organization'] = clean_org
-                        unit_data['specialty'] = specialty
+                apply_unit_name(unit_data, h5_elem.get_text(separator=' ').replace('\n', ' ').strip())
         
         # Extract distance
-        if unit_name_elem:
+        if distance_elem is None and unit_name_elem:
             row = unit_name_elem.find_parent('div', class_='row')
             if row:
                 distance_elem = row.find('div', class_='unit-miles')
-                if distance_elem:
-                    distance_text = distance_elem.get_text(strip=True)
-                    unit_data['distance'] = distance_text.split()[0] + ' miles'
+        if distance_elem:
+            distance_text = distance_elem.get_text(strip=True)
+            if distance_text:
+                unit_data['distance'] = format_distance(distance_text)
         
         # Extract from card-body container
         unit_body = wrapper.find('div', class_='unit-body')
@@ -504,40 +619,31 @@ def extract_unit_fields(wrapper, index, unit_name_elem=None):
             unit_body = wrapper
         
         # Contact email
-        email_links = unit_body.find_all('a', href=re.compile(r'mailto:'))
+        email_links = unit_body.find_all('a', href=MAILTO_HREF_PATTERN)
         if email_links:
             email_href = email_links[0].get('href', '')
             unit_data['contact_email'] = email_href.replace('mailto:', '')
         
         # Contact person - look for text near "Contact:"
-        contact_labels = unit_body.find_all(string=re.compile(r'Contact:', re.IGNORECASE))
+        contact_labels = unit_body.find_all(string=CONTACT_LABEL_PATTERN)
         for label in contact_labels:
             next_element = label.parent.next_sibling
             if next_element and hasattr(next_element, 'get_text'):
                 contact_text = next_element.get_text(strip=True)
-                if contact_text and not re.match(r'^[\s\n]*$', contact_text):
+                if contact_text and not BLANK_TEXT_PATTERN.match(contact_text):
                     unit_data['contact_person'] = contact_text
                     break
         
         # Phone number - look for phone patterns and format consistently
-        phone_links = unit_body.find_all('a', href=re.compile(r'tel:'))
+        phone_links = unit_body.find_all('a', href=TEL_HREF_PATTERN)
         if phone_links:
-            phone_text = phone_links[0].get_text(strip=True)
-            # Extract just the digits
-            digits = re.sub(r'[^\d]', '', phone_text)
-            # Format as (XXX) XXX-XXXX if we have 10 digits
-            if len(digits) == 10:
-                unit_data['phone_number'] = f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
-            else:
-                unit_data['phone_number'] = phone_text
+            unit_data['phone_number'] = format_phone_number(phone_links[0].get_text(strip=True))
         
         # Website - exclude online registration and generic URLs
-        website_links = unit_body.find_all('a', href=re.compile(r'^https?://'))
+        website_links = unit_body.find_all('a', href=HTTP_HREF_PATTERN)
         for link in website_links:
             href = link.get('href', '')
-            # Skip mailto, tel, and online registration links
-            if ('mailto:' not in href and 'tel:' not in href and 
-                'OnlineReg' not in href and 'my.scouting.org' not in href):
+            if is_unit_website(href):
                 unit_data['website'] = href
                 break
         
@@ -554,122 +660,22 @@ def extract_unit_fields(wrapper, index, unit_name_elem=None):
             unit_data['description'] = ""
         
         # Unit composition (Boy Troop, Girl Troop, etc.)
-        composition_elem = unit_body.find(string=re.compile(r'(Boy|Girl|Boys|Girls|Coed)'))
+        composition_elem = unit_body.find(string=COMPOSITION_PATTERN)
         if composition_elem:
             # Get the parent element's text
             parent_text = composition_elem.parent.get_text(strip=True)
             if any(unit_type in parent_text for unit_type in ['Troop', 'Pack', 'Crew', 'Post', 'Club']):
                 unit_data['unit_composition'] = parent_text
         
-        # Check if unit-address div is empty/missing for QUALITY_UNIT_ADDRESS logic
+        # Capture unit-address content for quality analysis and location extraction
         address_containers = unit_body.find_all('div', class_='unit-address')
-        unit_address_div_empty = not address_containers or not address_containers[0].get_text(strip=True)
-        
-        # Capture unit-address content for quality analysis
-        unit_address = ""
         if address_containers:
             unit_address = address_containers[0].get_text(separator=' ', strip=True)
-        
-        
-        # Meeting location extraction - try address field first, then description
-        raw_location_from_address = ""
-        raw_location_from_description = ""
-        
-        # 1. Try to extract from unit-address div
-        if address_containers:
-            # Replace <br> tags with spaces before extracting text to fix concatenation
-            container = address_containers[0]
-            for br in container.find_all("br"):
+            # Replace <br> tags with spaces so raw content text is not concatenated
+            for br in address_containers[0].find_all("br"):
                 br.replace_with(" ")
-            raw_location_from_address = container.get_text(separator=' ', strip=True)
-        
-        # 2. Try to extract from description
-        if unit_data['description']:
-            day, time, location = extract_meeting_info(unit_data['description'])
-            if day:
-                unit_data['meeting_day'] = day
-            if time:
-                unit_data['meeting_time'] = time
-            if location:
-                raw_location_from_description = location
-        
-        # Unified location extraction - extract both meeting location and town from same sources
-        meeting_location = ""
-        meeting_location_source = "none"
-        unit_town = ""
-        
-        # Priority 1: Extract from unit-address content (most reliable)
-        if unit_address:
-            address_components = extract_location_components(unit_address, 'address')
-            if address_components['full_location']:
-                meeting_location = address_components['full_location']
-                meeting_location_source = "address"
-            else:
-                # FALLBACK: If no location extracted but unit_address contains street address,
-                # use the entire unit_address value to preserve facility name + address
-
-                # Check if unit is in exception list (doesn't require street number)
-                is_exception = check_location_exception(unit_data)
-
-                if is_exception:
-                    # Exception unit - accept location without street number requirement
-                    meeting_location = unit_address
-                    meeting_location_source = "address_fallback_exception"
-                elif re.search(r'\d+\s+[A-Za-z][A-Za-z\s]+(?:Street|St|Road|Rd|Avenue|Ave|Lane|Ln|Drive|Dr|Boulevard|Blvd|Way|Court|Ct|Place|Pl)',
-                               unit_address, re.IGNORECASE):
-                    # Normal fallback - requires street number
-                    meeting_location = unit_address
-                    meeting_location_source = "address_fallback"
-            if address_components['town']:
-                unit_town = address_components['town']
-        
-        # Priority 2: Extract from description if no unit-address location (still reliable)
-        if not meeting_location and raw_location_from_description:
-            meeting_location = raw_location_from_description
-            meeting_location_source = "description"
-            # Also try to extract town from description location
-            if not unit_town:
-                desc_components = extract_location_components(raw_location_from_description, 'description')
-                if desc_components['town']:
-                    unit_town = desc_components['town']
-        
-        # Set meeting location with proper formatting and source tracking
-        if meeting_location:
-            formatted_location = format_meeting_location(meeting_location)
-            unit_data['meeting_location'] = formatted_location
-            unit_data['meeting_location_source'] = meeting_location_source
-        else:
-            unit_data['meeting_location'] = ""
-            unit_data['meeting_location_source'] = "none"
         
-        # Set town if extracted from reliable sources
-        if unit_town:
-            unit_data['unit_town'] = unit_town
-        
-        # Conservative town extraction fallback - only if not already extracted above
-        # Uses unified location extraction with correct precedence
-        if not unit_data.get('unit_town'):
-            # Method 3: Extract from description field (still reliable)
-            if unit_data.get('description'):
-                # Filter out contact information patterns to avoid extracting person names as towns
-                description_text = unit_data['description']
-                # Skip description if it primarily contains contact information  
-                if not re.search(r'Contact:\s*[A-Za-z\s]+\s*Email:', description_text, re.IGNORECASE):
-                    desc_components = extract_location_components(description_text, 'description')
-                    if desc_components['town']:
-                        unit_data['unit_town'] = desc_components['town']
-            
-            # Method 4: Extract from unit-name field (fallback only)  
-            if not unit_data.get('unit_town') and unit_data.get('primary_identifier'):
-                name_components = extract_location_components(unit_data['primary_identifier'], 'org_name')
-                if name_components['town']:
-                    unit_data['unit_town'] = name_components['town']
-            
-            # Method 5: Fallback to chartered organization extraction (last resort)
-            if not unit_data.get('unit_town') and unit_data.get('chartered_organization'):
-                org_components = extract_location_components(unit_data['chartered_organization'], 'org_name')
-                if org_components['town']:
-                    unit_data['unit_town'] = org_components['town']
+        derive_meeting_fields(unit_data, unit_address)
         
         # Raw content for debugging
         unit_data['raw_content'] = wrapper.get_text()[:200] + "..."
@@ -678,29 +684,109 @@ def extract_unit_fields(wrapper, index, unit_name_elem=None):
         print(f"Error processing unit {index}: {e}")
         unit_data['raw_content'] = f"Error: {e}"
     
+    return finish_unit_fields(unit_data, unit_address)
+
+def derive_meeting_fields(unit_data, unit_address):
+    """
+    Meeting day/time/location and town from description and unit-address text
+    Shared by the HTML and search API extraction paths
+    """
+    raw_location_from_description = ""
+    
+    # 1. Try to extract from description
+    if unit_data['description']:
+        day, time, location = extract_meeting_info(unit_data['description'])
+        if day:
+            unit_data['meeting_day'] = day
+        if time:
+            unit_data['meeting_time'] = time
+        if location:
+            raw_location_from_description = location
+    
+    # Unified location extraction - extract both meeting location and town from same sources
+    meeting_location = ""
+    meeting_location_source = "none"
+    unit_town = ""
+    
+    # Priority 1: Extract from unit-address content (most reliable)
+    if unit_address:
+        address_components = extract_location_components(unit_address, 'address')
+        if address_components['full_location']:
+            meeting_location = address_components['full_location']
+            meeting_location_source = "address"
+        else:
+            # FALLBACK: If no location extracted but unit_address contains street address,
+            # use the entire unit_address value to preserve facility name + address
+
+            # Check if unit is in exception list (doesn't require street number)
+            is_exception = check_location_exception(unit_data)
+
+            if is_exception:
+                # Exception unit - accept location without street number requirement
+                meeting_location = unit_address
+                meeting_location_source = "address_fallback_exception"
+            elif STREET_NUMBER_ADDRESS_PATTERN.search(unit_address):
+                # Normal fallback - requires street number
+                meeting_location = unit_address
+                meeting_location_source = "address_fallback"
+        if address_components['town']:
+            unit_town = address_components['town']
+    
+    # Priority 2: Extract from description if no unit-address location (still reliable)
+    if not meeting_location and raw_location_from_description:
+        meeting_location = raw_location_from_description
+        meeting_location_source = "description"
+        # Also try to extract town from description location
+        if not unit_town:
+            desc_components = extract_location_components(raw_location_from_description, 'description')
+            if desc_components['town']:
+                unit_town = desc_components['town']
+    
+    # Set meeting location with proper formatting and source tracking
+    if meeting_location:
+        formatted_location = format_meeting_location(meeting_location)
+        unit_data['meeting_location'] = formatted_location
+        unit_data['meeting_location_source'] = meeting_location_source
+    else:
+        unit_data['meeting_location'] = ""
+        unit_data['meeting_location_source'] = "none"
+    
+    # Set town if extracted from reliable sources
+    if unit_town:
+        unit_data['unit_town'] = unit_town
+    
+    # Conservative town extraction fallback - only if not already extracted above
+    # Uses unified location extraction with correct precedence
+    if not unit_data.get('unit_town'):
+        # Method 3: Extract from description field (still reliable)
+        if unit_data.get('description'):
+            # Filter out contact information patterns to avoid extracting person names as towns
+            description_text = unit_data['description']
+            # Skip description if it primarily contains contact information  
+            if not CONTACT_EMAIL_DESCRIPTION_PATTERN.search(description_text):
+                desc_components = extract_location_components(description_text, 'description')
+                if desc_components['town']:
+                    unit_data['unit_town'] = desc_components['town']
+        
+        # Method 4: Extract from unit-name field (fallback only)  
+        if not unit_data.get('unit_town') and unit_data.get('primary_identifier'):
+            name_components = extract_location_components(unit_data['primary_identifier'], 'org_name')
+            if name_components['town']:
+                unit_data['unit_town'] = name_components['town']
+        
+        # Method 5: Fallback to chartered organization extraction (last resort)
+        if not unit_data.get('unit_town') and unit_data.get('chartered_organization'):
+            org_components = extract_location_components(unit_data['chartered_organization'], 'org_name')
+            if org_components['town']:
+                unit_data['unit_town'] = org_components['town']
+
+def finish_unit_fields(unit_data, unit_address):
+    """District assignment and unit-address content (last fields of every unit record)"""
     # Add district assignment based on unit_town
     unit_town = unit_data.get('unit_town', '').strip()
     unit_data['district'] = get_district_for_town(unit_town)
     
-    # Integrate quality scoring - calculate score, grade, and quality tags during HTML parsing
-    try:
-        from src.pipeline.core.quality_scorer import UnitQualityScorer
-        scorer = UnitQualityScorer()
-        
-        # Score this individual unit
-        score, recommendations = scorer.score_unit(unit_data)
-        
-        # Add scoring results to unit data for single source of truth
-        unit_data['completeness_score'] = round(score, 1)
-        unit_data['completeness_grade'] = scorer.get_letter_grade(score)
-        unit_data['quality_tags'] = recommendations
-        
-    except Exception as e:
-        # Fallback if quality scoring fails - don't break HTML parsing
-        print(f"Warning: Quality scoring failed for unit {index}: {e}")
-        unit_data['completeness_score'] = 0.0
-        unit_data['completeness_grade'] = 'F'
-        unit_data['quality_tags'] = []
+    # Quality scoring (score, grade, quality tags) is applied per page in bulk by score_units()
     
     # Add unit-address content to support simplified QUALITY_UNIT_ADDRESS logic
     unit_data['unit_address'] = unit_address
@@ -718,71 +804,19 @@ def extract_meeting_info(description):
     time = ""
     location = ""
     
-    # Meeting day patterns - enhanced to capture more variations including abbreviations
-    day_patterns = [
-        r'meets?\s+(?:most\s+)?(?:on\s+)?([A-Za-z]+day)s?',  # "meets most Wednesdays"
-        r'([A-Za-z]+day)s?\s+(?:at|from|nights?)',  # "Wednesday nights", "Mondays at"
-        r'(?:every\s+)?([A-Za-z]+day)\s+(?:night|evening)',  # "every Monday night"
-        r'(?:first|second|third|fourth|1st|2nd|3rd|4th|last)\s+(?:and\s+(?:second|third|fourth|2nd|3rd|4th)\s+)?([A-Za-z]+day)',  # "1st & 3rd Tuesday"
-        r'([A-Za-z]+day)s?\s+\d{1,2}:\d{2}',  # "Monday 7:00"
-        r'\d{1,2}:\d{2}\s*[ap]?m?\s*([A-Za-z]+day)s?',  # "7pm Tuesdays", "6:30 PM Wednesdays"
-        r'(?:meet|meets)\s+\d{1,2}[ap]?m?\s*([A-Za-z]+day)s?',  # "Meet 7pm Tuesdays"
-        # Day abbreviations - capture and expand to full day names
-        r'(?:every\s+)?(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\.?\s+(?:night|evening)',  # "every Tue. night"
-        r'(?:meet|meets)\s+(?:every\s+)?(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\.?',  # "Meet every Tues."
-        r'(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\.?\s+(?:night|evening)',  # "Tues. night"
-        r'(Tues|Thurs)\.?',  # Common abbreviations "Tues." or "Thurs."
-    ]
-    
-    # Meeting time patterns - enhanced with boundary checks to avoid email/unit number contamination
-    # while still capturing legitimate meeting times from descriptions
-    time_patterns = [
-        r'(\d{1,2}:\d{2})\s*-\s*(\d{1,2}:\d{2})\s*([ap])\.?m?\.?',  # "7:00 - 8:30 p.m."
-        r'(\d{1,2}:\d{2})\s*([ap])\.?m?\.?\s*-\s*(\d{1,2}:\d{2})\s*([ap])\.?m?\.?',  # "6:30 p.m. - 8:00 p.m."
-        r'(\d{1,2}:\d{2})\s*-\s*(\d{1,2}:\d{2})',  # "7:00 - 8:30" (full time range, no AM/PM)
-        r'(?:\s|,)\s*(\d{1,2})\s*-\s*(\d{1,2}:\d{2})',  # " 7 - 8:30" (simple time range after space/comma)
-        r'(?:at\s+)?(\d{1,2}:\d{2})\s*([ap])\.?m?\.?',  # "at 6:30pm", "7:00 PM"
-        r'(?:at\s+)(\d{3,4})\s*([ap])\.?m?\.?',  # "at 330pm", "at 1230 PM" - requires "at" context
-        
-        # ENHANCED: Legitimate time patterns with proper context to avoid unit identifier contamination
-        r'(?:at|meets?)\s+(\d{1,2})\s*([ap])\.?m?\.?',  # "at 7pm" or "meets 6am" - requires context word
-        r'(?:from\s+)?(\d{1,2}:\d{2})\s*(?:to\s+(\d{1,2}:\d{2}))?\s*([ap])\.?m?\.?',  # "from 7:00 to 8:30 PM"
-        
-        # NEW: Additional legitimate patterns for meeting descriptions
-        r'(?:from\s+)(\d{1,2})\s*([ap])m?\s*-\s*(\d{1,2})\s*([ap])m?',  # "from 6pm - 7pm"
-        r'(?:nights?\s+from\s+)(\d{1,2})\s*([ap])m?\s*-\s*(\d{1,2})\s*([ap])m?',  # "nights from 6pm - 7pm"
-        r'(?:meetings?\s*-\s*)(\d{1,2})\s*-\s*(\d{1,2})\s*([ap])m?',  # "meetings - 7-8pm"  
-        r'(?:on\s+\w+days?\s+)(\d{1,2})\s*([ap])m?(?:\s+at)',  # "on Tuesdays 6PM at"
-        r'(?:meet(?:s|ing)?.*?)(\d{1,2}:\d{2})\s*-\s*(\d{1,2})\s*([ap])m?',  # "meets from 6:30-8 pm"
-        r'(?:from\s+)(\d{1,2})\s*-\s*(\d{1,2})\s*([ap])m?',  # "from 4-6 pm"
-    ]
-    
     # Extract day
-    for pattern in day_patterns:
-        match = re.search(pattern, description, re.IGNORECASE)
+    for pattern in DAY_PATTERNS:
+        match = pattern.search(description)
         if match:
             day_match = match.group(1).capitalize()
             
-            # Expand common abbreviations to full day names
-            abbreviation_map = {
-                'Mon': 'Monday',
-                'Tue': 'Tuesday', 
-                'Tues': 'Tuesday',
-                'Wed': 'Wednesday',
-                'Thu': 'Thursday',
-                'Thurs': 'Thursday', 
-                'Fri': 'Friday',
-                'Sat': 'Saturday',
-                'Sun': 'Sunday'
-            }
-            
-            # Use full day name if abbreviation found, otherwise keep original
-            day = abbreviation_map.get(day_match, day_match)
+            # Expand common abbreviations to full day names, otherwise keep original
+            day = DAY_ABBREVIATIONS.get(day_match, day_match)
             break
     
     # Extract time - handle various formats and clean up
-    for pattern in time_patterns:
-        match = re.search(pattern, description, re.IGNORECASE)
+    for pattern in TIME_PATTERNS:
+        match = pattern.search(description)
         if match:
             groups = match.groups()
             
@@ -842,10 +876,232 @@ def deduplicate_units(units):
     
     return unique_units
 
-def process_html_file(html_file_path, source_name=""):
-    """Process a single HTML file and extract unit data"""
+def get_available_parser_backends():
+    """Return parser backends usable in this environment"""
+    available = ['html.parser']
+    if LXML_AVAILABLE:
+        available.append('lxml')
+    if SELECTOLAX_AVAILABLE:
+        available.append('selectolax')
+    return available
+
+def resolve_parser_backend(backend=None):
+    """Return requested backend, falling back to html.parser if it is not installed"""
+    backend = backend or DEFAULT_PARSER_BACKEND
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown HTML parser backend: {backend} (choose from {', '.join(PARSER_BACKENDS)})")
+    if backend not in get_available_parser_backends():
+        print(f"⚠️  HTML parser backend '{backend}' not installed, using {DEFAULT_PARSER_BACKEND}")
+        return DEFAULT_PARSER_BACKEND
+    return backend
+
+def find_unit_elements_soup(content, backend):
+    """Parse whole page with a BeautifulSoup tree builder and return (card-body divs, unit-name divs)"""
+    soup = BeautifulSoup(content, backend)
+    return soup.find_all('div', class_='card-body'), soup.find_all('div', class_='unit-name')
+
+def find_unit_elements_selectolax(content):
+    """
+    Locate unit elements with selectolax (lexbor C parser), then build BeautifulSoup
+    fragments for only those elements so extract_unit_fields() sees the same Tag API.
+    Each unit-name fragment is wrapped in its enclosing row's distance element so
+    find_parent('div', class_='row') distance lookup behaves as on the full page.
+    """
+    tree = LexborHTMLParser(content)
+    fragment_builder = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+    unit_wrappers = [BeautifulSoup(node.html, fragment_builder).find('div', class_='card-body')
+                     for node in tree.css('div.card-body')]
+
+    unit_names = []
+    row_miles_html = {}
+    for node in tree.css('div.unit-name'):
+        row = node.parent
+        while row is not None and not (row.tag == 'div' and 'row' in (row.attributes.get('class') or '').split()):
+            row = row.parent
+
+        miles_html = ''
+        if row is not None:
+            row_key = row.mem_id
+            if row_key not in row_miles_html:
+                miles_node = row.css_first('div.unit-miles')
+                row_miles_html[row_key] = miles_node.html if miles_node else ''
+            miles_html = row_miles_html[row_key]
+            fragment = f'<div class="row">{miles_html}{node.html}</div>'
+        else:
+            fragment = node.html
+
+        unit_names.append(BeautifulSoup(fragment, fragment_builder).find('div', class_='unit-name'))
+
+    return unit_wrappers, unit_names
+
+def find_unit_elements(content, backend=DEFAULT_PARSER_BACKEND):
+    """Return (card-body elements, unit-name elements) using the given parser backend"""
+    if backend == 'selectolax':
+        return find_unit_elements_selectolax(content)
+    return find_unit_elements_soup(content, backend)
+
+# Card-scoped pre-scan: each unit is a <div class="... unit-card-item ..."> holding its own
+# unit-miles, card-body and unit-name, so only those fragments need a DOM parse
+UNIT_CARD_START_PATTERN = re.compile(r'<div\b[^>]*\bclass="[^"]*\bunit-card-item\b[^"]*"[^>]*>', re.IGNORECASE)
+DIV_TAG_PATTERN = re.compile(r'<(/?)div\b[^>]*>', re.IGNORECASE)
+
+def iter_unit_card_fragments(content):
+    """
+    Yield the HTML of each unit card using a regex pre-scan of div nesting
+    An unbalanced card is cut at the next card start (BeautifulSoup closes open tags)
+    """
+    card_starts = [m.start() for m in UNIT_CARD_START_PATTERN.finditer(content)]
+    for i, start in enumerate(card_starts):
+        limit = card_starts[i + 1] if i + 1 < len(card_starts) else len(content)
+        end = limit
+        depth = 0
+        for tag in DIV_TAG_PATTERN.finditer(content, start, limit):
+            depth += -1 if tag.group(1) else 1
+            if depth == 0:
+                end = tag.end()
+                break
+        yield content[start:end]
+
+def get_fragment_builder(backend):
+    """BeautifulSoup tree builder used for small per-unit fragments"""
+    if backend == 'selectolax':
+        return 'lxml' if LXML_AVAILABLE else 'html.parser'
+    return backend
+
+def iter_unit_card_elements_selectolax(content, fragment_builder):
+    """
+    Locate unit cards with selectolax (lexbor C parser) and yield (card-body, unit-name,
+    unit-miles) with BeautifulSoup fragments built for only the card-body and unit-miles
+    """
+    for node in LexborHTMLParser(content).css('div.unit-card-item'):
+        body_node = node.css_first('div.card-body')
+        if body_node is None:
+            continue
+        wrapper = BeautifulSoup(body_node.html, fragment_builder).find('div', class_='card-body')
+        miles_node = node.css_first('div.unit-miles')
+        miles = BeautifulSoup(miles_node.html, fragment_builder).find('div', class_='unit-miles') if miles_node else None
+        yield wrapper, wrapper.find('div', class_='unit-name'), miles
+
+def iter_unit_card_elements(content, backend):
+    """Yield (card-body, unit-name, unit-miles) per unit card using the given parser backend"""
+    if backend == 'selectolax':
+        yield from iter_unit_card_elements_selectolax(content, get_fragment_builder(backend))
+        return
+    for fragment in iter_unit_card_fragments(content):
+        card = BeautifulSoup(fragment, backend)
+        wrapper = card.find('div', class_='card-body')
+        if wrapper is not None:
+            yield wrapper, wrapper.find('div', class_='unit-name'), card.find('div', class_='unit-miles')
+
+def iter_units_from_html(content, source_name="", backend=None):
+    """
+    Lazily yield unit dicts from page HTML, parsing one unit card at a time
+    Falls back to whole-page name/body pairing if the page has no unit-card-item markup
+    """
+    backend = resolve_parser_backend(backend)
+
+    index = 0
+    for wrapper, unit_name_elem, distance_elem in iter_unit_card_elements(content, backend):
+        unit_data = extract_unit_fields(wrapper, index, unit_name_elem, distance_elem)
+        unit_data['data_source'] = source_name
+        index += 1
+        yield unit_data
+
+    if index:
+        return
+
+    # Fallback: page layout without unit cards - pair whole-page card-body and unit-name divs by index
+    unit_wrappers, unit_names = find_unit_elements(content, backend)
+    if unit_wrappers:
+        print(f"⚠️  No unit cards found, pairing {len(unit_wrappers)} unit containers with {len(unit_names)} unit names")
+    for i, wrapper in enumerate(unit_wrappers):
+        unit_name_elem = unit_names[i] if i < len(unit_names) else None
+        unit_data = extract_unit_fields(wrapper, i, unit_name_elem)
+        unit_data['data_source'] = source_name
+        yield unit_data
+
+# ---------------------------------------------------------------------------
+# Search API capture - raw JSON of the results XHR saved next to the page HTML
+# by BrowserScraper(capture_api=True); units are built from the rendered result
+# HTML it carries, with the saved page HTML as fallback
+# ---------------------------------------------------------------------------
+
+API_CAPTURE_SUFFIX = '.api.json'
+
+# A capture is trusted only if every unit it yields has one of these types and a numeric unit number
+API_UNIT_TYPES = frozenset({'Pack', 'Troop', 'Crew', 'Ship', 'Post', 'Club'})
+
+def get_api_capture_path(html_file_path):
+    """beascout_01720.html -> beascout_01720.api.json"""
+    return Path(html_file_path).with_suffix(API_CAPTURE_SUFFIX)
+
+def load_api_capture(html_file_path):
+    """Search API capture saved next to an HTML file, or None if missing/unreadable"""
+    capture_path = get_api_capture_path(html_file_path)
+    if not capture_path.exists():
+        return None
+    try:
+        with open(capture_path, 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"⚠️  Ignoring unreadable API capture {capture_path}: {e}")
+        return None
+
+def iter_api_html_fragments(body):
+    """Yield rendered result HTML strings from a search API response body, whatever the nesting"""
+    if isinstance(body, list):
+        for item in body:
+            yield from iter_api_html_fragments(item)
+    elif isinstance(body, dict):
+        for value in body.values():
+            yield from iter_api_html_fragments(value)
+    elif isinstance(body, str) and 'unit-card-item' in body:
+        yield body
+
+def iter_units_from_api_capture(capture, source_name="", backend=None):
+    """Yield unit dicts from the rendered result HTML in a search API capture"""
+    index = 0
+    for response in capture.get('responses', []):
+        for fragment in iter_api_html_fragments(response.get('body')):
+            for unit_data in iter_units_from_html(fragment, source_name, backend):
+                unit_data['index'] = index
+                index += 1
+                yield unit_data
+
+def is_valid_api_unit(unit_data):
+    """Unit from a capture whose name parsed into a known unit type and a numeric unit number"""
+    return unit_data['unit_type'] in API_UNIT_TYPES and unit_data['unit_number'].isdigit()
+
+def extract_units_from_api_capture(capture, source_name="", backend=None):
+    """
+    Units from a search API capture, or None when it cannot replace the page HTML:
+    no units, or any unit whose type/number does not parse (unrecognized response content)
+    """
+    units = list(iter_units_from_api_capture(capture, source_name, backend))
+    if not units:
+        return None
+    invalid = [unit['primary_identifier'] for unit in units if not is_valid_api_unit(unit)]
+    if invalid:
+        print(f"⚠️  {len(invalid)} search API capture unit(s) without a valid unit type/number "
+              f"(e.g. '{invalid[0]}')")
+        return None
+    return units
+
+def process_html_file(html_file_path, source_name="", backend=None):
+    """Process a single HTML file (or the search API capture saved with it) and extract unit data"""
     print(f"\nProcessing {source_name}: {html_file_path}")
     
+    # Prefer the search API capture when one was saved with the page
+    capture = load_api_capture(html_file_path)
+    if capture is not None:
+        units = extract_units_from_api_capture(capture, source_name, backend)
+        if units:
+            score_units(units)
+            print(f"Extracted {len(units)} units from {source_name} search API capture")
+            return units
+        print(f"⚠️  Search API capture not usable, falling back to HTML")
+    
     try:
         with open(html_file_path, 'r') as f:
             content = f.read()
@@ -853,120 +1109,137 @@ def process_html_file(html_file_path, source_name=""):
         print(f"File not found: {html_file_path}")
         return []
     
-    soup = BeautifulSoup(content, 'html.parser')
-    
-    # Find all unit containers
-    unit_wrappers = soup.find_all('div', class_='card-body')
-    unit_names = soup.find_all('div', class_='unit-name')
-    
-    print(f"Found {len(unit_wrappers)} unit containers")
-    print(f"Found {len(unit_names)} unit names")
-    
-    # Extract all units
-    units = []
-    for i, wrapper in enumerate(unit_wrappers):
-        unit_name_elem = unit_names[i] if i < len(unit_names) else None
-        unit_data = extract_unit_fields(wrapper, i, unit_name_elem)
-        
-        # Add source information
-        unit_data['data_source'] = source_name
-        units.append(unit_data)
+    # Extract all units, one card fragment at a time
+    units = list(iter_units_from_html(content, source_name, backend))
+    score_units(units)
     
     print(f"Extracted {len(units)} units from {source_name}")
     return units
 
 
-def main():
-    import sys
-    
-    if len(sys.argv) < 2:
-        print("Usage: python src/parsing/html_extractor.py <html_file> [additional_html_files...]")
-        print("Examples:")
-        print("  python src/parsing/html_extractor.py data/scraped/20250824_220843/beascout_01720.html")
-        print("  python src/parsing/html_extractor.py data/scraped/20250824_220843/beascout_01720.html data/scraped/20250824_220843/joinexploring_01720.html")
-        sys.exit(1)
-    
-    html_files = sys.argv[1:]
+def score_units(units):
+    """Add completeness score, grade and quality tags to a page of units (shared scorer, batched when large)"""
+    from src.pipeline.core.quality_scorer import get_quality_scorer
+    get_quality_scorer().apply_scores(units)
+
+
+def get_source_name(html_file):
+    """Determine data source name from an HTML filename"""
+    html_file = str(html_file).lower()
+    if 'beascout' in html_file:
+        return "BeAScout"
+    elif 'joinexploring' in html_file:
+        return "JoinExploring"
+    return "Unknown"
+
+def extract_units_from_files(html_files, backend=None):
+    """Extract, deduplicate and HNE-filter units from one or more HTML files
+
+    In-process entry point used by process_full_dataset so a whole scraped
+    session can be handled in one interpreter without intermediate JSON files.
+
+    Args:
+        html_files: List of HTML file paths (typically a beascout/joinexploring pair)
+        backend: HTML parser backend (html.parser, lxml or selectolax)
+
+    Returns:
+        dict with 'source_counts' (units per source before filtering) and
+        'all_units' (deduplicated HNE Council units)
+    """
     all_units = []
-    
+
     # Process each HTML file
     for html_file in html_files:
-        # Determine source name from filename
-        if 'beascout' in html_file.lower():
-            source_name = "BeAScout"
-        elif 'joinexploring' in html_file.lower():
-            source_name = "JoinExploring" 
-        else:
-            source_name = "Unknown"
-        
-        units = process_html_file(html_file, source_name)
+        units = process_html_file(str(html_file), get_source_name(html_file), backend)
         all_units.extend(units)
-    
+
     print(f"\n=== SUMMARY ===")
     print(f"Total units extracted from all sources: {len(all_units)}")
-    
+
     # Show breakdown by source
     source_counts = {}
     for unit in all_units:
         source = unit.get('data_source', 'Unknown')
         source_counts[source] = source_counts.get(source, 0) + 1
-    
+
     for source, count in source_counts.items():
         print(f"  {source}: {count} units")
-    
+
     # Deduplicate across all sources
     unique_units = deduplicate_units(all_units)
     print(f"After deduplication: {len(unique_units)} unique units")
-    
+
     # Apply HNE Council territory filtering
     hne_filtered_units = filter_hne_units(unique_units)
     print(f"After HNE filtering: {len(hne_filtered_units)} HNE Council units")
-    
-    # Determine output filename based on input
-    # Extract zip codes from filenames to create proper output filename
-    import re
+
+    return {
+        'source_counts': source_counts,
+        'all_units': hne_filtered_units
+    }
+
+def get_units_json_path(html_files, output_dir='data/raw'):
+    """Build all_units_<zip>.json output path from the input HTML filenames"""
+    # Extract 5-digit zip codes from filenames (look for beascout_##### or joinexploring_##### pattern)
     zip_codes = set()
     for file in html_files:
-        # Extract 5-digit zip codes from filename (look for beascout_##### or joinexploring_##### pattern)
-        zip_match = re.search(r'(?:beascout|joinexploring)_(\d{5})\.html', file)
+        zip_match = re.search(r'(?:beascout|joinexploring)_(\d{5})\.html', str(file))
         if zip_match:
             zip_codes.add(zip_match.group(1))
-    
-    # Determine output directory based on session type
-    import os
-    session_type = os.environ.get('SESSION_TYPE', 'pipeline')
-    if session_type == 'regression':
-        output_dir = 'data/output/regression/raw'
-    else:
-        output_dir = 'data/raw'
 
     if zip_codes:
-        # Use first zip code found for output filename
-        zip_code = sorted(zip_codes)[0]  # Use first zip code alphabetically for consistency
-        output_file = f'{output_dir}/all_units_{zip_code}.json'
-    else:
-        # Fallback to combined if no zip codes found
-        output_file = f'{output_dir}/all_units_combined.json'
-    
-    # Save all units to JSON
+        # Use first zip code alphabetically for consistency
+        zip_code = sorted(zip_codes)[0]
+        return f'{output_dir}/all_units_{zip_code}.json'
+
+    # Fallback to combined if no zip codes found
+    return f'{output_dir}/all_units_combined.json'
+
+def save_units_json(html_files, extraction, output_file):
+    """Save extraction results to JSON (debug artifact for in-process runs)"""
+    import os
+
     output_data = {
         'extraction_info': {
-            'source_files': html_files,
-            'source_counts': source_counts,
+            'source_files': [str(f) for f in html_files],
+            'source_counts': extraction['source_counts'],
             'extraction_date': str(__import__('datetime').datetime.now())
         },
-        'total_units': len(hne_filtered_units),
-        'all_units': hne_filtered_units
+        'total_units': len(extraction['all_units']),
+        'all_units': extraction['all_units']
     }
-    
+
     # Create output directory if it doesn't exist
-    import os
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    
+
     with open(output_file, 'w') as f:
         json.dump(output_data, f, indent=2)
+
+    print(f"Saved all {len(extraction['all_units'])} units to {output_file}")
+    return output_file
+
+def main():
+    import sys
+    import os
     
-    print(f"Saved all {len(hne_filtered_units)} units to {output_file}")
+    if len(sys.argv) < 2:
+        print("Usage: python src/parsing/html_extractor.py <html_file> [additional_html_files...]")
+        print("Examples:")
+        print("  python src/parsing/html_extractor.py data/scraped/20250824_220843/beascout_01720.html")
+        print("  python src/parsing/html_extractor.py data/scraped/20250824_220843/beascout_01720.html data/scraped/20250824_220843/joinexploring_01720.html")
+        sys.exit(1)
+    
+    html_files = sys.argv[1:]
+    extraction = extract_units_from_files(html_files)
+    
+    # Determine output directory based on session type
+    session_type = os.environ.get('SESSION_TYPE', 'pipeline')
+    if session_type == 'regression':
+        output_dir = 'data/output/regression/raw'
+    else:
+        output_dir = 'data/raw'
+
+    save_units_json(html_files, extraction, get_units_json_path(html_files, output_dir))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -2,133 +2,118 @@
 """
 Process Full Dataset - Current Version
 Process scraped HTML files using current ScrapedDataParser pipeline to generate debug logs
+All zip codes are extracted in-process; per-zip JSON files are optional debug artifacts
+Sessions with a scrape manifest are processed incrementally: zips whose unit cards are
+unchanged reuse the previous session's extracted units (see scrape_manifest)
 """
 
+import io
 import os
 import sys
 import json
 import argparse
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, List, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.append(str(project_root))
 
 from src.pipeline.processing.scraped_data_parser import ScrapedDataParser
+from src.pipeline.processing.html_extractor import (
+    extract_units_from_files, get_units_json_path, save_units_json,
+    DEFAULT_PARSER_BACKEND, PARSER_BACKENDS
+)
+from src.pipeline.processing.scrape_manifest import (
+    load_manifest, find_previous_session, fingerprint_zip_pages, combine_fingerprints,
+    load_cached_units, save_cached_units, link_cached_units
+)
+from src.pipeline.core.debug_log_sink import DebugLogSink
 from src.pipeline.core.session_utils import SessionManager, session_logging
 
-def extract_units_from_html(beascout_file: Path, joinexploring_file: Path, zip_code: str, session_manager: SessionManager = None) -> str:
+def get_raw_output_dir(session_manager: SessionManager = None) -> str:
+    """Raw output directory for the session type (regression output kept separate)"""
+    if session_manager and session_manager.session_type == 'regression':
+        return "data/output/regression/raw"
+    return "data/raw"
+
+def ensure_debug_timestamp():
+    """Share one UNIT_DEBUG_TIMESTAMP across the run so all zips write to one debug log"""
+    if 'UNIT_DEBUG_TIMESTAMP' not in os.environ:
+        os.environ['UNIT_DEBUG_TIMESTAMP'] = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+def extract_units_from_html(beascout_file: Path, joinexploring_file: Path, zip_code: str,
+                            session_manager: SessionManager = None, save_json: bool = False,
+                            backend: str = DEFAULT_PARSER_BACKEND) -> Optional[List[Dict]]:
     """
-    Extract units from HTML files using legacy parser, save to JSON
-    Returns path to generated JSON file
+    Extract HNE units from a zip code's HTML pair in-process
+    Returns list of raw unit dicts, or None on failure
+    Raw extraction is written to all_units_<zip>.json only when save_json is set (debug artifact)
     """
     # These detailed messages go to log file only in terminal_terse mode
     print(f"  Processing BeAScout: {beascout_file}")
     print(f"  Processing JoinExploring: {joinexploring_file}")
 
     try:
-        # Initialize debug session in subprocess by setting environment variable
-        import os
-        import datetime
-        if 'UNIT_DEBUG_TIMESTAMP' not in os.environ:
-            shared_timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            os.environ['UNIT_DEBUG_TIMESTAMP'] = shared_timestamp
-
-        # Pass session type to subprocess for output directory selection
-        if session_manager:
-            os.environ['SESSION_TYPE'] = session_manager.session_type
-
-        # Use HTML parser to extract units to JSON with proper working directory
-        # Ensure we're in the project root for proper imports
-        import subprocess
-        project_root = Path(__file__).parent.parent.parent.parent
-        cmd = [
-            'python3',
-            'src/pipeline/processing/html_extractor.py',
-            str(beascout_file),
-            str(joinexploring_file)
-        ]
-        result = subprocess.run(cmd, cwd=project_root, capture_output=True, text=True)
-
-        # Print subprocess output (will go to log file in terminal_terse mode)
-        if result.stdout:
-            print(result.stdout, end='')
-        if result.stderr:
-            print(result.stderr, end='')
-
-        result_code = result.returncode
-
-        if result_code == 0:
-            # Determine output directory based on session type
-            if session_manager and session_manager.session_type == 'regression':
-                json_file = f"data/output/regression/raw/all_units_{zip_code}.json"
-            else:
-                json_file = f"data/raw/all_units_{zip_code}.json"
+        ensure_debug_timestamp()
 
-            if os.path.exists(json_file):
-                print(f"    ✅ HTML extraction completed")
-                return json_file
-            else:
-                print(f"    ❌ HTML extraction failed - no output file")
-                return None
-        else:
-            print(f"    ❌ HTML extraction failed - command error")
-            return None
+        html_files = [str(beascout_file), str(joinexploring_file)]
+        extraction = extract_units_from_files(html_files, backend)
+
+        if save_json:
+            json_file = get_units_json_path(html_files, get_raw_output_dir(session_manager))
+            save_units_json(html_files, extraction, json_file)
+
+        print(f"    ✅ HTML extraction completed")
+        return extraction['all_units']
 
     except Exception as e:
         print(f"    ❌ HTML parsing failed: {e}")
         return None
 
-def process_with_current_pipeline(json_file: str, zip_code: str, session_manager: SessionManager = None) -> str:
+def process_with_current_pipeline(units: List[Dict], zip_code: str, session_manager: SessionManager = None,
+                                  save_json: bool = False) -> Optional[List[Dict]]:
     """
-    Process raw JSON through current ScrapedDataParser pipeline
+    Process raw units through current ScrapedDataParser pipeline
     This will generate debug logs via UnitIdentifierNormalizer.create_unit_record()
+    Processed units are written to all_units_<zip>_processed.json only when save_json is set
     """
     try:
         # Use ScrapedDataParser to create standardized records with debug logging
         parser = ScrapedDataParser()
-        units = parser.parse_json_file(json_file)
+        processed_units = parser.parse_units(units, f"ZIP {zip_code} extraction")
 
         # These detailed messages go to log file only in terminal_terse mode
-        print(f"    Processed {len(units)} units through current pipeline")
+        print(f"    Processed {len(processed_units)} units through current pipeline")
 
         # Check if units have integrated quality data
-        if units and len(units) > 0:
-            first_unit = units[0]
+        if processed_units:
+            first_unit = processed_units[0]
             has_score = 'completeness_score' in first_unit
             has_grade = 'completeness_grade' in first_unit
             has_tags = 'quality_tags' in first_unit
             print(f"    Quality integration check: score={has_score}, grade={has_grade}, tags={has_tags}")
 
-        # Ensure directory exists
-        import os
-        os.makedirs("data/raw", exist_ok=True)
-
-        # Save processed units with wrapper structure for consistency with combine_datasets
-        # Determine output directory based on session type
-        if session_manager and session_manager.session_type == 'regression':
-            processed_json = f"data/output/regression/raw/all_units_{zip_code}_processed.json"
-        else:
-            processed_json = f"data/raw/all_units_{zip_code}_processed.json"
-
-        data_wrapper = {
-            'units_with_scores': units,
-            'total_units': len(units),
-            'average_score': sum(u.get('completeness_score', 0) for u in units) / len(units) if units else 0.0,
-            'extraction_timestamp': datetime.now().isoformat()
-        }
-        with open(processed_json, 'w') as f:
-            json.dump(data_wrapper, f, indent=2)
-
-        # Verify file was created
-        if os.path.exists(processed_json):
+        if save_json:
+            # Save processed units with wrapper structure for consistency with combine_datasets
+            output_dir = get_raw_output_dir(session_manager)
+            os.makedirs(output_dir, exist_ok=True)
+            processed_json = f"{output_dir}/all_units_{zip_code}_processed.json"
+
+            data_wrapper = {
+                'units_with_scores': processed_units,
+                'total_units': len(processed_units),
+                'average_score': sum(u.get('completeness_score', 0) for u in processed_units) / len(processed_units) if processed_units else 0.0,
+                'extraction_timestamp': datetime.now().isoformat()
+            }
+            with open(processed_json, 'w') as f:
+                json.dump(data_wrapper, f, indent=2)
             print(f"    ✅ File saved successfully: {processed_json}")
-        else:
-            print(f"    ❌ File was not created: {processed_json}")
-            return None
 
-        return processed_json
+        return processed_units
 
     except Exception as e:
         print(f"    ❌ Current pipeline processing failed: {e}")
@@ -136,8 +121,218 @@ def process_with_current_pipeline(json_file: str, zip_code: str, session_manager
         traceback.print_exc()
         return None
 
+def find_session_zip_codes(session_path: Path) -> List[str]:
+    """Get sorted unique zip codes from beascout_<zip>.html filenames"""
+    zip_codes = set()
+    for file in session_path.glob("beascout_*.html"):
+        zip_codes.add(file.stem.replace('beascout_', ''))
+    return sorted(zip_codes)
+
+def extract_zip_units(session_path: Path, zip_code: str, session_manager: SessionManager = None,
+                      save_json: bool = False, backend: str = DEFAULT_PARSER_BACKEND) -> Optional[List[Dict]]:
+    """Extract and score one zip code's HTML pair, returning processed units or None on failure"""
+    beascout_file = session_path / f"beascout_{zip_code}.html"
+    joinexploring_file = session_path / f"joinexploring_{zip_code}.html"
+
+    # Step 1: Extract units from HTML
+    raw_units = extract_units_from_html(beascout_file, joinexploring_file, zip_code, session_manager, save_json, backend)
+    if raw_units is None:
+        print(f"❌ {zip_code} HTML extraction failed")
+        return None
+
+    # Step 2: Process through current pipeline (includes integrated quality scoring!)
+    processed_units = process_with_current_pipeline(raw_units, zip_code, session_manager, save_json)
+    if processed_units is None:
+        print(f"❌ {zip_code} pipeline processing failed")
+        return None
+
+    print(f"✅ {zip_code} completed successfully")
+    return processed_units
+
+def _extract_zip_worker(task: tuple) -> tuple:
+    """
+    Process pool entry point for one zip code
+    Debug log records are buffered in memory and stdout is captured so the parent
+    can replay both in zip order, keeping output identical to a serial run
+    """
+    session_dir, zip_code, session_type, save_json, backend = task
+
+    from src.pipeline.core.unit_identifier import UnitIdentifierNormalizer
+    UnitIdentifierNormalizer.capture_debug_logs()
+
+    cache_before = UnitIdentifierNormalizer.get_town_cache_stats()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        units = extract_zip_units(Path(session_dir), zip_code, SessionManager(session_type=session_type),
+                                  save_json, backend)
+    cache_after = UnitIdentifierNormalizer.get_town_cache_stats()
+    cache_delta = {key: cache_after[key] - cache_before[key] for key in ('hits', 'misses')}
+    return units, output.getvalue(), cache_delta, UnitIdentifierNormalizer.drain_debug_logs()
+
+def print_town_cache_stats(stats: Dict[str, int]):
+    """Log town normalization cache effectiveness for the run"""
+    lookups = stats['hits'] + stats['misses']
+    hit_rate = stats['hits'] / lookups * 100 if lookups else 0.0
+    print(f"🗂️  Town normalization cache: {stats['hits']} hits, {stats['misses']} misses ({hit_rate:.1f}% hit rate)")
+
+def merge_worker_debug_logs(debug_records: tuple):
+    """Append one worker's buffered (unit, discarded) debug records to the session debug logs"""
+    from src.pipeline.core.unit_identifier import UnitIdentifierNormalizer
+
+    for sink, records in zip(UnitIdentifierNormalizer.get_debug_sinks(), debug_records):
+        sink.write_records(records)
+
+def extract_zip_units_captured(session_path: Path, zip_code: str, session_manager: SessionManager = None,
+                               save_json: bool = False, backend: str = DEFAULT_PARSER_BACKEND) -> tuple:
+    """Serial extract_zip_units() that also returns the zip's debug log records (for the units cache)"""
+    from src.pipeline.core.unit_identifier import UnitIdentifierNormalizer
+
+    session_sinks = UnitIdentifierNormalizer.set_debug_sinks((DebugLogSink(), DebugLogSink()))
+    try:
+        units = extract_zip_units(session_path, zip_code, session_manager, save_json, backend)
+    finally:
+        debug_records = UnitIdentifierNormalizer.drain_debug_logs()
+        UnitIdentifierNormalizer.set_debug_sinks(session_sinks)
+    merge_worker_debug_logs(debug_records)
+    return units, debug_records
+
+def plan_unit_reuse(session_path: Path, zip_codes: List[str],
+                    previous_session: Optional[str] = None) -> Optional[Dict[str, tuple]]:
+    """
+    Incremental processing plan: zip code -> (fingerprint, cached units entry or None)
+    Cached units come from this session (re-run) or the previous session when the zip's
+    fingerprint matches; previous units are hardlinked (or referenced) into this session.
+    Returns None for sessions without a scrape manifest (everything is extracted, nothing cached)
+    """
+    manifest = load_manifest(session_path)
+    if manifest is None:
+        return None
+
+    previous_session = previous_session or manifest.get('previous_session') or find_previous_session(session_path)
+    previous_path = Path(previous_session) if previous_session else None
+    if previous_path and not previous_path.exists():
+        print(f"⚠️  Previous session not found: {previous_path}")
+        previous_path = None
+
+    plan = {}
+    for zip_code in zip_codes:
+        entry = manifest.get('zips', {}).get(zip_code)
+        fingerprint = entry['fingerprint'] if entry else combine_fingerprints(fingerprint_zip_pages(session_path, zip_code))
+        cached = load_cached_units(session_path, zip_code, fingerprint)
+        if cached is None and previous_path:
+            cached = load_cached_units(previous_path, zip_code, fingerprint)
+            if cached is not None:
+                link_cached_units(previous_path, session_path, zip_code)
+        plan[zip_code] = (fingerprint, cached)
+
+    reused = sum(1 for _, cached in plan.values() if cached is not None)
+    source = f" (previous session: {previous_path})" if previous_path else ""
+    print(f"♻️  Incremental processing: {reused} unchanged zips reused, {len(plan) - reused} to extract{source}")
+    return plan
+
+def reuse_cached_zip_units(zip_code: str, cached: dict) -> List[Dict]:
+    """Replay a cached zip's debug log records and return its processed units"""
+    ensure_debug_timestamp()
+    merge_worker_debug_logs(cached['debug_records'])
+    print(f"♻️  {zip_code} unchanged, reusing {len(cached['units'])} extracted units")
+    return cached['units']
+
+def extract_session_units(session_dir: str, session_manager: SessionManager = None,
+                          save_json: bool = False, workers: int = 1,
+                          backend: str = DEFAULT_PARSER_BACKEND, reuse: bool = True,
+                          previous_session: Optional[str] = None) -> Dict[str, List[Dict]]:
+    """
+    Extract and score all units in a scraped session directory
+
+    Args:
+        session_dir: Directory containing beascout_<zip>.html / joinexploring_<zip>.html pairs
+        session_manager: Optional session manager (terse progress and output directory)
+        save_json: Also write per-zip intermediate JSON files for debugging
+        workers: Number of worker processes (1 = serial in this process)
+        backend: HTML parser backend (html.parser, lxml or selectolax)
+        reuse: Reuse cached units for unchanged zips (sessions with a scrape manifest)
+        previous_session: Session to reuse units from (default: from the manifest / latest earlier session)
+
+    Returns:
+        Dict mapping zip code to processed unit records, in sorted zip order
+    """
+    session_path = Path(session_dir)
+    progress = session_manager.terse_print if session_manager else print
+
+    zip_codes = find_session_zip_codes(session_path)
+    progress(f"Processing {len(zip_codes)} unique zip codes...")
+
+    ready_zips = []
+    for zip_code in zip_codes:
+        if not ((session_path / f"beascout_{zip_code}.html").exists()
+                and (session_path / f"joinexploring_{zip_code}.html").exists()):
+            print(f"⚠️  {zip_code} missing HTML files")
+            continue
+        ready_zips.append(zip_code)
+
+    from src.pipeline.core.unit_identifier import UnitIdentifierNormalizer
 
-def process_scraped_session_with_terse_output(session_dir: str, session_manager: SessionManager, verbose: bool):
+    plan = plan_unit_reuse(session_path, ready_zips, previous_session) if reuse else None
+    extract_zips = [zip_code for zip_code in ready_zips if plan is None or plan[zip_code][1] is None]
+
+    session_units = {}
+    if workers <= 1 or len(extract_zips) <= 1:
+        cache_before = UnitIdentifierNormalizer.get_town_cache_stats()
+        for zip_code in ready_zips:
+            # Show zip code being processed (terse terminal output)
+            progress(f"Processing ZIP {zip_code}...")
+            if plan is None:
+                processed_units = extract_zip_units(session_path, zip_code, session_manager, save_json, backend)
+            elif plan[zip_code][1] is not None:
+                processed_units = reuse_cached_zip_units(zip_code, plan[zip_code][1])
+            else:
+                processed_units, debug_records = extract_zip_units_captured(session_path, zip_code, session_manager,
+                                                                            save_json, backend)
+                if processed_units is not None:
+                    save_cached_units(session_path, zip_code, plan[zip_code][0], processed_units, debug_records)
+            if processed_units is not None:
+                session_units[zip_code] = processed_units
+        cache_after = UnitIdentifierNormalizer.get_town_cache_stats()
+        print_town_cache_stats({key: cache_after[key] - cache_before[key] for key in ('hits', 'misses')})
+        UnitIdentifierNormalizer.flush_debug_logs()
+        return session_units
+
+    # Workers must share the parent's debug log timestamp; flush so forked workers inherit empty buffers
+    ensure_debug_timestamp()
+    UnitIdentifierNormalizer.flush_debug_logs()
+    session_type = session_manager.session_type if session_manager else 'pipeline'
+    print(f"Extracting with {workers} worker processes")
+
+    cache_stats = {'hits': 0, 'misses': 0}
+    tasks = [(str(session_path), zip_code, session_type, save_json, backend) for zip_code in extract_zips]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map() yields in submission order, so merged output follows sorted zip order
+        results = executor.map(_extract_zip_worker, tasks)
+        for zip_code in ready_zips:
+            progress(f"Processing ZIP {zip_code}...")
+            if plan is not None and plan[zip_code][1] is not None:
+                session_units[zip_code] = reuse_cached_zip_units(zip_code, plan[zip_code][1])
+                continue
+            processed_units, output, cache_delta, debug_records = next(results)
+            print(output, end='')
+            merge_worker_debug_logs(debug_records)
+            for key in cache_stats:
+                cache_stats[key] += cache_delta[key]
+            if processed_units is not None:
+                session_units[zip_code] = processed_units
+                if plan is not None:
+                    save_cached_units(session_path, zip_code, plan[zip_code][0], processed_units, debug_records)
+
+    # Summed per-zip counters (each worker process keeps its own cache)
+    print_town_cache_stats(cache_stats)
+    UnitIdentifierNormalizer.flush_debug_logs()
+    return session_units
+
+
+def process_scraped_session_with_terse_output(session_dir: str, session_manager: SessionManager, verbose: bool,
+                                              save_json: bool = False, workers: int = 1,
+                                              backend: str = DEFAULT_PARSER_BACKEND, reuse: bool = True,
+                                              previous_session: Optional[str] = None):
     """Process a scraped session with terse terminal output and full logging"""
 
     # In terse mode, show only zip code progress and final summary to terminal
@@ -148,54 +343,20 @@ def process_scraped_session_with_terse_output(session_dir: str, session_manager:
         session_manager.terse_print(f"❌ Session directory not found: {session_dir}")
         return
 
-    # Find all HTML files and determine zip codes to process
-    beascout_files = list(session_path.glob("beascout_*.html"))
-    joinexploring_files = list(session_path.glob("joinexploring_*.html"))
-
-    # Get unique zip codes from filenames
-    zip_codes = set()
-    for file in beascout_files:
-        zip_code = file.stem.replace('beascout_', '')
-        zip_codes.add(zip_code)
-
-    # Show initial progress
-    session_manager.terse_print(f"Processing {len(zip_codes)} unique zip codes...")
-
-    # Process each zip code with minimal terminal feedback
-    successful_files = []
-    for zip_code in sorted(zip_codes):
-        beascout_file = session_path / f"beascout_{zip_code}.html"
-        joinexploring_file = session_path / f"joinexploring_{zip_code}.html"
-
-        if beascout_file.exists() and joinexploring_file.exists():
-            # Show zip code being processed (terse terminal output)
-            session_manager.terse_print(f"Processing ZIP {zip_code}...")
-
-            # Do the actual processing (detailed output goes to log)
-            temp_json = extract_units_from_html(beascout_file, joinexploring_file, zip_code, session_manager)
-            if temp_json:
-                processed_json = process_with_current_pipeline(temp_json, zip_code, session_manager)
-                if processed_json:
-                    successful_files.append(processed_json)
-                    # Clean up temp file
-                    try:
-                        os.remove(temp_json)
-                    except:
-                        pass
+    # Extract and score every zip code in-process (detailed output goes to log)
+    session_units = extract_session_units(session_dir, session_manager, save_json, workers, backend,
+                                          reuse, previous_session)
 
     # Combine datasets (detailed output goes to log)
-    if successful_files:
-        combine_datasets(successful_files, session_dir, session_manager)
+    if session_units:
+        combine_datasets(list(session_units.values()), session_dir, session_manager)
 
     # Show final summary on terminal (matches the expected format from Pass 3 feedback)
-    session_manager.terse_print(f"📊 Successfully processed {len(successful_files)} zip codes")
+    session_manager.terse_print(f"📊 Successfully processed {len(session_units)} zip codes")
     session_manager.terse_print("Combining all scored datasets with deduplication...")
 
     # Determine which output file to read based on session type
-    if session_manager.session_type == 'regression':
-        output_file = "data/output/regression/raw/all_units_comprehensive_scored.json"
-    else:
-        output_file = "data/raw/all_units_comprehensive_scored.json"
+    output_file = f"{get_raw_output_dir(session_manager)}/all_units_comprehensive_scored.json"
 
     # Try to extract final summary information for terminal display
     try:
@@ -221,7 +382,9 @@ def process_scraped_session_with_terse_output(session_dir: str, session_manager:
         session_manager.terse_print("✅ Processing completed")
 
 
-def process_scraped_session(session_dir: str):
+def process_scraped_session(session_dir: str, save_json: bool = False, workers: int = 1,
+                            backend: str = DEFAULT_PARSER_BACKEND, reuse: bool = True,
+                            previous_session: Optional[str] = None):
     """Process a complete scraping session directory using current pipeline"""
     # Reset debug session to ensure single debug file per execution
     from src.pipeline.core.unit_identifier import UnitIdentifierNormalizer
@@ -233,87 +396,53 @@ def process_scraped_session(session_dir: str):
         print(f"Session directory not found: {session_dir}")
         return
 
-    # Find all HTML files
-    beascout_files = list(session_path.glob("beascout_*.html"))
-    joinexploring_files = list(session_path.glob("joinexploring_*.html"))
-
-    print(f"Found {len(beascout_files)} BeAScout files")
-    print(f"Found {len(joinexploring_files)} JoinExploring files")
-
-    # Get unique zip codes from filenames
-    zip_codes = set()
-    for file in beascout_files:
-        zip_code = file.stem.replace('beascout_', '')
-        zip_codes.add(zip_code)
+    print(f"Found {len(list(session_path.glob('beascout_*.html')))} BeAScout files")
+    print(f"Found {len(list(session_path.glob('joinexploring_*.html')))} JoinExploring files")
 
-    print(f"Processing {len(zip_codes)} unique zip codes...")
+    session_units = extract_session_units(session_dir, save_json=save_json, workers=workers, backend=backend,
+                                          reuse=reuse, previous_session=previous_session)
 
-    successful_files = []
+    print(f"\n📊 Successfully processed {len(session_units)} zip codes")
 
-    for zip_code in sorted(zip_codes):
-        beascout_file = session_path / f"beascout_{zip_code}.html"
-        joinexploring_file = session_path / f"joinexploring_{zip_code}.html"
-
-        if beascout_file.exists() and joinexploring_file.exists():
-            print(f"Processing ZIP {zip_code}...")
-
-            # Step 1: Extract units from HTML
-            temp_json = extract_units_from_html(beascout_file, joinexploring_file, zip_code)
-            if not temp_json:
-                print(f"❌ {zip_code} HTML extraction failed")
-                continue
-
-            # Step 2: Process through current pipeline (includes integrated quality scoring!)
-            processed_json = process_with_current_pipeline(temp_json, zip_code)
-            if not processed_json:
-                print(f"❌ {zip_code} pipeline processing failed")
-                continue
-
-            # Quality scoring is now integrated into HTML parsing - no separate step needed
-            successful_files.append(processed_json)
-            print(f"✅ {zip_code} completed successfully")
-
-            # Clean up temp file
-            try:
-                os.remove(temp_json)
-            except:
-                pass
-
-        else:
-            print(f"⚠️  {zip_code} missing HTML files")
-
-    print(f"\n📊 Successfully processed {len(successful_files)} zip codes")
-
-    # Combine all scored files
-    if successful_files:
-        combine_datasets(successful_files, session_dir)
+    # Combine all scored datasets
+    if session_units:
+        combine_datasets(list(session_units.values()), session_dir)
     else:
         print("❌ No data to combine")
 
-def combine_datasets(json_files: list, session_dir: str = None, session_manager: SessionManager = None):
-    """Combine all scored datasets with deduplication"""
+def load_dataset_units(dataset) -> List[Dict]:
+    """Return units for a dataset given either as in-memory unit list or a processed JSON path"""
+    if isinstance(dataset, list):
+        return dataset
+    with open(dataset, 'r') as f:
+        return json.load(f).get('units_with_scores', [])
+
+def combine_datasets(datasets: list, session_dir: str = None, session_manager: SessionManager = None):
+    """Combine all scored datasets with deduplication
+
+    Args:
+        datasets: Per-zip unit lists (in-process) or paths to *_processed.json files
+    """
     # These detailed messages go to log file only in terminal_terse mode
     print("Combining all scored datasets with deduplication...")
 
     unique_units = {}
     total_before = 0
 
-    for json_file in json_files:
+    for dataset in datasets:
         try:
-            with open(json_file, 'r') as f:
-                data = json.load(f)
-                units = data.get('units_with_scores', [])
-                total_before += len(units)
-
-                for unit in units:
-                    unit_key = unit.get('unit_key', f"unknown_{len(unique_units)}")
-                    if unit_key not in unique_units:
-                        unique_units[unit_key] = unit
-                    elif unit.get('completeness_score', 0) > unique_units[unit_key].get('completeness_score', 0):
-                        unique_units[unit_key] = unit
+            units = load_dataset_units(dataset)
+            total_before += len(units)
+
+            for unit in units:
+                unit_key = unit.get('unit_key', f"unknown_{len(unique_units)}")
+                if unit_key not in unique_units:
+                    unique_units[unit_key] = unit
+                elif unit.get('completeness_score', 0) > unique_units[unit_key].get('completeness_score', 0):
+                    unique_units[unit_key] = unit
 
         except Exception as e:
-            print(f"Warning: Could not process {json_file}: {e}")
+            print(f"Warning: Could not process {dataset if not isinstance(dataset, list) else 'dataset'}: {e}")
 
     combined_units = list(unique_units.values())
 
@@ -361,18 +490,14 @@ def combine_datasets(json_files: list, session_dir: str = None, session_manager:
         }
 
         # Determine output path based on session type
-        if session_manager and session_manager.session_type == 'regression':
-            output_file = "data/output/regression/raw/all_units_comprehensive_scored.json"
-            # Ensure regression output directory exists
-            import os
-            os.makedirs("data/output/regression/raw", exist_ok=True)
-        else:
-            output_file = "data/raw/all_units_comprehensive_scored.json"
+        output_dir = get_raw_output_dir(session_manager)
+        os.makedirs(output_dir, exist_ok=True)
+        output_file = f"{output_dir}/all_units_comprehensive_scored.json"
         with open(output_file, 'w') as f:
             json.dump(combined_data, f, indent=2)
 
         print(f"   Deduplicated from {total_before} to {len(combined_units)} unique units")
-        print(f"✅ Combined {len(json_files)} datasets into comprehensive file")
+        print(f"✅ Combined {len(datasets)} datasets into comprehensive file")
         print(f"   Total units: {len(combined_units)}")
         print(f"   Average score: {avg_score:.1f}%")
         print(f"   Saved to: {output_file}")
@@ -391,6 +516,18 @@ def main():
         description="Process scraped HTML files using current ScrapedDataParser pipeline"
     )
     parser.add_argument('session_directory', help='Directory containing scraped HTML files')
+    parser.add_argument('--save-intermediate-json', action='store_true',
+                        help='Also write per-zip all_units_<zip>.json and *_processed.json debug files')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of worker processes for per-zip extraction (default: 1, serial)')
+    parser.add_argument('--html-parser', choices=PARSER_BACKENDS, default=DEFAULT_PARSER_BACKEND,
+                        help='HTML parser backend; lxml/selectolax are optional faster installs '
+                             f'(default: {DEFAULT_PARSER_BACKEND})')
+    parser.add_argument('--no-reuse', action='store_true',
+                        help='Extract every zip even when its unit cards are unchanged since the previous session')
+    parser.add_argument('--previous-session',
+                        help='Session directory to reuse unchanged zips\' units from '
+                             '(default: from scrape_manifest.json, else the latest earlier session)')
 
     # Add session management arguments
     session_manager = SessionManager()
@@ -407,7 +544,10 @@ def main():
                         log_enabled=args.log, verbose=args.verbose, terminal_terse=True):
 
         # Process the scraped session with terse terminal output
-        process_scraped_session_with_terse_output(args.session_directory, session_manager, args.verbose)
+        process_scraped_session_with_terse_output(args.session_directory, session_manager, args.verbose,
+                                                  save_json=args.save_intermediate_json, workers=args.workers,
+                                                  backend=args.html_parser, reuse=not args.no_reuse,
+                                                  previous_session=args.previous_session)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Scrape Manifest and Incremental Re-scrape Support
+Each scraped session records a normalized content fingerprint of every zip's unit
+cards in scrape_manifest.json. Processing reuses the previous session's extracted
+units for zips whose fingerprint is unchanged (hardlinked, or a reference file when
+links are not possible) and only extracts and scores the zips that changed.
+"""
+
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.pipeline.processing.html_extractor import get_api_capture_path, iter_unit_card_fragments
+
+MANIFEST_FILENAME = 'scrape_manifest.json'
+UNITS_CACHE_DIRNAME = 'units'
+PAGE_SOURCES = ('beascout', 'joinexploring')
+
+# Unit cards are compared without comments and with whitespace collapsed
+HTML_COMMENT_PATTERN = re.compile(r'<!--.*?-->', re.DOTALL)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Extraction/scoring code and config: cached units are only reused when these are unchanged
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+PIPELINE_SOURCE_GLOBS = ('src/pipeline/core/*.py', 'src/pipeline/processing/*.py', 'data/config/location_exceptions.json')
+
+
+def normalize_fragment(fragment: str) -> str:
+    """Drop HTML comments and collapse whitespace"""
+    return WHITESPACE_PATTERN.sub(' ', HTML_COMMENT_PATTERN.sub('', fragment)).strip()
+
+
+def fingerprint_page(content: str, api_capture: Optional[dict] = None) -> str:
+    """
+    sha256 of a results page's unit cards (page chrome, scripts and nonces ignored)
+    A page without unit-card markup is hashed whole, so it never matches by accident;
+    a saved search API capture contributes its response bodies
+    """
+    digest = hashlib.sha256()
+    fragments = list(iter_unit_card_fragments(content)) or [content]
+    for fragment in fragments:
+        digest.update(normalize_fragment(fragment).encode('utf-8'))
+        digest.update(b'\n')
+    if api_capture:
+        bodies = [response.get('body') for response in api_capture.get('responses', [])]
+        digest.update(json.dumps(bodies, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def fingerprint_zip_pages(session_path: Path, zip_code: str) -> Dict[str, str]:
+    """Page fingerprints for a zip's saved beascout/joinexploring HTML (and API captures)"""
+    pages = {}
+    for source in PAGE_SOURCES:
+        html_file = Path(session_path) / f"{source}_{zip_code}.html"
+        with open(html_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        api_capture = None
+        api_file = get_api_capture_path(html_file)
+        if api_file.exists():
+            with open(api_file, 'r', encoding='utf-8') as f:
+                api_capture = json.load(f)
+        pages[source] = fingerprint_page(content, api_capture)
+    return pages
+
+
+def combine_fingerprints(pages: Dict[str, str]) -> str:
+    """One fingerprint for a zip from its page fingerprints"""
+    return hashlib.sha256(''.join(f"{source}:{pages[source]}\n" for source in PAGE_SOURCES).encode()).hexdigest()
+
+
+def load_manifest(session_path) -> Optional[dict]:
+    """Session manifest, or None if the session has none"""
+    manifest_file = Path(session_path) / MANIFEST_FILENAME
+    if not manifest_file.exists():
+        return None
+    with open(manifest_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_manifest(session_path, manifest: dict):
+    """Write the session manifest (atomically, so an interrupted scrape leaves the last good one)"""
+    manifest_file = Path(session_path) / MANIFEST_FILENAME
+    temp_file = manifest_file.with_suffix('.tmp')
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temp_file, manifest_file)
+
+
+def new_manifest(session_path, previous_session=None) -> dict:
+    return {
+        'session': Path(session_path).name,
+        'previous_session': str(previous_session) if previous_session else None,
+        'zips': {},
+    }
+
+
+def record_zip(manifest: dict, session_path, zip_code: str) -> dict:
+    """Fingerprint a zip's saved pages into the manifest; returns its entry (with 'unchanged' vs previous)"""
+    pages = fingerprint_zip_pages(session_path, zip_code)
+    entry = {'fingerprint': combine_fingerprints(pages), 'pages': pages, 'unchanged': False}
+    previous = load_manifest(manifest['previous_session']) if manifest.get('previous_session') else None
+    if previous:
+        previous_entry = previous.get('zips', {}).get(zip_code)
+        entry['unchanged'] = bool(previous_entry) and previous_entry['fingerprint'] == entry['fingerprint']
+    manifest['zips'][zip_code] = entry
+    return entry
+
+
+def find_previous_session(session_path) -> Optional[Path]:
+    """Most recent earlier sibling session (timestamped directory name) that has a manifest"""
+    session_path = Path(session_path)
+    earlier = [path for path in session_path.parent.iterdir()
+               if path.is_dir() and path.name < session_path.name and (path / MANIFEST_FILENAME).exists()]
+    return max(earlier, key=lambda path: path.name) if earlier else None
+
+
+@lru_cache(maxsize=1)
+def get_pipeline_fingerprint() -> str:
+    """sha256 of the extraction/scoring code and config (cached units from other code are not reused)"""
+    digest = hashlib.sha256()
+    for pattern in PIPELINE_SOURCE_GLOBS:
+        for path in sorted(PROJECT_ROOT.glob(pattern)):
+            digest.update(path.relative_to(PROJECT_ROOT).as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def get_units_cache_path(session_path, zip_code: str) -> Path:
+    return Path(session_path) / UNITS_CACHE_DIRNAME / f"{zip_code}.json"
+
+
+def save_cached_units(session_path, zip_code: str, fingerprint: str, units: List[Dict], debug_records: tuple):
+    """
+    Store a zip's processed units and debug log records for reuse by later sessions
+    (written to a temp file and replaced, so a units file hardlinked from the previous
+    session is never rewritten in place)
+    """
+    cache_file = get_units_cache_path(session_path, zip_code)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = cache_file.with_suffix('.tmp')
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            'zip_code': zip_code,
+            'fingerprint': fingerprint,
+            'pipeline': get_pipeline_fingerprint(),
+            'debug_records': [list(records) for records in debug_records],
+            'units': units,
+        }, f)
+    os.replace(temp_file, cache_file)
+
+
+def load_cached_units(session_path, zip_code: str, fingerprint: str) -> Optional[dict]:
+    """Cached entry for a zip if it matches the fingerprint and current pipeline code (follows references)"""
+    cache_file = get_units_cache_path(session_path, zip_code)
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if 'reference' in cached:
+            with open(cached['reference'], 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if cached.get('fingerprint') != fingerprint or cached.get('pipeline') != get_pipeline_fingerprint():
+        return None
+    return cached
+
+
+def link_cached_units(previous_session, session_path, zip_code: str):
+    """Hardlink the previous session's units file into this session, or write a reference to it"""
+    source = get_units_cache_path(previous_session, zip_code)
+    with open(source, 'r', encoding='utf-8') as f:
+        reference = json.load(f).get('reference')
+    if reference:
+        source = Path(reference)  # Never chain references
+    target = get_units_cache_path(session_path, zip_code)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.exists():
+        target.unlink()
+    try:
+        os.link(source, target)
+    except OSError:
+        with open(target, 'w', encoding='utf-8') as f:
+            json.dump({'reference': str(Path(source).resolve())}, f)
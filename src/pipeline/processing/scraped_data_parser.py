@@ -16,6 +16,8 @@ sys.path.append(str(Path(__file__).parent.parent.parent.parent))
 
 from src.pipeline.core.district_mapping import get_district_for_town
 from src.pipeline.core.unit_identifier import UnitIdentifierNormalizer
+from src.pipeline.core.town_matcher import get_town_matcher
+from src.pipeline.core.quality_scorer import get_quality_scorer
 
 class ScrapedDataParser:
     """
@@ -73,38 +75,45 @@ class ScrapedDataParser:
                 print(f"Unexpected JSON structure in {file_path}")
                 return []
             
-            print(f"Processing {len(units)} units from {file_path}")
-            
-            parsed_units = []
-            for unit in units:
-                self.parsing_stats['total_processed'] += 1
-                
-                # Check if unit is in HNE territory before processing
-                if self._is_non_hne_unit(unit):
-                    self.parsing_stats['excluded_non_hne'] += 1
-                    # Log discarded non-HNE unit
-                    UnitIdentifierNormalizer.log_discarded_unit( ## @claude, ahh there's pre-filtering to remove likely non-HNE towns before attempting to extract unit_town name from likely HNE towns.
-                        str(unit.get('unit_type', 'Unknown')),
-                        str(unit.get('unit_number', 'Unknown')), 
-                        str(unit.get('chartered_organization', 'Unknown')),
-                        str(unit.get('chartered_organization', 'Unknown')),
-                        'Non-HNE unit (outside council territory)'
-                    )
-                    continue
-                
-                parsed_unit = self.parse_unit_record(unit)
-                if parsed_unit:
-                    parsed_units.append(parsed_unit)
-                    self.parsing_stats['successfully_parsed'] += 1
-            
-            print(f"Successfully parsed {len(parsed_units)} units")
-            print(f"Excluded {self.parsing_stats['excluded_non_hne']} non-HNE units")
-            return parsed_units
+            return self.parse_units(units, file_path)
             
         except Exception as e:
             print(f"Error parsing {file_path}: {e}")
             return []
     
+    def parse_units(self, units: List[Dict[str, Any]], source_label: str = "extracted units") -> List[Dict[str, Any]]:
+        """Parse raw unit dicts from html_extractor directly (no JSON round-trip)"""
+        print(f"Processing {len(units)} units from {source_label}")
+        
+        parsed_units = []
+        for unit in units:
+            self.parsing_stats['total_processed'] += 1
+            
+            # Check if unit is in HNE territory before processing
+            if self._is_non_hne_unit(unit):
+                self.parsing_stats['excluded_non_hne'] += 1
+                # Log discarded non-HNE unit
+                UnitIdentifierNormalizer.log_discarded_unit( ## @claude, ahh there's pre-filtering to remove likely non-HNE towns before attempting to extract unit_town name from likely HNE towns.
+                    str(unit.get('unit_type', 'Unknown')),
+                    str(unit.get('unit_number', 'Unknown')), 
+                    str(unit.get('chartered_organization', 'Unknown')),
+                    str(unit.get('chartered_organization', 'Unknown')),
+                    'Non-HNE unit (outside council territory)'
+                )
+                continue
+            
+            parsed_unit = self.parse_unit_record(unit, score=False)
+            if parsed_unit:
+                parsed_units.append(parsed_unit)
+                self.parsing_stats['successfully_parsed'] += 1
+        
+        # Score all parsed units in one batch
+        get_quality_scorer().apply_scores(parsed_units)
+        
+        print(f"Successfully parsed {len(parsed_units)} units")
+        print(f"Excluded {self.parsing_stats['excluded_non_hne']} non-HNE units")
+        return parsed_units
+    
     def _is_non_hne_unit(self, unit: Dict[str, Any]) -> bool:
         """Check if unit is clearly outside HNE territory"""
         # Check chartered organization for specific non-HNE organizations
@@ -127,8 +136,8 @@ class ScrapedDataParser:
         
         return False
     
-    def parse_unit_record(self, unit: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Parse individual unit record with fixed town extraction"""
+    def parse_unit_record(self, unit: Dict[str, Any], score: bool = True) -> Optional[Dict[str, Any]]:
+        """Parse individual unit record with fixed town extraction (score=False leaves scoring to the caller)"""
         
         # Extract basic unit information
         unit_type = self._extract_unit_type(unit)
@@ -213,24 +222,8 @@ class ScrapedDataParser:
         record['meeting_location_source'] = unit.get('meeting_location_source', 'none')
         
         # Integrate quality scoring - calculate score, grade, and quality tags during parsing
-        try:
-            from src.pipeline.core.quality_scorer import UnitQualityScorer
-            scorer = UnitQualityScorer()
-            
-            # Score this individual unit
-            score, recommendations = scorer.score_unit(record)
-            
-            # Add scoring results to unit data for single source of truth
-            record['completeness_score'] = round(score, 1)
-            record['completeness_grade'] = scorer.get_letter_grade(score)
-            record['quality_tags'] = recommendations
-            
-        except Exception as e:
-            # Fallback if quality scoring fails - don't break unit parsing
-            print(f"Warning: Quality scoring failed for unit {record.get('unit_key', 'unknown')}: {e}")
-            record['completeness_score'] = 0.0
-            record['completeness_grade'] = 'F'
-            record['quality_tags'] = []
+        if score:
+            get_quality_scorer().apply_scores([record])
         
         return record
     
@@ -504,34 +497,21 @@ class ScrapedDataParser:
         """Parse town name from general text (name/description fields)"""
         text = text.strip().lower()
         
-        # First check for town aliases using centralized TOWN_ALIASES
-        from src.pipeline.core.district_mapping import TOWN_ALIASES
-        import re
+        # One pass of the shared town matcher over aliases and HNE towns
+        matcher = get_town_matcher()
+        matches = matcher.find_all(text, boundary='none')
         
-        # Check all alias patterns from centralized configuration
-        for alias, canonical_town in TOWN_ALIASES.items():
-            # Create regex pattern for the alias with word boundaries
-            alias_pattern = r'\b' + re.escape(alias.lower()) + r'\b'
-            if re.search(alias_pattern, text):
-                if self._validate_hne_town(canonical_town):
-                    return canonical_town
+        # First check for town aliases (word-bounded) from centralized TOWN_ALIASES
+        for match in matcher.ranked([m for m in matches if m.is_alias and m.word_bounded]):
+            if self._validate_hne_town(match.town):
+                return match.town
         
         # Look for HNE town names in the text, prioritizing:
         # 1. First occurrence in text (handles "Acton-Boxborough" → "Acton")
         # 2. Longer names when positions are equal (handles "East Brookfield" vs "Brookfield")
-        
-        matches = []
-        for town in self.hne_towns:
-            town_lower = town.lower()
-            position = text.find(town_lower)
-            if position != -1:
-                matches.append((position, len(town), town))
-        
-        if matches:
-            # Sort by position first (earliest), then by length descending (longest)
-            matches.sort(key=lambda x: (x[0], -x[1]))
-            best_match = matches[0][2]  # Get the town name
-            return UnitIdentifierNormalizer._normalize_town_name(best_match)
+        best_match = matcher.leftmost([m for m in matches if not m.is_alias])
+        if best_match:
+            return UnitIdentifierNormalizer._normalize_town_name(best_match.town)
         
         return None
     
@@ -566,19 +546,14 @@ class ScrapedDataParser:
             if self._validate_hne_town(normalized):
                 return normalized
         
-        # Pattern 2: Look for multi-word HNE town names first (more specific)
-        multi_word_towns = [town for town in self.hne_towns if ' ' in town]
-        multi_word_towns.sort(key=len, reverse=True)  # Longest first
-        
-        for town in multi_word_towns:
-            if town.lower() in org_name.lower():
-                return UnitIdentifierNormalizer._normalize_town_name(town)
-        
-        # Pattern 3: Look for single-word HNE town names
-        single_word_towns = [town for town in self.hne_towns if ' ' not in town]
-        for town in single_word_towns:
-            if town.lower() in org_name.lower():
-                return UnitIdentifierNormalizer._normalize_town_name(town)
+        # Pattern 2: Look for multi-word HNE town names first (more specific), longest first
+        # Pattern 3: Then single-word HNE town names (substring match)
+        matcher = get_town_matcher()
+        matches = matcher.ranked(matcher.find_all(org_name, boundary='none', include_aliases=False))
+        multi_word_matches = [m for m in matches if ' ' in m.town]
+        if matches:
+            best_match = (multi_word_matches or matches)[0]
+            return UnitIdentifierNormalizer._normalize_town_name(best_match.town)
         
         return None
     
@@ -17,7 +17,6 @@ Usage:
 """
 
 import argparse
-import pandas as pd
 import sys
 from pathlib import Path
 import tempfile
@@ -27,6 +26,11 @@ from typing import Dict, List, Tuple, Optional
 import json
 from datetime import datetime
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.pipeline.core.workbook_reader import read_workbook
+
 
 class ExcelComparer:
     """Excel file comparison tool for regression testing"""
@@ -69,14 +73,11 @@ class ExcelComparer:
         csv_data = {}
 
         try:
-            # Read all sheets from Excel file
-            excel_file = pd.ExcelFile(excel_path)
+            # Read all sheets from Excel file in one pass
+            sheets = read_workbook(excel_path, sheet_name=None)
 
-            for sheet_name in excel_file.sheet_names:
+            for sheet_name, df in sheets.items():
                 try:
-                    # Read sheet data
-                    df = pd.read_excel(excel_path, sheet_name=sheet_name)
-
                     # Convert to CSV string
                     csv_content = df.to_csv(index=False)
 
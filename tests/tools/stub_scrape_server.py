@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Local Stub Server for Scraper Testing
+
+Serves the reference scraped pages in tests/reference/units/scraped so the
+multi-zip scraper (including concurrent mode) can run without touching the
+live BeAScout / JoinExploring sites:
+
+    /beascout/list/?zip=01720       -> beascout_01720.html
+    /joinexploring/list/?zip=01720  -> joinexploring_01720.html
+
+Usage:
+    python tests/tools/stub_scrape_server.py [--port 8765] [--latency 0.5]
+    python src/pipeline/acquisition/multi_zip_scraper.py test --base-url http://127.0.0.1:8765 --concurrency 3
+"""
+
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+SCRAPED_DIR = Path(__file__).parent.parent / "reference" / "units" / "scraped"
+SOURCES = ('beascout', 'joinexploring')
+
+
+class StubScrapeServer:
+    """Threaded HTTP server for reference pages; usable as a context manager"""
+
+    def __init__(self, port: int = 0, latency: float = 0.0, pages_dir: Path = SCRAPED_DIR):
+        """
+        Args:
+            port: Port to bind on 127.0.0.1 (0 = pick a free port)
+            latency: Seconds to delay each response (simulated page load)
+            pages_dir: Directory with <source>_<zip>.html files
+        """
+        self.latency = latency
+        self.pages_dir = Path(pages_dir)
+        self.request_log = []
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                source = parsed.path.strip('/').split('/')[0]
+                zip_code = parse_qs(parsed.query).get('zip', [''])[0]
+                with server._lock:
+                    server.request_log.append((time.monotonic(), source, zip_code))
+
+                page = server.pages_dir / f"{source}_{zip_code}.html"
+                if source not in SOURCES or not zip_code.isdigit() or not page.exists():
+                    self.send_error(404, f"No reference page for {parsed.path}?zip={zip_code}")
+                    return
+
+                if server.latency:
+                    time.sleep(server.latency)
+                body = page.read_bytes()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Keep test output quiet
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve reference scraped pages for scraper testing")
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on (default: 8765)')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds to delay each response')
+    args = parser.parse_args()
+
+    server = StubScrapeServer(args.port, args.latency)
+    print(f"🧪 Serving {SCRAPED_DIR} at {server.base_url} (Ctrl+C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
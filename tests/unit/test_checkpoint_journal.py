@@ -0,0 +1,80 @@
+"""
+Tests for the scrape checkpoint journal.
+
+Valid inputs: Journals with ok / failed entries (one line cut short by a crash);
+an earlier session holding good pages
+Expected outputs: Replay keeps the latest entry per zip/site; pending sites cover
+missing and failed pages; failed pages fall back to the earlier session's copy
+"""
+import json
+import shutil
+from pathlib import Path
+
+from src.pipeline.acquisition.checkpoint_journal import (
+    JOURNAL_FILENAME, STATUS_CACHED, STATUS_FAILED, STATUS_OK, CheckpointJournal, find_cached_page,
+)
+from src.pipeline.processing.scrape_manifest import fingerprint_page
+
+SCRAPED_DIR = Path(__file__).parent.parent / "reference" / "units" / "scraped"
+
+
+class TestCheckpointJournal:
+    """Journal replay, resume planning and cached page fallback."""
+
+    def test_replay_and_pending(self, tmp_path):
+        """
+        Test replaying a journal after a crash.
+
+        Valid inputs: 01420 both sites ok; 01430 beascout ok, joinexploring failed; a torn last line
+        Expected outputs: 01420 done; 01430 pending joinexploring only (nothing with skip_failed);
+        01440 pending both sites; attempts, bytes and fingerprints recorded
+        """
+        session = tmp_path / "20260108_000000"
+        session.mkdir()
+        journal = CheckpointJournal(session)
+        for zip_code, site in (('01420', 'beascout'), ('01420', 'joinexploring'), ('01430', 'beascout')):
+            page = session / f"{site}_{zip_code}.html"
+            shutil.copy(SCRAPED_DIR / page.name, page)
+            journal.record(zip_code, site, STATUS_OK, page.read_text())
+        journal.record('01430', 'joinexploring', STATUS_FAILED, error="timeout")
+        journal.record('01430', 'joinexploring', STATUS_FAILED, error="timeout")
+        with open(session / JOURNAL_FILENAME, 'a') as f:
+            f.write('{"zip_code": "01440", "si')
+
+        replayed = CheckpointJournal(session)
+        entry = replayed.entries[('01420', 'beascout')]
+        content = (session / "beascout_01420.html").read_text()
+        assert entry['bytes'] == len(content.encode()) and entry['fingerprint'] == fingerprint_page(content)
+        assert replayed.entries[('01430', 'joinexploring')]['attempt'] == 2
+        assert replayed.pending_zips(['01420', '01430', '01440']) == ['01430', '01440']
+        assert replayed.pending_sites('01430') == ['joinexploring']
+        assert replayed.pending_sites('01430', skip_failed=True) == []
+        assert replayed.pending_sites('01440', skip_failed=True) == ['beascout', 'joinexploring']
+        assert replayed.summary() == {STATUS_OK: 3, STATUS_FAILED: 1}
+
+    def test_fall_back_to_last_good_page(self, tmp_path):
+        """
+        Test copying a failed page from earlier sessions.
+
+        Valid inputs: Oldest session with the page (no journal); newer session whose copy is journaled failed
+        Expected outputs: Oldest session's page copied in and journaled as cached; the cached
+        page is retried on resume
+        """
+        oldest = tmp_path / "20260101_000000"
+        oldest.mkdir()
+        shutil.copy(SCRAPED_DIR / "joinexploring_01430.html", oldest)
+        (tmp_path / "20260104_000000").mkdir()
+        newer = CheckpointJournal(tmp_path / "20260104_000000")
+        (newer.session_path / "joinexploring_01430.html").write_text("<html>partial</html>")
+        newer.record('01430', 'joinexploring', STATUS_FAILED, error="too small")
+
+        (tmp_path / "20260108_000000").mkdir()
+        journal = CheckpointJournal(tmp_path / "20260108_000000")
+        assert find_cached_page(journal.session_path, 'joinexploring', '01430') == oldest / "joinexploring_01430.html"
+        assert journal.fall_back('01430', 'joinexploring', error="timeout") == oldest / "joinexploring_01430.html"
+        assert (journal.session_path / "joinexploring_01430.html").read_bytes() == \
+            (SCRAPED_DIR / "joinexploring_01430.html").read_bytes()
+        entry = json.loads((journal.session_path / JOURNAL_FILENAME).read_text().splitlines()[-1])
+        assert entry['status'] == STATUS_CACHED and entry['source'].startswith(str(oldest))
+        assert 'joinexploring' in journal.pending_sites('01430')
+        assert journal.fall_back('01720', 'beascout') is None
@@ -0,0 +1,78 @@
+"""
+Tests for the zip coverage planner.
+
+Valid inputs: Small set cover instances; the bundled HNE zip code and town centroid tables
+Expected outputs: Minimal covers (smaller than greedy where greedy is suboptimal); every
+HNE town within reach of a planned query; towns without a centroid flagged
+"""
+import json
+
+from src.pipeline.acquisition.coverage_planner import (
+    CENTROIDS_FILE, SITE_RADII, ZIPCODES_FILE, greedy_set_cover, haversine_miles,
+    load_town_centroids, minimum_set_cover, plan_coverage,
+)
+
+
+class TestSetCover:
+    """Exact set cover search."""
+
+    def test_beats_greedy(self):
+        """
+        Test an instance where the greedy pick is a trap.
+
+        Valid inputs: Towns a-f; one query reaching a middle slice of 4, two reaching 3 each
+        Expected outputs: Greedy uses 3 queries; the exact search finds the 2-query cover
+        """
+        sets = {
+            '00001': frozenset('bcde'),
+            '00002': frozenset('abc'),
+            '00003': frozenset('def'),
+        }
+        universe = frozenset('abcdef')
+
+        assert len(greedy_set_cover(universe, sets)) == 3
+        assert minimum_set_cover(universe, sets) == (['00002', '00003'], True)
+
+
+class TestHneCoveragePlan:
+    """Plan over the bundled HNE tables."""
+
+    def test_every_town_reached(self):
+        """
+        Test the plan against the real site radii.
+
+        Valid inputs: Bundled tables, BeAScout 10 mi / JoinExploring 20 mi, 2 mi town margin
+        Expected outputs: No uncovered towns; each town within reach of a planned query on each
+        site; far fewer requests than scraping all zips on both sites
+        """
+        plan = plan_coverage()
+        centroids = load_town_centroids()
+        with open(ZIPCODES_FILE) as f:
+            town_zipcodes = json.load(f)['town_zipcodes']
+        zip_points = {z: centroids[town] for town, zips in reversed(list(town_zipcodes.items())) for z in zips}
+
+        assert plan['uncovered_towns'] == [] and plan['missing_centroids'] == []
+        for site, site_plan in plan['sites'].items():
+            assert site_plan['reach_miles'] == SITE_RADII[site] - 2.0
+            for town, centroid in centroids.items():
+                assert any(haversine_miles(zip_points[z], centroid) <= site_plan['reach_miles']
+                           for z in site_plan['query_zips']), (site, town)
+        assert plan['planned_requests'] < plan['current_requests'] / 4
+
+    def test_town_without_centroid_flagged(self, tmp_path):
+        """
+        Test reporting of a town the centroid table does not locate.
+
+        Valid inputs: Centroid table with Worcester removed
+        Expected outputs: Worcester listed as missing and uncovered on both sites
+        """
+        with open(CENTROIDS_FILE) as f:
+            table = json.load(f)
+        del table['towns']['Worcester']
+        centroids_file = tmp_path / "centroids.json"
+        centroids_file.write_text(json.dumps(table))
+
+        plan = plan_coverage(centroids_path=centroids_file)
+        assert plan['missing_centroids'] == ['Worcester']
+        assert plan['uncovered_towns'] == ['Worcester']
+        assert all(site_plan['uncovered_towns'] == ['Worcester'] for site_plan in plan['sites'].values())
@@ -0,0 +1,96 @@
+"""
+Tests for html_extractor's search API capture path.
+
+Valid inputs: Captures whose responses carry reference page HTML as rendered results;
+captures with unrecognized JSON (search echo, program names) or unparseable unit cards
+Expected outputs: Rendered results give the same units as the page; anything that does
+not parse into valid unit types and numbers falls back to the saved page HTML
+"""
+import contextlib
+import io
+import json
+import shutil
+from pathlib import Path
+
+from src.pipeline.processing.html_extractor import (
+    extract_units_from_api_capture,
+    get_api_capture_path,
+    iter_units_from_api_capture,
+    iter_units_from_html,
+    process_html_file,
+)
+
+SCRAPED_DIR = Path(__file__).parent.parent / "reference" / "units" / "scraped"
+HTML_FILES = sorted(SCRAPED_DIR.glob("beascout_*.html"))[:2]
+
+# Response JSON that mentions names but holds no unit records
+SEARCH_ECHO_BODY = {'success': True, 'data': {'search': {'zip': '01720', 'program': {'name': 'Cub Scouting'}},
+                                              'html': ''}}
+
+
+def html_units(content):
+    """Unit dicts from page HTML, quietly"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return list(iter_units_from_html(content, "Reference"))
+
+
+def quietly(func, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+
+class TestApiCaptureExtraction:
+    """Units built from captured search API responses."""
+
+    def test_rendered_html_payload(self):
+        """
+        Test a response whose data is the rendered result HTML.
+
+        Valid inputs: Reference page HTML as the response body's html field
+        Expected outputs: Same units as parsing the page
+        """
+        content = HTML_FILES[0].read_text()
+        capture = {'responses': [{'body': {'success': True, 'data': {'html': content}}}]}
+        assert quietly(list, iter_units_from_api_capture(capture, "Reference")) == html_units(content)
+        assert quietly(extract_units_from_api_capture, capture, "Reference") == html_units(content)
+
+    def test_unrecognized_content_is_rejected(self):
+        """
+        Test captures that must not replace the page.
+
+        Valid inputs: Search echo with program/name keys; rendered results with one unit name that
+        does not parse; JSON unit records without rendered result HTML
+        Expected outputs: None (caller falls back to the HTML) in every case
+        """
+        assert quietly(extract_units_from_api_capture, {'responses': [{'body': SEARCH_ECHO_BODY}]}) is None
+
+        content = HTML_FILES[0].read_text()
+        first_name = content.index('<h5>', content.index('class="unit-name"')) + len('<h5>')
+        mixed = content[:first_name] + 'Cub Scouting' + content[content.index('<br>', first_name):]
+        assert quietly(extract_units_from_api_capture, {'responses': [{'body': {'html': mixed}}]}) is None
+
+        record = {'responses': [{'body': [{'unitName': 'Pack 0001 Acton-The Church of The Good Shepherd'}]}]}
+        assert quietly(extract_units_from_api_capture, record) is None
+
+    def test_process_html_file_prefers_capture(self, tmp_path):
+        """
+        Test that a usable capture replaces the HTML parse, and an unusable one falls back.
+
+        Valid inputs: Copy of page A with a capture holding page B's rendered results, then the search echo
+        Expected outputs: Page B's units, scored; then page A's units from the HTML
+        """
+        html_file = tmp_path / HTML_FILES[0].name
+        shutil.copy(HTML_FILES[0], html_file)
+        api_file = get_api_capture_path(html_file)
+        assert api_file.name == html_file.stem + ".api.json"
+
+        other_content = HTML_FILES[1].read_text()
+        api_file.write_text(json.dumps({'responses': [{'body': {'success': True, 'data': other_content}}]}))
+        units = quietly(process_html_file, str(html_file), "Reference")
+        assert [u['primary_identifier'] for u in units] == [u['primary_identifier'] for u in html_units(other_content)]
+        assert 'completeness_score' in units[0]
+
+        api_file.write_text(json.dumps({'responses': [{'body': SEARCH_ECHO_BODY}]}))
+        units = quietly(process_html_file, str(html_file), "Reference")
+        assert [u['primary_identifier'] for u in units] == \
+            [u['primary_identifier'] for u in html_units(html_file.read_text())]
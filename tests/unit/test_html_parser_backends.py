@@ -0,0 +1,64 @@
+"""
+Parity tests for html_extractor parser backends.
+
+Valid inputs: Reference scraped HTML files in tests/reference/units/scraped
+Expected outputs: Every optional backend (lxml, selectolax) extracts unit dicts
+identical to the pure-Python html.parser default
+"""
+import contextlib
+import io
+from pathlib import Path
+
+import pytest
+
+from src.pipeline.processing.html_extractor import (
+    DEFAULT_PARSER_BACKEND,
+    get_available_parser_backends,
+    process_html_file,
+    resolve_parser_backend,
+)
+
+SCRAPED_DIR = Path(__file__).parent.parent / "reference" / "units" / "scraped"
+HTML_FILES = sorted(SCRAPED_DIR.glob("*.html"))
+OPTIONAL_BACKENDS = [b for b in get_available_parser_backends() if b != DEFAULT_PARSER_BACKEND]
+
+
+def extract_units(html_file, backend):
+    """Run process_html_file quietly and return its unit dicts"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return process_html_file(str(html_file), "Reference", backend)
+
+
+class TestParserBackendParity:
+    """Optional parser backends must produce the same units as html.parser."""
+
+    def test_unknown_backend_rejected(self):
+        """
+        Test that an unknown backend name is an error rather than a silent fallback.
+
+        Valid inputs: Backend name not in PARSER_BACKENDS
+        Expected outputs: ValueError
+        """
+        with pytest.raises(ValueError):
+            resolve_parser_backend("html5lib")
+
+    @pytest.mark.integration
+    @pytest.mark.slow
+    @pytest.mark.skipif(not OPTIONAL_BACKENDS, reason="No optional HTML parser backend installed")
+    def test_reference_files_identical_units(self):
+        """
+        Test unit extraction parity across all reference scraped files.
+
+        Valid inputs: All reference beascout_/joinexploring_ HTML files
+        Expected outputs: Identical unit dicts (all fields, same order) per backend
+        """
+        assert HTML_FILES, f"No reference HTML files found in {SCRAPED_DIR}"
+
+        mismatches = []
+        for html_file in HTML_FILES:
+            expected = extract_units(html_file, DEFAULT_PARSER_BACKEND)
+            for backend in OPTIONAL_BACKENDS:
+                if extract_units(html_file, backend) != expected:
+                    mismatches.append(f"{backend}: {html_file.name}")
+
+        assert not mismatches, f"Backend output differs from {DEFAULT_PARSER_BACKEND}: {mismatches}"
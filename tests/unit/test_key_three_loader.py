@@ -0,0 +1,54 @@
+"""
+Tests for the shared Key Three spreadsheet loader.
+
+Valid inputs: Anonymized reference Key Three spreadsheet; raw frames with padded text,
+missing cells, float and date columns and an absent column
+Expected outputs: Member records identical to the reference JSON conversion; cells
+cleaned as str(cell).strip() with 'nan'/'None'/'NaT'/'' mapped to ''
+"""
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from src.pipeline.core.key_three_loader import KEY_THREE_COLUMNS, clean_key_three_frame, load_key_three_members
+
+KEY_THREE_DIR = Path(__file__).parent.parent / "reference" / "key_three"
+
+
+class TestKeyThreeLoader:
+    """Column-wise Key Three cleaning."""
+
+    def test_matches_reference_conversion(self):
+        """
+        Test loading the anonymized spreadsheet.
+
+        Valid inputs: anonymized_key_three.xlsx
+        Expected outputs: Same member records, in order, as anonymized_key_three.json
+        """
+        with open(KEY_THREE_DIR / "anonymized_key_three.json") as f:
+            expected = json.load(f)['key_three_members']
+
+        assert load_key_three_members(KEY_THREE_DIR / "anonymized_key_three.xlsx") == expected
+
+    def test_cell_cleaning(self):
+        """
+        Test cleaning of awkward cells.
+
+        Valid inputs: Padded text, None/NaN/NaT cells, literal 'None', float zip codes, a date column;
+        no yptstatus column
+        Expected outputs: Stripped text, '' for missing, str() of numbers and timestamps, '' for the absent column
+        """
+        raw = pd.DataFrame({
+            'districtname': ['  Quinapoxet 02 ', None],
+            'zip': [1720.0, float('nan')],
+            'email': [pd.NaT, 'None'],
+            'phone': pd.to_datetime(['2025-08-22', None]),
+        })
+
+        members = clean_key_three_frame(raw)
+        assert list(members.columns) == list(KEY_THREE_COLUMNS.values())
+        assert members[['district', 'zip', 'email', 'phone', 'ypt_status']].to_dict('records') == [
+            {'district': 'Quinapoxet 02', 'zip': '1720.0', 'email': '', 'phone': '2025-08-22 00:00:00', 'ypt_status': ''},
+            {'district': '', 'zip': '', 'email': '', 'phone': '', 'ypt_status': ''},
+        ]
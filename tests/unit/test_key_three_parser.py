@@ -0,0 +1,57 @@
+"""
+Tests for memoized unitcommorgname parsing.
+
+Valid inputs: Anonymized reference Key Three members (about three rows per unit); empty/NaN org names
+Expected outputs: Memoized parse identical to the uncached parser; one parse per unique org
+string; callers get independent copies
+"""
+from pathlib import Path
+
+from src.dev.parsing.key_three_parser import (
+    KeyThreeParser, get_unitcommorgname_parse_stats, parse_unitcommorgname, reset_unitcommorgname_parse_stats,
+)
+from src.pipeline.core.key_three_loader import load_key_three_members
+
+KEY_THREE_DIR = Path(__file__).parent.parent / "reference" / "key_three"
+
+
+class TestParseUnitcommorgname:
+    """Per-org cached parse and its run statistics."""
+
+    def test_matches_uncached_parser(self):
+        """
+        Test parsing every reference member's org name.
+
+        Valid inputs: anonymized_key_three.xlsx unit_org_name column
+        Expected outputs: Same unit info as KeyThreeParser.parse_unit_info; stats count one
+        unique org per distinct string
+        """
+        org_names = [m['unit_org_name'] for m in load_key_three_members(KEY_THREE_DIR / "anonymized_key_three.xlsx")]
+        parser = KeyThreeParser("")
+
+        reset_unitcommorgname_parse_stats()
+        for org_name in org_names:
+            assert parse_unitcommorgname(org_name) == parser.parse_unit_info(org_name)
+
+        stats = get_unitcommorgname_parse_stats()
+        assert stats['calls'] == len(org_names)
+        assert stats['unique_orgs'] == len(set(org_names))
+        assert stats['cache_hits'] == len(org_names) - len(set(org_names))
+        assert stats['unique_ratio'] == len(set(org_names)) / len(org_names)
+
+    def test_copies_and_missing_values(self):
+        """
+        Test cached results are not shared and missing org names bypass the cache.
+
+        Valid inputs: One org name parsed twice (first result modified); '', None, NaN
+        Expected outputs: Second parse unaffected; {} for missing values with no calls counted
+        """
+        reset_unitcommorgname_parse_stats()
+        first = parse_unitcommorgname("Troop 0001 (B) - Acton-The Church of The Good Shepherd")
+        assert first['unit_town'] == 'Acton' and first['unit_number'] == '0001'
+        first['unit_town'] = 'Boxborough'
+        assert parse_unitcommorgname("Troop 0001 (B) - Acton-The Church of The Good Shepherd")['unit_town'] == 'Acton'
+
+        for missing in ('', None, float('nan')):
+            assert parse_unitcommorgname(missing) == {}
+        assert get_unitcommorgname_parse_stats()['calls'] == 2
@@ -0,0 +1,68 @@
+"""
+Tests for the content-addressed Key Three snapshot store.
+
+Valid inputs: Anonymized reference Key Three spreadsheet and its JSON conversion; a
+temporary cache directory
+Expected outputs: Snapshot built once per file hash and reused after; registry and
+index equal to building from the member records; stale code fingerprints rebuilt
+"""
+import pickle
+from pathlib import Path
+
+from src.pipeline.analysis.key_three_snapshot import (
+    build_unit_index, build_unit_registry, get_snapshot_path, hash_file, load_key_three_snapshot,
+    read_key_three_members,
+)
+
+KEY_THREE_DIR = Path(__file__).parent.parent / "reference" / "key_three"
+
+
+class TestKeyThreeSnapshot:
+    """Snapshot build, reuse and invalidation."""
+
+    def test_build_then_reuse(self, tmp_path, capsys):
+        """
+        Test loading the same spreadsheet twice.
+
+        Valid inputs: anonymized_key_three.xlsx with an empty cache directory
+        Expected outputs: First load builds and stores <sha256>/snapshot.pkl; second load reuses it
+        with identical members, registry and index, and reports the stored parse stats; JSON
+        conversion gives the same registry
+        """
+        excel_file = KEY_THREE_DIR / "anonymized_key_three.xlsx"
+        built = load_key_three_snapshot(excel_file, cache_dir=tmp_path)
+        assert not built['cached']
+        assert get_snapshot_path(hash_file(excel_file), tmp_path).exists()
+
+        assert built['parse_stats']['calls'] == 2 * len(built['members'])
+        capsys.readouterr()
+
+        reused = load_key_three_snapshot(excel_file, cache_dir=tmp_path)
+        assert reused['cached']
+        for field in ('members', 'registry', 'index', 'parse_stats'):
+            assert reused[field] == built[field]
+        assert f"{built['parse_stats']['unique_orgs']} unique orgs" in capsys.readouterr().out
+
+        members = read_key_three_members(KEY_THREE_DIR / "anonymized_key_three.json")
+        assert members == built['members']
+        assert build_unit_registry(members) == built['registry']
+        assert build_unit_index(members) == built['index']
+        assert len(built['registry']) == 169
+        assert all(unit['key_three_members'] for unit in built['registry'].values())
+
+    def test_stale_code_rebuilds(self, tmp_path):
+        """
+        Test a snapshot written by different parsing code.
+
+        Valid inputs: Stored snapshot whose code fingerprint no longer matches
+        Expected outputs: Snapshot rebuilt (not reused) and overwritten with the current fingerprint
+        """
+        json_file = KEY_THREE_DIR / "anonymized_key_three.json"
+        snapshot = load_key_three_snapshot(json_file, cache_dir=tmp_path)
+        snapshot_path = get_snapshot_path(snapshot['source_sha256'], tmp_path)
+        with open(snapshot_path, 'wb') as f:
+            pickle.dump(dict(snapshot, code='old', registry={}), f)
+
+        rebuilt = load_key_three_snapshot(json_file, cache_dir=tmp_path)
+        assert not rebuilt['cached'] and rebuilt['registry'] == snapshot['registry']
+        assert load_key_three_snapshot(json_file, cache_dir=tmp_path)['cached']
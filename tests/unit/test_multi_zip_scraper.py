@@ -0,0 +1,240 @@
+"""
+Tests for MultiZipScraper per-zip site fetching, results wait timings, the
+lightweight page profile, resuming from the checkpoint journal and adaptive pacing.
+
+Valid inputs: Fake BeAScout / JoinExploring scrapers with simulated page load time
+Expected outputs: Both sites saved per zip; with a sibling scraper both loads overlap;
+a restarted session scrapes only the pages that failed; unhealthy pages back off
+"""
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("playwright", reason="MultiZipScraper requires Playwright")
+
+from src.pipeline.acquisition.browser_scraper import BrowserScraper, should_block_request
+from src.pipeline.acquisition.multi_zip_scraper import RATE_DECISIONS_FILENAME, MultiZipScraper
+
+SCRAPED_DIR = Path(__file__).parent.parent / "reference" / "units" / "scraped"
+
+
+class FakeScraper:
+    """Stands in for BrowserScraper: returns a page after a simulated load"""
+
+    def __init__(self, load_seconds=0.2, failing=()):
+        self.load_seconds = load_seconds
+        self.failing = set(failing)  # (site, zip_code) pages that come back empty
+        self.scraped = []
+        self.loads = {}  # site -> (start, end) of its last simulated load
+
+    async def scrape(self, site, zip_code):
+        start = time.monotonic()
+        await asyncio.sleep(self.load_seconds)
+        self.loads[site] = (start, time.monotonic())
+        self.scraped.append((site, zip_code))
+        if (site, zip_code) in self.failing:
+            return None
+        return f"<html>{site} {zip_code}</html>"
+
+    async def scrape_beascout(self, zip_code):
+        return await self.scrape('beascout', zip_code)
+
+    async def scrape_joinexploring(self, zip_code):
+        return await self.scrape('joinexploring', zip_code)
+
+    def save_api_capture(self, site_type, zip_code, html_file):
+        return None  # No search API capture
+
+
+class TestParallelSites:
+    """process_single_zip with and without a JoinExploring sibling scraper."""
+
+    def test_sibling_fetches_sites_concurrently(self, tmp_path):
+        """
+        Test that both sites load at the same time when a sibling scraper is given.
+
+        Valid inputs: Zip 01720, 0.2s simulated page loads
+        Expected outputs: Both files written; each site's load starts before the other's finishes
+        """
+        scraper = MultiZipScraper()
+        scraper.session_dir = str(tmp_path)
+        beascout, joinexploring = FakeScraper(), FakeScraper()
+
+        success = asyncio.run(scraper.process_single_zip('01720', beascout, site_delay=False,
+                                                         joinexploring_scraper=joinexploring))
+
+        assert success
+        assert (tmp_path / "beascout_01720.html").read_text() == "<html>beascout 01720</html>"
+        assert (tmp_path / "joinexploring_01720.html").read_text() == "<html>joinexploring 01720</html>"
+        beascout_load, joinexploring_load = beascout.loads['beascout'], joinexploring.loads['joinexploring']
+        assert beascout_load[0] < joinexploring_load[1] and joinexploring_load[0] < beascout_load[1]
+
+    def test_serial_without_sibling(self, tmp_path):
+        """
+        Test the sequential path used when parallel sites is off.
+
+        Valid inputs: Zip 01720, 0.2s simulated page loads, no site delay
+        Expected outputs: Both files written; JoinExploring loads only after BeAScout finishes
+        """
+        scraper = MultiZipScraper()
+        scraper.session_dir = str(tmp_path)
+        fake = FakeScraper()
+
+        assert asyncio.run(scraper.process_single_zip('01720', fake, site_delay=False))
+        assert (tmp_path / "joinexploring_01720.html").exists()
+        assert fake.loads['beascout'][1] <= fake.loads['joinexploring'][0]
+
+
+class TestWaitTimings:
+    """Results wait timing summary."""
+
+    def test_summary_per_site(self):
+        """
+        Test aggregation of BrowserScraper results wait timings.
+
+        Valid inputs: Two BeAScout waits (one timed out) and one JoinExploring wait
+        Expected outputs: Count, mean, max and timeouts per site
+        """
+        scraper = MultiZipScraper()
+        scraper.wait_timings = [
+            {'site': 'beascout', 'network_idle_seconds': 1.0, 'total_seconds': 1.8, 'units': 12, 'timed_out': False},
+            {'site': 'beascout', 'network_idle_seconds': None, 'total_seconds': 45.2, 'units': None, 'timed_out': True},
+            {'site': 'joinexploring', 'network_idle_seconds': 0.9, 'total_seconds': 1.6, 'units': 0, 'timed_out': False},
+        ]
+
+        assert scraper.summarize_wait_timings() == {
+            'beascout': {'waits': 2, 'mean_seconds': 23.5, 'max_seconds': 45.2, 'timeouts': 1},
+            'joinexploring': {'waits': 1, 'mean_seconds': 1.6, 'max_seconds': 1.6, 'timeouts': 0},
+        }
+
+
+class TestLightweightProfile:
+    """Request blocking decisions and page load summary."""
+
+    def test_only_results_requests_kept(self):
+        """
+        Test which requests the lightweight profile lets through.
+
+        Valid inputs: Page document, unit finder script, search XHR, image, font, stylesheet, tracker script
+        Expected outputs: Document, first-party script and XHR kept; the rest blocked
+        """
+        base = 'https://beascout.scouting.org'
+        assert not should_block_request('document', f'{base}/list/?zip=01720')
+        assert not should_block_request('script', f'{base}/wp-content/themes/beascout/assets/js/unit-finder.min.js')
+        assert not should_block_request('xhr', f'{base}/wp-admin/admin-ajax.php')
+        assert should_block_request('image', f'{base}/wp-content/uploads/logo.png')
+        assert should_block_request('font', f'{base}/fonts/roboto.woff2')
+        assert should_block_request('stylesheet', f'{base}/style.css')
+        assert should_block_request('script', 'https://www.googletagmanager.com/gtag/js?id=G-1')
+        assert should_block_request('script', 'https://static.hotjar.com/c/hotjar-1.js')
+
+    def test_page_summary_per_site(self):
+        """
+        Test aggregation of BrowserScraper page load metrics.
+
+        Valid inputs: Two lightweight BeAScout page loads
+        Expected outputs: Page count, mean KB, mean load seconds and total blocked requests
+        """
+        scraper = MultiZipScraper()
+        scraper.page_metrics = [
+            {'site': 'beascout', 'zip_code': '01720', 'profile': 'lightweight', 'load_seconds': 2.0,
+             'requests': 20, 'bytes': 300 * 1024, 'blocked': 40},
+            {'site': 'beascout', 'zip_code': '01420', 'profile': 'lightweight', 'load_seconds': 3.0,
+             'requests': 22, 'bytes': 500 * 1024, 'blocked': 44},
+        ]
+
+        assert scraper.summarize_page_metrics() == {
+            'beascout': {'pages': 2, 'profile': 'lightweight', 'mean_kb': 400.0,
+                         'mean_load_seconds': 2.5, 'blocked_requests': 84},
+        }
+
+
+class TestSearchApiCapture:
+    """Results wait skipped only for a capture that parsed into units."""
+
+    def load_results(self, body):
+        """Run BrowserScraper.load_results with a faked capture; returns the results waits made"""
+        scraper = BrowserScraper(capture_api=True)
+        waits = []
+
+        async def goto_capturing_api(url, zip_code):
+            return [{'url': url, 'status': 200, 'body': body}]
+
+        async def wait_for_units_to_load(site_type, min_units=1):
+            waits.append(min_units)
+            return True
+
+        scraper.goto_capturing_api = goto_capturing_api
+        scraper.wait_for_units_to_load = wait_for_units_to_load
+        asyncio.run(scraper.load_results('beascout', '01720', 'https://example.test/'))
+        return waits
+
+    def test_wait_kept_unless_capture_has_units(self):
+        """
+        Test the wait decision at capture time.
+
+        Valid inputs: Search echo JSON with no rendered results; rendered results HTML of a reference page
+        Expected outputs: Echo still waits for the rendered results; the results HTML skips the wait
+        """
+        echo = {'success': True, 'data': {'search': {'zip': '01720', 'program': {'name': 'Cub Scouting'}}}}
+        assert self.load_results(echo) == [1]
+
+        page = (SCRAPED_DIR / "beascout_01720.html").read_text()
+        assert self.load_results({'success': True, 'data': {'html': page}}) == []
+
+
+class TestResume:
+    """Restarting a session from its checkpoint journal."""
+
+    def test_only_failed_pages_rescraped(self, tmp_path):
+        """
+        Test resuming after a failed JoinExploring page.
+
+        Valid inputs: Zips 01720 and 01420; first run's JoinExploring 01420 comes back empty
+        Expected outputs: First run fails 01420 only; a restarted scraper on the same session
+        has just 01420 pending and scrapes (and counts toward the session limit) only its JoinExploring page
+        """
+        scraper = MultiZipScraper()
+        scraper.session_dir = str(tmp_path)
+        first = FakeScraper(load_seconds=0, failing={('joinexploring', '01420')})
+        results = [asyncio.run(scraper.process_single_zip(zip_code, first, site_delay=False))
+                   for zip_code in ('01720', '01420')]
+        assert results == [True, False]
+        assert not (tmp_path / "joinexploring_01420.html").exists()
+
+        restarted = MultiZipScraper()
+        restarted.session_dir = str(tmp_path)
+        assert restarted.get_journal().pending_zips(['01720', '01420']) == ['01420']
+        second = FakeScraper(load_seconds=0)
+        assert asyncio.run(restarted.process_single_zip('01420', second, site_delay=False))
+        assert second.scraped == [('joinexploring', '01420')]
+        assert scraper.session_stats['requests_in_session'] == 4
+        assert restarted.session_stats['requests_in_session'] == 1
+        assert restarted.get_journal().pending_zips(['01720', '01420']) == []
+
+
+class TestAdaptivePacing:
+    """Page signals fed to the adaptive rate controller."""
+
+    def test_unhealthy_pages_back_off(self, tmp_path):
+        """
+        Test observations made while processing a zip with adaptive pacing on.
+
+        Valid inputs: Zip 01720; BeAScout page without unit cards, JoinExploring page missing
+        Expected outputs: One logged decrease per site (empty_result, failed); budgets halved
+        """
+        scraper = MultiZipScraper()
+        scraper.session_dir = str(tmp_path)
+        scraper.config['adaptive_rate'] = True
+        fake = FakeScraper(load_seconds=0, failing={('joinexploring', '01720')})
+
+        assert not asyncio.run(scraper.process_single_zip('01720', fake, site_delay=False))
+
+        logged = [json.loads(line) for line in (tmp_path / RATE_DECISIONS_FILENAME).read_text().splitlines()]
+        assert [(d['site'], d['reasons']) for d in logged] == [('beascout', ['empty_result']),
+                                                                ('joinexploring', ['failed'])]
+        assert scraper.get_rate_controller().get_summary()['requests_per_minute'] == {
+            'beascout.scouting.org': 1.5, 'joinexploring.org': 1.5}
@@ -0,0 +1,63 @@
+"""
+Tests for the learned overlap planner.
+
+Valid inputs: Two historical sessions built from overlapping sets of reference scraped pages
+Expected outputs: Per-site covers that capture every historically seen unit, a ranked
+schedule of every zip with the cover zips first, and cached per-session incidence
+"""
+import json
+import shutil
+from pathlib import Path
+
+from src.pipeline.acquisition.overlap_planner import (
+    INCIDENCE_FILENAME, build_incidence, find_sessions, load_fast_zips, plan_schedule, save_schedule,
+)
+
+SCRAPED_DIR = Path(__file__).parent.parent / "reference" / "units" / "scraped"
+ZIP_CODES = ('01420', '01430', '01440', '01452', '01453', '01462')
+
+
+def make_session(root, name, zip_codes):
+    session = root / name
+    session.mkdir()
+    for zip_code in zip_codes:
+        for source in ('beascout', 'joinexploring'):
+            shutil.copy(SCRAPED_DIR / f"{source}_{zip_code}.html", session)
+    return session
+
+
+class TestLearnedSchedule:
+    """Historical incidence, covers and fast-mode schedule."""
+
+    def test_cover_captures_all_units(self, tmp_path):
+        """
+        Test the schedule mined from two overlapping sessions.
+
+        Valid inputs: Session 1 with zips 1-4, session 2 with zips 3-6 (reference pages)
+        Expected outputs: Each site's cover zips together saw every unit any zip saw on that
+        site; fast zips ranked first in the schedule; incidence cached per session and reused
+        """
+        make_session(tmp_path, "20260101_000000", ZIP_CODES[:4])
+        make_session(tmp_path, "20260108_000000", ZIP_CODES[2:])
+        sessions = find_sessions(tmp_path)
+        assert [s.name for s in sessions] == ["20260101_000000", "20260108_000000"]
+
+        incidence = build_incidence(sessions)
+        assert sorted(incidence['beascout']) == list(ZIP_CODES)
+        assert all((session / INCIDENCE_FILENAME).exists() for session in sessions)
+        assert build_incidence(sessions) == incidence
+
+        schedule = plan_schedule(incidence)
+        for site, plan in schedule['sites'].items():
+            seen = set().union(*incidence[site].values())
+            assert set().union(*(incidence[site][z] for z in plan['cover_zips'])) == seen
+            assert plan['units'] == len(seen) and plan['optimal']
+        assert len(schedule['fast_zips']) < len(ZIP_CODES)
+        ranked = [entry['zip_code'] for entry in schedule['schedule']]
+        assert sorted(ranked) == list(ZIP_CODES)
+        assert ranked[:len(schedule['fast_zips'])] == schedule['fast_zips']
+
+        schedule_file = tmp_path / "zip_schedule.json"
+        save_schedule(schedule, schedule_file)
+        assert json.loads(schedule_file.read_text())['fast_zips'] == schedule['fast_zips']
+        assert load_fast_zips(schedule_file, allowed=schedule['fast_zips'][1:]) == schedule['fast_zips'][1:]
@@ -0,0 +1,122 @@
+"""
+Tests for UnitQualityScorer personal-email classification and batch scoring.
+
+Valid inputs: Contact emails with and without unit context (unit number, town); unit dicts
+Expected outputs: Personal/unit-specific decision and the rule stage that fired;
+batch scores, grades and tags identical to per-unit scoring
+"""
+import contextlib
+import io
+from pathlib import Path
+
+from src.pipeline.core.quality_scorer import UnitQualityScorer, classify_email
+from src.pipeline.processing.html_extractor import iter_units_from_html
+
+SCRAPED_DIR = Path(__file__).parent.parent / "reference" / "units" / "scraped"
+
+
+class TestEmailClassification:
+    """Ordered email rule stages."""
+
+    def test_stage_order_decides(self):
+        """
+        Test that the first matching stage decides the outcome.
+
+        Valid inputs: Unit role, first.last, unit-only and gmail-only addresses
+        Expected outputs: Role beats personal; first.last is personal; gmail fallback is personal
+        """
+        scorer = UnitQualityScorer()
+        cases = [
+            ("troop7.john.smith@gmail.com", False, 'unit_role'),
+            ("john.smith@yahoo.com", True, 'personal_identifier'),
+            ("westfordpack100@gmail.com", False, 'unit_role'),
+            ("ayerscouts@gmail.com", False, 'unit_only'),
+            ("qwertyuiopasdf@gmail.com", True, 'personal_domain'),
+            ("qwertyuiopasdf@scouting.org", False, 'default'),
+        ]
+        for email, is_personal, stage in cases:
+            result = scorer.classify_email(email)
+            assert (result.is_personal, result.stage) == (is_personal, stage), email
+
+    def test_unit_context_overrides_ambiguous_names(self):
+        """
+        Test unit number and town context checks before ambiguous personal patterns.
+
+        Valid inputs: "195jsmith@gmail.com" with and without unit number 0195; town in local part
+        Expected outputs: Unit-specific with context (rule reported), personal without
+        """
+        scorer = UnitQualityScorer()
+        assert scorer.is_personal_email("195jsmith@gmail.com")
+
+        with_number = scorer.classify_email("195jsmith@gmail.com", {'unit_number': '0195', 'unit_town': 'Acton'})
+        assert (with_number.is_personal, with_number.stage, with_number.rule) == (False, 'unit_number', '^195[a-z]')
+
+        with_town = scorer.classify_email("leominster@gmail.com", {'unit_number': '', 'unit_town': 'Leominster'})
+        assert (with_town.is_personal, with_town.stage) == (False, 'unit_town')
+
+    def test_results_memoized(self):
+        """
+        Test memoization per (email, unit_number, unit_town).
+
+        Valid inputs: Same classification requested twice
+        Expected outputs: Second call is a cache hit returning the same object
+        """
+        first = classify_email("memo.test@gmail.com", "0042", "Ayer")
+        hits = classify_email.cache_info().hits
+        assert classify_email("memo.test@gmail.com", "0042", "Ayer") is first
+        assert classify_email.cache_info().hits == hits + 1
+
+
+class TestBatchScoring:
+    """score_units() must match score_unit() exactly."""
+
+    def test_batch_matches_per_unit(self):
+        """
+        Test batch parity on reference units plus edge cases.
+
+        Valid inputs: Units from reference scraped pages, the same units as Crews,
+        empty/PO Box/non-string-field units
+        Expected outputs: Identical score, grade and recommendation order per unit
+        """
+        with contextlib.redirect_stdout(io.StringIO()):
+            units = [unit for html_file in sorted(SCRAPED_DIR.glob("*.html"))[:12]
+                     for unit in iter_units_from_html(html_file.read_text(), "Reference")]
+        assert units, f"No reference HTML files found in {SCRAPED_DIR}"
+
+        units += [dict(unit, unit_type='Crew') for unit in units[:40]]
+        units += [
+            {},
+            {'unit_type': 'Crew', 'specialty': '  '},
+            {'meeting_location': 'PO Box 5, Ayer', 'unit_address': ''},
+            {'meeting_location': 'PO Box 5, 12 Main St', 'website': 5, 'contact_email': 'jane.doe@gmail.com'},
+        ]
+
+        scorer = UnitQualityScorer()
+        batch = scorer.score_units(units)
+        for i, unit in enumerate(units):
+            score, recommendations = scorer.score_unit(unit)
+            assert (batch.scores[i], batch.grades[i], batch.recommendations[i]) == \
+                (score, scorer.get_letter_grade(score), recommendations), i
+
+    def test_apply_scores_small_and_large_lists(self):
+        """
+        Test in-place annotation on both the per-unit and batch paths.
+
+        Valid inputs: One unit alone and the same unit repeated 100 times
+        Expected outputs: Same completeness_score, completeness_grade and quality_tags
+        """
+        unit = {'unit_type': 'Troop', 'meeting_location': '12 Main St', 'unit_address': '12 Main St',
+                'meeting_day': 'Monday', 'contact_email': 'troop12@gmail.com'}
+        scorer = UnitQualityScorer()
+
+        single = [dict(unit)]
+        many = [dict(unit) for _ in range(100)]
+        scorer.apply_scores(single)
+        scorer.apply_scores(many)
+
+        expected = {'completeness_score': 75.0, 'completeness_grade': 'C',
+                    'quality_tags': ['REQUIRED_MISSING_TIME', 'RECOMMENDED_MISSING_CONTACT',
+                                     'RECOMMENDED_MISSING_PHONE', 'RECOMMENDED_MISSING_WEBSITE',
+                                     'RECOMMENDED_MISSING_DESCRIPTION']}
+        for scored in single + many:
+            assert {key: scored[key] for key in expected} == expected
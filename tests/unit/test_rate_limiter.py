@@ -0,0 +1,159 @@
+"""
+Tests for the concurrent scraping rate limiter, adaptive rate controller and local stub server.
+
+Valid inputs: Token bucket acquisitions with a fake clock; page health observations;
+concurrent fetches of reference pages from the stub server through a per-host limiter
+Expected outputs: Requests paced to the per-host budget (on the limiter's fake clock); budgets and concurrency rise
+additively and fall multiplicatively; stub pages identical to the reference files
+"""
+import asyncio
+import json
+import time
+import urllib.request
+
+from src.dev.scraping.url_generator import DualSourceURLGenerator
+from src.pipeline.acquisition.rate_limiter import AdaptiveRateController, HostRateLimiter, TokenBucket
+from tests.tools.stub_scrape_server import SCRAPED_DIR, StubScrapeServer
+
+
+class FakeClock:
+    """Deterministic clock whose sleep advances time"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestTokenBucket:
+    """Token bucket pacing."""
+
+    def test_burst_then_paced(self):
+        """
+        Test burst capacity followed by refill-rate pacing.
+
+        Valid inputs: 2 tokens/second, capacity 2, five acquisitions
+        Expected outputs: Two immediate, then one every 0.5s
+        """
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=2, clock=clock, sleep=clock.sleep)
+
+        async def run():
+            return [await bucket.acquire() for _ in range(5)]
+
+        assert asyncio.run(run()) == [0.0, 0.0, 0.5, 0.5, 0.5]
+        assert clock.now == 1.5
+
+    def test_hosts_have_separate_budgets(self):
+        """
+        Test that each host gets its own bucket from requests-per-minute config.
+
+        Valid inputs: 60/min for beascout, 30/min default; two requests to each host, alternating
+        Expected outputs: Second requests go out 1s (beascout) and 2s (joinexploring) after the first
+        """
+        clock = FakeClock()
+        limiter = HostRateLimiter({'beascout.scouting.org': 60}, default_per_minute=30,
+                                  clock=clock, sleep=clock.sleep)
+        generator = DualSourceURLGenerator()
+
+        async def run():
+            waits = []
+            for _ in range(2):
+                waits.append(await limiter.acquire(generator.generate_beascout_url('01720')))
+                waits.append(await limiter.acquire(generator.generate_joinexploring_url('01720')))
+            return waits
+
+        assert asyncio.run(run()) == [0.0, 0.0, 1.0, 1.0]
+        assert clock.now == 2.0
+        assert limiter.get_stats()['joinexploring.org']['requests'] == 2
+
+
+class TestAdaptiveRateController:
+    """AIMD budget and concurrency decisions."""
+
+    def test_increase_then_back_off(self, tmp_path):
+        """
+        Test healthy pages followed by throttling, slow and empty-result signals.
+
+        Valid inputs: 3/min start, max 4/min, up to 3 contexts; 4 healthy 2s pages, then a 429,
+        a 5s page, an empty result, and a page that needed a retry
+        Expected outputs: +0.5/min per healthy page capped at 4 and a second context after the
+        streak; each unhealthy page halves the budget (floor 1/min) with its reason logged
+        """
+        clock = FakeClock()
+        limiter = HostRateLimiter(default_per_minute=3, clock=clock, sleep=clock.sleep)
+        log_path = tmp_path / "rate_decisions.jsonl"
+        controller = AdaptiveRateController(limiter, max_concurrency=3, max_per_minute=4, log_path=log_path)
+        url = DualSourceURLGenerator().generate_beascout_url('01720')
+
+        rates = [controller.observe(url, latency_seconds=2.0, status=200)['requests_per_minute'][1]
+                 for _ in range(4)]
+        assert rates == [3.5, 4.0, 4.0, 4.0]
+        assert controller.concurrency == 2
+
+        decisions = [
+            controller.observe(url, latency_seconds=2.0, status=429, zip_code='01720'),
+            controller.observe(url, latency_seconds=5.0, status=200),
+            controller.observe(url, latency_seconds=2.0, status=200, empty=True),
+            controller.observe(url, latency_seconds=2.0, status=200, retries=1),
+        ]
+        assert [d['reasons'] for d in decisions] == [['http_429'], ['slow_5.0s'], ['empty_result'], ['retries_1']]
+        assert [d['requests_per_minute'][1] for d in decisions] == [2.0, 1.0, 1.0, 1.0]
+        assert controller.concurrency == 1
+        assert limiter.get_rate('beascout.scouting.org') == 1.0
+
+        logged = [json.loads(line) for line in log_path.read_text().splitlines()]
+        assert len(logged) == 8 and logged[4]['zip_code'] == '01720' and logged[4]['action'] == 'decrease'
+        assert controller.get_summary() == {'decisions': 8, 'decreases': 4, 'concurrency': 1,
+                                            'requests_per_minute': {'beascout.scouting.org': 1.0}}
+
+
+class TestStubServerConcurrency:
+    """Concurrent fetches against the local stub server."""
+
+    def test_concurrent_fetch_respects_budget(self):
+        """
+        Test overlapping page loads under a shared per-host budget.
+
+        Valid inputs: 4 zips x 2 sources, 0.2s simulated latency, 960 requests/min (0.0625s spacing,
+        exact in binary so the fake clock lands on whole tokens)
+        Expected outputs: Pages match reference files; one request immediately, the rest paced
+        0.0625s apart on the limiter's clock; at least two page loads in flight at once
+        """
+        zip_codes = sorted(p.stem.split('_')[1] for p in SCRAPED_DIR.glob("beascout_*.html"))[:4]
+        assert zip_codes, f"No reference HTML files found in {SCRAPED_DIR}"
+
+        clock = FakeClock()
+        with StubScrapeServer(latency=0.2) as server:
+            generator = DualSourceURLGenerator.for_base_url(server.base_url)
+            limiter = HostRateLimiter(default_per_minute=960, clock=clock, sleep=clock.sleep)
+            urls = [(f"{source}_{zip_code}.html", url)
+                    for zip_code in zip_codes
+                    for source, url in (('beascout', generator.generate_beascout_url(zip_code)),
+                                        ('joinexploring', generator.generate_joinexploring_url(zip_code)))]
+            waits, loads = [], []
+
+            async def fetch(url):
+                waits.append(await limiter.acquire(url))
+                start = time.monotonic()
+                body = await asyncio.to_thread(lambda: urllib.request.urlopen(url).read())
+                loads.append((start, time.monotonic()))
+                return body
+
+            async def run():
+                return await asyncio.gather(*(fetch(url) for _, url in urls))
+
+            bodies = asyncio.run(run())
+
+        for (filename, _), body in zip(urls, bodies):
+            assert body == (SCRAPED_DIR / filename).read_bytes()
+        assert waits == [0.0] + [0.0625] * (len(urls) - 1)
+        assert clock.now == (len(urls) - 1) * 0.0625
+        assert limiter.get_stats()['127.0.0.1']['requests'] == len(urls)
+
+        loads.sort()
+        assert any(later_start < end for (_, end), (later_start, _) in zip(loads, loads[1:]))
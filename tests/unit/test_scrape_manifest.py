@@ -0,0 +1,125 @@
+"""
+Tests for unit-card fingerprinting and incremental session processing.
+
+Valid inputs: Reference scraped pages, copies with page chrome or unit card edits,
+a previous and a current session directory with scrape manifests
+Expected outputs: Fingerprints change only with unit card content; unchanged zips reuse
+the previous session's units (hardlinked) with the same units and debug records as a full run
+"""
+import contextlib
+import io
+import os
+import shutil
+from pathlib import Path
+
+from src.pipeline.core.unit_identifier import UnitIdentifierNormalizer
+from src.pipeline.processing import scrape_manifest
+from src.pipeline.processing.process_full_dataset import extract_session_units
+from src.pipeline.processing.scrape_manifest import (
+    fingerprint_page, find_previous_session, get_units_cache_path, new_manifest, record_zip, save_manifest,
+)
+
+SCRAPED_DIR = Path(__file__).parent.parent / "reference" / "units" / "scraped"
+ZIP_CODES = ('01005', '01420', '01430')
+CHANGED_ZIPS = ('01005', '01430')
+
+
+def make_session(root, name, edit_zips=()):
+    """Session directory of reference pages (first unit card's contact edited for edit_zips) plus manifest"""
+    session = root / name
+    session.mkdir()
+    for zip_code in ZIP_CODES:
+        for source in ('beascout', 'joinexploring'):
+            shutil.copy(SCRAPED_DIR / f"{source}_{zip_code}.html", session)
+        if zip_code in edit_zips:
+            page = session / f"beascout_{zip_code}.html"
+            content = page.read_text()
+            card = content.index('unit-card-item')
+            page.write_text(content[:card] + content[card:].replace('Contact: </strong>', 'Contact: </strong>Dr. ', 1))
+    manifest = new_manifest(session, find_previous_session(session))
+    for zip_code in ZIP_CODES:
+        record_zip(manifest, session, zip_code)
+    save_manifest(session, manifest)
+    return session, manifest
+
+
+def run_session(session, **kwargs):
+    """extract_session_units quietly, returning (units per zip, captured debug records)"""
+    UnitIdentifierNormalizer.capture_debug_logs()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            units = extract_session_units(str(session), **kwargs)
+        return units, UnitIdentifierNormalizer.drain_debug_logs()
+    finally:
+        UnitIdentifierNormalizer.close_debug_logs()
+
+
+class TestFingerprint:
+    """Normalized unit card fingerprints."""
+
+    def test_only_unit_cards_count(self):
+        """
+        Test fingerprint stability and sensitivity.
+
+        Valid inputs: Reference page; same page with changed chrome/whitespace/comments; with a card edit
+        Expected outputs: Same fingerprint for the first two, different for the card edit
+        """
+        content = (SCRAPED_DIR / "beascout_01005.html").read_text()
+        card = content.index('unit-card-item')
+        chrome_changed = content.replace('"nonce":"8d6368fb39"', '"nonce":"0000000000"')
+        chrome_changed = chrome_changed[:card] + chrome_changed[card:].replace('      <div', '<!-- x -->\n<div', 3)
+        card_changed = content[:card] + content[card:].replace('1.2 miles', '1.3 miles', 1)
+
+        assert fingerprint_page(chrome_changed) == fingerprint_page(content)
+        assert fingerprint_page(card_changed) != fingerprint_page(content)
+
+
+class TestIncrementalProcessing:
+    """Reuse of the previous session's extracted units."""
+
+    def test_reuse_matches_full_extraction(self, tmp_path):
+        """
+        Test incremental processing against extracting everything.
+
+        Valid inputs: Previous session of 3 zips; current session with 2 zips' unit cards changed; 2 workers
+        Expected outputs: Manifest marks 1 zip unchanged; its units file is hardlinked from the previous
+        session; units and debug records identical to a --no-reuse run
+        """
+        previous, _ = make_session(tmp_path, "20260101_000000")
+        run_session(previous)
+
+        current, manifest = make_session(tmp_path, "20260108_000000", edit_zips=CHANGED_ZIPS)
+        assert manifest['previous_session'] == str(previous)
+        assert [z for z in ZIP_CODES if manifest['zips'][z]['unchanged']] == ['01420']
+
+        incremental = run_session(current, workers=2)
+        full = run_session(current, reuse=False)
+        assert sorted(incremental[0]) == list(ZIP_CODES) and all(incremental[1])
+        assert incremental == full
+
+        assert os.path.samefile(get_units_cache_path(previous, '01420'), get_units_cache_path(current, '01420'))
+        assert not os.path.samefile(get_units_cache_path(previous, '01005'), get_units_cache_path(current, '01005'))
+
+    def test_reprocessing_keeps_previous_session_cache(self, tmp_path, monkeypatch):
+        """
+        Test re-extracting a zip whose units file is hardlinked from the previous session.
+
+        Valid inputs: Unchanged zip reused from the previous session, then the session re-run
+        after a pipeline code change
+        Expected outputs: This session's units file is replaced; the previous session's file
+        keeps its content and is no longer linked
+        """
+        previous, _ = make_session(tmp_path, "20260101_000000")
+        run_session(previous)
+        current, _ = make_session(tmp_path, "20260108_000000", edit_zips=CHANGED_ZIPS)
+        run_session(current)
+        previous_units = get_units_cache_path(previous, '01420')
+        current_units = get_units_cache_path(current, '01420')
+        assert os.path.samefile(previous_units, current_units)
+
+        previous_content = previous_units.read_bytes()
+        monkeypatch.setattr(scrape_manifest, 'get_pipeline_fingerprint', lambda: 'changed')
+        run_session(current)
+        assert not os.path.samefile(previous_units, current_units)
+        assert previous_units.read_bytes() == previous_content and previous_units.stat().st_nlink == 1
+        assert b'"pipeline": "changed"' in current_units.read_bytes()
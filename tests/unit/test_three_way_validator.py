@@ -0,0 +1,122 @@
+"""
+Tests for the three-way validator's typed unit keys and hash join.
+
+Valid inputs: Unit parts as records carry them (unpadded numbers, lower-case types and
+town aliases, missing parts); Key Three members whose org names spell one unit two ways;
+small Key Three registries and scraped unit lists
+Expected outputs: Canonical UnitKeys that hash equal across sources; colliding Key Three
+units merged with all members; one result per unit, sorted by unit_key, with
+BOTH/KEY_THREE_ONLY/WEB_ONLY status
+"""
+import contextlib
+import io
+
+from src.pipeline.analysis.key_three_snapshot import build_unit_registry
+from src.pipeline.analysis.three_way_validator import (
+    ThreeWayValidator, ValidationStatus, index_scraped_units, join_units,
+)
+from src.pipeline.core.unit_identifier import UnitKey
+
+
+def scraped_unit(unit_type, unit_number, unit_town):
+    return {'unit_key': f"{unit_type} {unit_number} {unit_town}", 'unit_type': unit_type,
+            'unit_number': unit_number, 'unit_town': unit_town}
+
+
+class TestUnitKey:
+    """Building typed keys from unit parts."""
+
+    def test_from_parts(self):
+        """
+        Test canonicalizing key parts.
+
+        Valid inputs: Lower-case type, unpadded number, multi-word town; a town alias; missing parts
+        Expected outputs: Capitalized type, zero-padded number, canonical town, str() unit_key;
+        None when a part is missing
+        """
+        key = UnitKey.from_parts("crew", "204", " West Boylston ")
+        assert key == UnitKey('Crew', '0204', 'West Boylston')
+        assert str(key) == "Crew 0204 West Boylston"
+        assert UnitKey.from_parts("Pack", "0001", "acton") == UnitKey('Pack', '0001', 'Acton')
+        assert UnitKey.from_parts("Troop", "0001", "") is None
+        assert UnitKey.from_parts("", "0001", "Acton") is None
+
+
+class TestHashJoin:
+    """Single-pass join of Key Three and scraped units."""
+
+    def test_registry_merges_colliding_units(self):
+        """
+        Test Key Three org names that normalize to the same key.
+
+        Valid inputs: Two members of "Pack 1" and one of "Pack 0001" in Acton; one member
+        whose org name has no town
+        Expected outputs: One Pack 0001 Acton unit holding all three members; the member
+        without a town is reported as left out
+        """
+        members = [
+            {'unit_display': 'Pack 1', 'unit_org_name': 'Pack 1 (F) - Acton-The Church of The Good Shepherd',
+             'member_name': 'A'},
+            {'unit_display': 'Pack 1', 'unit_org_name': 'Pack 1 (F) - Acton-The Church of The Good Shepherd',
+             'member_name': 'B'},
+            {'unit_display': 'Pack 0001', 'unit_org_name': 'Pack 0001 (F) - Acton-The Church of The Good Shepherd',
+             'member_name': 'C'},
+            {'unit_display': 'Troop 0007', 'unit_org_name': 'Troop 0007', 'member_name': 'D'},
+        ]
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            registry = build_unit_registry(members)
+
+        assert list(registry) == [UnitKey('Pack', '0001', 'Acton')]
+        unit = registry[UnitKey('Pack', '0001', 'Acton')]
+        assert unit['unit_key'] == "Pack 0001 Acton"
+        assert [member['fullname'] for member in unit['key_three_members']] == ['A', 'B', 'C']
+        assert "merged into Pack 0001 Acton" in output.getvalue()
+        assert "1 member(s) without a unit type/number/town left out: 'Troop 0007'" in output.getvalue()
+
+    def test_join_statuses_and_order(self):
+        """
+        Test the outer join.
+
+        Valid inputs: Key Three Pack 0001 Acton and Troop 0007 Clinton; scraped Pack 1 Acton,
+        Crew 0204 West Boylston and a unit without a number
+        Expected outputs: Sorted rows - Crew web-only, Pack in both sources, Troop Key Three only;
+        the unit without a number is left out
+        """
+        key_three = {UnitKey('Pack', '0001', 'Acton'): {'district': 'Quinapoxet'},
+                     UnitKey('Troop', '0007', 'Clinton'): {'district': 'Soaring Eagle'}}
+        pack = scraped_unit('Pack', '1', 'Acton')
+        with contextlib.redirect_stdout(io.StringIO()):
+            scraped = index_scraped_units([pack, scraped_unit('Crew', '0204', 'West Boylston'),
+                                           scraped_unit('Pack', '', 'Acton')])
+
+        joined = join_units(key_three, scraped)
+        assert [(str(key), status) for key, status, _, _ in joined] == [
+            ("Crew 0204 West Boylston", ValidationStatus.WEB_ONLY),
+            ("Pack 0001 Acton", ValidationStatus.BOTH_SOURCES),
+            ("Troop 0007 Clinton", ValidationStatus.KEY_THREE_ONLY),
+        ]
+        assert joined[1][2] == {'district': 'Quinapoxet'} and joined[1][3] is pack
+        assert joined[0][2] is None and joined[2][3] is None
+
+    def test_validate_all_units(self, tmp_path, monkeypatch):
+        """
+        Test validation end to end from a prebuilt registry.
+
+        Valid inputs: Registry with one unit; scraped copy of it plus a web-only unit
+        Expected outputs: Two results with padded keys; debug log lists matches and scraped-only units
+        """
+        monkeypatch.chdir(tmp_path)
+        validator = ThreeWayValidator()
+        validator.key_three_registry = {
+            UnitKey('Pack', '0001', 'Acton'): {'unit_town': 'Acton', 'key_three_members': []}}
+        validator.scraped_units = [scraped_unit('Pack', '1', 'Acton'), scraped_unit('Troop', '12', 'Boxborough')]
+
+        results = validator.validate_all_units()
+        assert [(r.unit_key, r.status) for r in results] == [
+            ("Pack 0001 Acton", ValidationStatus.BOTH_SOURCES),
+            ("Troop 0012 Boxborough", ValidationStatus.WEB_ONLY),
+        ]
+        log = next((tmp_path / "data" / "debug").glob("cross_reference_validation_debug_*.log")).read_text()
+        assert "MATCHING UNITS (1):\n  Pack 0001 Acton\n" in log
+        assert "UNITS ONLY IN SCRAPED DATA (1):\n  Troop 0012 Boxborough\n" in log
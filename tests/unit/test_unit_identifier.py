@@ -0,0 +1,78 @@
+"""
+Tests for UnitIdentifierNormalizer town normalization and debug logging.
+
+Valid inputs: Town names, aliases and case variations
+Expected outputs: Canonical town names, served from the normalization cache on repeat
+"""
+from src.pipeline.core.debug_log_sink import DebugLogSink
+from src.pipeline.core.unit_identifier import UnitIdentifierNormalizer
+
+
+class TestTownNormalization:
+    """Cached town normalization behaviour."""
+
+    def test_aliases_and_case_variations(self):
+        """
+        Test alias resolution and title-casing.
+
+        Valid inputs: Exact alias, lower-case alias, padded plain town, empty string
+        Expected outputs: Canonical names; empty string unchanged
+        """
+        assert UnitIdentifierNormalizer._normalize_town_name("W Boylston") == "West Boylston"
+        assert UnitIdentifierNormalizer._normalize_town_name("n brookfield") == "North Brookfield"
+        assert UnitIdentifierNormalizer._normalize_town_name("  ACTON ") == "Acton"
+        assert UnitIdentifierNormalizer._normalize_town_name("") == ""
+
+    def test_repeat_lookups_hit_cache(self):
+        """
+        Test that repeated normalization is counted as cache hits.
+
+        Valid inputs: Same town normalized three times after clearing the cache
+        Expected outputs: 1 miss, 2 hits
+        """
+        UnitIdentifierNormalizer.clear_town_cache()
+        for _ in range(3):
+            UnitIdentifierNormalizer._normalize_town_name("North Grafton")
+
+        stats = UnitIdentifierNormalizer.get_town_cache_stats()
+        assert (stats['misses'], stats['hits']) == (1, 2)
+
+
+class TestDebugLogSink:
+    """Buffered session debug logs."""
+
+    def test_records_buffered_until_flush(self, tmp_path):
+        """
+        Test that records are batched in memory and written in order on flush.
+
+        Valid inputs: Two records into a file-backed sink with a large buffer
+        Expected outputs: No file before flush; both records, in order, after
+        """
+        log_path = tmp_path / "debug" / "unit.log"
+        sink = DebugLogSink(str(log_path), buffer_records=100)
+        sink.write("first\n")
+        sink.write_records(["second\n"])
+        assert not log_path.exists()
+
+        sink.close()
+        assert log_path.read_text() == "first\nsecond\n"
+
+    def test_capture_mode_drains_records(self):
+        """
+        Test worker-style capture of debug records.
+
+        Valid inputs: One kept and one discarded unit after capture_debug_logs()
+        Expected outputs: One record in each drained buffer, in the normalizer's format
+        """
+        UnitIdentifierNormalizer.capture_debug_logs()
+        try:
+            UnitIdentifierNormalizer.create_unit_record("Troop", "7", "Acton", "Acton Lions Club")
+            UnitIdentifierNormalizer.create_unit_record("Pack", "12", "", "Community Church")
+            unit_records, discarded_records = UnitIdentifierNormalizer.drain_debug_logs()
+        finally:
+            UnitIdentifierNormalizer.close_debug_logs()
+
+        assert unit_records == ["  unit_type: 'Troop',   unit_number: '0007',   unit_town: 'Acton', "
+                                "  chartered_org: 'Acton Lions Club'\n"]
+        assert len(discarded_records) == 1
+        assert "reason: 'Could not extract town'" in discarded_records[0]
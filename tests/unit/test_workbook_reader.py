@@ -0,0 +1,61 @@
+"""
+Tests for the shared xlsx reader.
+
+Valid inputs: Reference quality report workbook; anonymized Key Three spreadsheet
+Expected outputs: Cell values per sheet matching a full openpyxl load; frames
+identical across engines (calamine compared only when installed)
+"""
+from pathlib import Path
+
+import pytest
+from openpyxl import load_workbook
+
+from src.pipeline.core.key_three_loader import KEY_THREE_HEADER_ROW
+from src.pipeline.core.workbook_reader import (
+    CALAMINE_AVAILABLE, ENGINE_CALAMINE, ENGINE_OPENPYXL, read_workbook, read_workbook_values,
+)
+
+REFERENCE_DIR = Path(__file__).parent.parent / "reference"
+REPORT_FILE = REFERENCE_DIR / "reports" / "BeAScout_Quality_Report_anonymized.xlsx"
+KEY_THREE_FILE = REFERENCE_DIR / "key_three" / "anonymized_key_three.xlsx"
+
+
+class TestWorkbookReader:
+    """Engine selection and value parity."""
+
+    def test_values_match_openpyxl(self):
+        """
+        Test reading every sheet's cell values.
+
+        Valid inputs: Reference quality report (Executive Summary + district sheets)
+        Expected outputs: Same sheets in order and the same value at every cell as load_workbook
+        """
+        workbook = load_workbook(REPORT_FILE, data_only=True)
+        expected = {ws.title: [tuple(cell.value for cell in row) for row in ws.iter_rows()]
+                    for ws in workbook.worksheets}
+
+        assert read_workbook_values(REPORT_FILE) == expected
+
+    def test_read_all_sheets(self):
+        """
+        Test reading all sheets into frames in one call.
+
+        Valid inputs: Reference quality report with sheet_name=None
+        Expected outputs: One frame per sheet, Executive Summary first
+        """
+        sheets = read_workbook(REPORT_FILE, sheet_name=None)
+        assert list(sheets)[0] == "Executive Summary" and len(sheets) == 3
+
+    @pytest.mark.skipif(not CALAMINE_AVAILABLE, reason="python-calamine not installed")
+    def test_engines_agree(self):
+        """
+        Test calamine against openpyxl.
+
+        Valid inputs: Key Three spreadsheet (header row 9) and the quality report values
+        Expected outputs: Identical Key Three frames and report cell values from both engines
+        """
+        calamine = read_workbook(KEY_THREE_FILE, header=KEY_THREE_HEADER_ROW, engine=ENGINE_CALAMINE)
+        openpyxl = read_workbook(KEY_THREE_FILE, header=KEY_THREE_HEADER_ROW, engine=ENGINE_OPENPYXL)
+        assert calamine.astype(str).equals(openpyxl.astype(str))
+        assert read_workbook_values(REPORT_FILE, engine=ENGINE_CALAMINE) == \
+            read_workbook_values(REPORT_FILE, engine=ENGINE_OPENPYXL)